@@ -0,0 +1,64 @@
+# Autopilot soak test: headless games played by the search, with decision times against the per-tick budget.
+# Run from the project root: python -m benchmarks.autopilot
+import argparse
+import time
+from src.sim.autopilot import Autopilot
+from src.sim.policies import make_gap_follower_policy
+from src.sim.simulation import Simulation
+from src.utils.constants import AUTOPILOT_BUDGET_SECONDS, AUTOPILOT_HORIZON_TICKS
+from src.utils.profiler import percentile
+
+def play_autopilot(seed, max_frames, budget, horizon):
+    # One game; returns (score, frames, death cause, seconds per decision, autopilot)
+    sim = Simulation(seed=seed)
+    sim.start()
+    autopilot = Autopilot(sim, budget=budget, horizon=horizon)
+    decisions = []
+    while not sim.game_state.is_game_over and sim.tick < max_frames:
+        start = time.perf_counter()
+        action = autopilot.decide()
+        decisions.append(time.perf_counter() - start)
+        sim.step(action)
+    return sim.score, sim.tick, sim.death_cause, decisions, autopilot
+
+def play_gap_follower(seed, max_frames):
+    sim = Simulation(seed=seed)
+    sim.start()
+    policy = make_gap_follower_policy(seed)
+    state = sim.get_state()
+    while not state.is_game_over and sim.tick < max_frames:
+        state = sim.step(policy(state))
+    return state.score
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the search-based autopilot")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--max-frames", type=int, default=3000, help="frames per game at most (100 s of play)")
+    parser.add_argument("--budget-ms", type=float, default=AUTOPILOT_BUDGET_SECONDS * 1000, help="search time per tick")
+    parser.add_argument("--horizon", type=int, default=AUTOPILOT_HORIZON_TICKS, help="ticks a plan must survive")
+    args = parser.parse_args()
+
+    decisions = []
+    survived = 0
+    scores = []
+    states = memo_hits = fallbacks = 0
+    print(f"{'seed':>5} {'score':>6} {'frames':>7} {'death':>11} {'gap follower':>13}")
+    for seed in range(args.games):
+        score, frames, death_cause, times, autopilot = play_autopilot(seed, args.max_frames, args.budget_ms / 1000, args.horizon)
+        print(f"{seed:>5} {score:>6} {frames:>7} {death_cause or '-':>11} {play_gap_follower(seed, args.max_frames):>13}")
+        decisions += times
+        scores.append(score)
+        survived += death_cause is None
+        states += autopilot.states
+        memo_hits += autopilot.memo_hits
+        fallbacks += autopilot.fallbacks
+
+    decision_ms = sorted(seconds * 1000 for seconds in decisions)
+    print(f"{survived}/{args.games} games survived {args.max_frames} frames, mean score {sum(scores) / len(scores):.1f}")
+    print(f"decision time: mean {sum(decision_ms) / len(decision_ms):.3f} ms, p99 {percentile(decision_ms, 99):.3f} ms, "
+          f"max {decision_ms[-1]:.3f} ms (budget {args.budget_ms:g} ms)")
+    print(f"{states:,} states searched ({states / (sum(decisions) or 1):,.0f}/s), {memo_hits:,} memo hits, "
+          f"{fallbacks} decisions without a plan")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# Throughput of the vectorized batch simulation.
+# Run from the project root: python -m benchmarks.batch_env
+import argparse
+import time
+import numpy as np
+from src.sim.batch import BatchSimulation
+
+def run(n, steps, seed=0):
+    batch = BatchSimulation(n, seed=seed)
+    rng = np.random.default_rng(seed)
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        alive = batch.step(rng.random(n) < 0.08)
+        # Keep every lane busy by restarting finished games
+        if not alive.all():
+            batch.reset(~alive)
+    elapsed = time.perf_counter() - start
+    return steps / elapsed, n * steps / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BatchSimulation.step")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000, 100000])
+    parser.add_argument("--steps", type=int, default=None, help="batch steps per size (default scales with N)")
+    args = parser.parse_args()
+
+    print(f"{'N':>8} {'batch steps/s':>15} {'game steps/s':>15}")
+    for n in args.sizes:
+        steps = args.steps or max(50, min(20000, 2000000 // n))
+        batch_rate, game_rate = run(n, steps)
+        print(f"{n:>8} {batch_rate:>15,.0f} {game_rate:>15,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Rect versus pixel-mask collision: hit test cost, whole-game step cost and how often masks forgive a hit.
+# Run from the project root: python -m benchmarks.collision
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.components.hitmask import MaskCollider
+from src.sim.bird import BirdPhysics
+from src.sim.collision import RectCollider
+from src.sim.pipe import PipePhysics
+from src.sim.policies import make_gap_follower_policy
+from src.sim.simulation import Simulation
+from src.utils.assets import load_assets
+from src.utils.constants import BIRD_WIDTH, BIRD_HEIGHT, BIRD_MIN_TILT, BIRD_MAX_TILT, PIPE_WIDTH
+
+def hit_tests(collider, samples):
+    # Time hit() over birds scattered around one pipe's gap edges; returns (microseconds per test, hits)
+    start = time.perf_counter()
+    hits = 0
+    for bird, pipe in samples:
+        upper, lower = pipe.get_bounds()
+        if collider.hit(bird, upper, True) is not None or collider.hit(bird, lower, False) is not None:
+            hits += 1
+    return (time.perf_counter() - start) / len(samples) * 1e6, hits
+
+def make_samples(count, seed):
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        pipe = PipePhysics(rng.randint(-PIPE_WIDTH, 2 * BIRD_WIDTH), 300)
+        bird = BirdPhysics()
+        bird.y = rng.choice((300, 300 + 150 - BIRD_HEIGHT)) + rng.uniform(-15, 15)
+        bird.tilt = rng.uniform(BIRD_MIN_TILT, BIRD_MAX_TILT)
+        samples.append((bird, pipe))
+    return samples
+
+def play(collider, games, max_frames):
+    # Gap follower games; returns (frames per second, mean score)
+    frames = 0
+    total_score = 0
+    start = time.perf_counter()
+    for seed in range(games):
+        sim = Simulation(seed=seed, collider=collider)
+        sim.start()
+        policy = make_gap_follower_policy(seed)
+        state = sim.get_state()
+        while not state.is_game_over and sim.tick < max_frames:
+            state = sim.step(policy(state))
+        frames += sim.tick
+        total_score += state.score
+    return frames / (time.perf_counter() - start), total_score / games
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rect and mask collision")
+    parser.add_argument("--samples", type=int, default=20000, help="hit tests per mode")
+    parser.add_argument("--games", type=int, default=200, help="headless games per mode")
+    parser.add_argument("--max-frames", type=int, default=5000)
+    args = parser.parse_args()
+
+    pygame.init()
+    colliders = [RectCollider(), MaskCollider(load_assets(["bird_atlas"])["bird_atlas"])]
+    samples = make_samples(args.samples, 0)
+
+    print(f"{'mode':>6} {'hit test us':>12} {'hits':>8} {'game frames/s':>14} {'mean score':>11}")
+    for collider in colliders:
+        hit_us, hits = hit_tests(collider, samples)
+        frames_per_second, mean_score = play(collider, args.games, args.max_frames)
+        print(f"{collider.name:>6} {hit_us:>12.2f} {hits:>8} {frames_per_second:>14,.0f} {mean_score:>11.2f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
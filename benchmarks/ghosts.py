@@ -0,0 +1,110 @@
+# Ghost racing: time to draw N ghost birds per frame with the batched GhostLayer against one Bird.draw per
+# ghost and a rotate + blit per ghost, plus the whole game frame with the layer, on the SDL dummy driver.
+# Run from the project root: python -m benchmarks.ghosts
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.components.bird import Bird
+from src.game.controller import GameController
+from src.game.ghosts import GhostLayer
+from src.sim.policies import make_gap_follower_policy
+from src.sim.replay import Recorder
+from src.sim.simulation import Simulation, START
+from src.utils.assets import load_assets
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, GHOST_ALPHA
+
+def record_runs(count, max_ticks):
+    # Gap follower runs with a different margin each, so the ghosts spread out
+    rng = random.Random(0)
+    replays = []
+    for seed in range(count):
+        sim = Simulation(seed=seed)
+        recorder = Recorder(seed)
+        policy = make_gap_follower_policy(margin=rng.randint(0, 40))
+        recorder.record(0, START)
+        state = sim.step(START)
+        while not state.is_game_over and sim.tick < max_ticks:
+            action = policy(state)
+            recorder.record(sim.tick, action)
+            state = sim.step(action)
+        replays.append(recorder.finish(sim.score, sim.tick))
+    return replays
+
+def time_frames(frames, draw):
+    start = time.perf_counter()
+    for tick in range(frames):
+        draw(tick)
+    return (time.perf_counter() - start) / frames * 1000
+
+def per_bird(window, layer, assets, count):
+    # One Bird component per ghost, drawn the way the live bird is (opaque: translucency would need a copy each)
+    birds = [Bird(assets["bird"], assets["bird_atlas"]) for _ in range(count)]
+
+    def draw(tick):
+        tick %= len(layer.y)
+        for i, bird in enumerate(birds):
+            if layer.lengths[i] > tick:
+                bird.y = float(layer.y[tick, i])
+                bird.tilt = float(layer.tilt[tick, i])
+                bird.draw(window)
+    return draw
+
+def rotate_each(window, layer, image, count):
+    # What drawing ghosts without an atlas costs: rotate, fade and blit every ghost every frame
+    def draw(tick):
+        tick %= len(layer.y)
+        for i in range(count):
+            if layer.lengths[i] > tick:
+                rotated = pygame.transform.rotate(image, float(layer.tilt[tick, i]))
+                rotated.set_alpha(GHOST_ALPHA)
+                window.blit(rotated, (50, int(layer.y[tick, i])))
+    return draw
+
+def game_frame(window, assets, layer, seed):
+    game = GameController(window, assets, seed=seed, ghosts=layer, max_fps=0)
+    policy = make_gap_follower_policy()
+    game.pending_action = START
+
+    def draw(tick):
+        if game.sim.game_state.is_game_over:
+            game.reset_game()
+        game.update()
+        game.pending_action = policy(game.sim.get_state())
+        game.renderer.present(game)
+    return draw
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark drawing many ghost birds")
+    parser.add_argument("--counts", type=int, nargs="+", default=[0, 10, 50, 100, 200, 500, 1000])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--max-ticks", type=int, default=1500, help="length of the recorded runs at most")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    assets = load_assets()
+    start = time.perf_counter()
+    replays = record_runs(max(args.counts), args.max_ticks)
+    print(f"Recorded {len(replays)} runs in {time.perf_counter() - start:.1f}s")
+
+    print(f"{'ghosts':>6} {'setup ms':>9} {'layer ms':>9} {'per-bird ms':>12} {'rotate ms':>10} {'frame ms':>9}")
+    for count in args.counts:
+        start = time.perf_counter()
+        layer = GhostLayer(assets["bird_atlas"], replays[:count])
+        setup_ms = (time.perf_counter() - start) * 1000
+        ticks = max(1, len(layer.y))
+        layer_ms = time_frames(args.frames, lambda tick: layer.draw(window, tick % ticks, 0.5))
+        bird_ms = time_frames(args.frames, per_bird(window, layer, assets, count)) if count else 0.0
+        rotate_ms = time_frames(args.frames, rotate_each(window, layer, assets["bird"], count)) if count else 0.0
+        frame_ms = time_frames(args.frames, game_frame(window, assets, layer if count else None, seed=1))
+        print(f"{count:>6} {setup_ms:>9.1f} {layer_ms:>9.3f} {bird_ms:>12.3f} {rotate_ms:>10.3f} {frame_ms:>9.3f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# ParticleManager update and draw cost at high particle counts, on the SDL dummy driver.
+# Run from the project root: python -m benchmarks.particles
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.components.particle import ParticleManager
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, PIPE_COLOR
+
+def fill(manager, count):
+    # Mix the game's three effects, spread over the window so most particles stay on screen
+    bursts = 0
+    while manager.live_count() < count:
+        x = (bursts * 97) % WINDOW_WIDTH
+        y = (bursts * 53) % (WINDOW_HEIGHT // 2)
+        manager.add_impact_particles(x, y, PIPE_COLOR, 30)
+        manager.add_feather_particles(x, y, 15)
+        manager.add_ground_dust(x, WINDOW_HEIGHT - 100, 25)
+        bursts += 1
+
+def run(count, frames):
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    manager = ParticleManager(capacity=count)
+    update_time = 0.0
+    draw_time = 0.0
+    live = 0
+    for _ in range(frames):
+        # Top up every frame so the benchmark measures a steady live count
+        fill(manager, count)
+        live += manager.live_count()
+
+        start = time.perf_counter()
+        manager.update()
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        manager.draw(window)
+        draw_time += time.perf_counter() - start
+    return live / frames, update_time / frames * 1000, draw_time / frames * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ParticleManager")
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"{'particles':>10} {'live':>8} {'update ms':>10} {'draw ms':>10}")
+    for count in args.counts:
+        live, update_ms, draw_ms = run(count, args.frames)
+        print(f"{count:>10} {live:>8.0f} {update_ms:>10.3f} {draw_ms:>10.3f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
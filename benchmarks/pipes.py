@@ -0,0 +1,62 @@
+# Pipe drawing: time per frame to draw the pipes on screen as flat pygame.draw.rect pairs running under the
+# ground (the old Pipe.draw), one blit per half from the prerendered sprites, and all halves in one
+# Surface.blits call, on the SDL dummy driver. Run from the project root: python -m benchmarks.pipes
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.components.pipe import Pipe, build_pipe_sprites, draw_pipes
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, PIPE_WIDTH, PIPE_GAP, PIPE_COLOR
+
+def make_pipes(count):
+    # Spread across the window with varied gaps, like play but with any number on screen
+    spacing = (WINDOW_WIDTH + PIPE_WIDTH) / count
+    return [Pipe(i * spacing - PIPE_WIDTH / 2, 50 + (i * 137) % 390) for i in range(count)]
+
+def flat_rects(window, pipes, sprites, offset_x):
+    for pipe in pipes:
+        x = pipe.x + offset_x
+        pygame.draw.rect(window, PIPE_COLOR, (x, 0, PIPE_WIDTH, pipe.gap_height))
+        pygame.draw.rect(window, PIPE_COLOR, (x, pipe.gap_height + PIPE_GAP, PIPE_WIDTH, WINDOW_HEIGHT))
+
+def blit_each(window, pipes, sprites, offset_x):
+    for pipe in pipes:
+        for surface, position, area in pipe.get_blits(sprites, offset_x):
+            window.blit(surface, position, area)
+
+METHODS = {
+    "rects": flat_rects,
+    "blit": blit_each,
+    "blits": draw_pipes,
+}
+
+def time_frames(window, pipes, sprites, frames, draw):
+    start = time.perf_counter()
+    for frame in range(frames):
+        draw(window, pipes, sprites, frame % 8)
+    return (time.perf_counter() - start) / frames * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark drawing pipes")
+    parser.add_argument("--counts", type=int, nargs="+", default=[3, 10, 30])
+    parser.add_argument("--frames", type=int, default=5000)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    start = time.perf_counter()
+    sprites = build_pipe_sprites()
+    print(f"Built pipe sprites in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    print(f"{'pipes':>5} " + " ".join(f"{name + ' us':>10}" for name in METHODS))
+    for count in args.counts:
+        pipes = make_pipes(count)
+        times = [time_frames(window, pipes, sprites, args.frames, draw) for draw in METHODS.values()]
+        print(f"{count:>5} " + " ".join(f"{value:>10.1f}" for value in times))
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
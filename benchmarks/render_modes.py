@@ -0,0 +1,65 @@
+# Redrawn pixels and frame time of the full and dirty-rect renderers on the menu,
+# during play and on the game over screen, on the SDL dummy driver.
+# Run from the project root: python -m benchmarks.render_modes
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.game.controller import GameController
+from src.game.renderer import RENDERERS
+from src.sim.simulation import JUMP
+from src.sim.policies import make_gap_follower_policy
+from src.utils.assets import load_assets
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+
+def measure(game, frames, choose_action=None, until=None):
+    # Present frames without the frame cap and return (pixels per frame, ms per frame)
+    renderer = game.renderer
+    start_frames, start_pixels = renderer.frames, renderer.pixels
+    start = time.perf_counter()
+    for _ in range(frames):
+        if until is not None and until():
+            break
+        if choose_action is not None:
+            game.pending_action = choose_action()
+        game.update()
+        renderer.present(game)
+    elapsed = time.perf_counter() - start
+    count = max(1, renderer.frames - start_frames)
+    return (renderer.pixels - start_pixels) / count, elapsed / count * 1000
+
+def run(window, assets, renderer_class, frames, seed):
+    game = GameController(window, assets, seed=seed, renderer_class=renderer_class)
+    results = {"menu": measure(game, frames)}
+
+    policy = make_gap_follower_policy(seed)
+    game.pending_action = JUMP
+    results["play"] = measure(
+        game, 100000,
+        choose_action=lambda: policy(game.sim.get_state()),
+        until=lambda: game.ui.show_death_screen
+    )
+    results["game over"] = measure(game, frames)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the full and dirty-rect renderers")
+    parser.add_argument("--frames", type=int, default=300, help="frames on each static screen")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    pygame.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    assets = load_assets()
+
+    print(f"{'renderer':>9} {'screen':>10} {'px/frame':>12} {'ms/frame':>9}")
+    for name, renderer_class in RENDERERS.items():
+        for screen, (pixels, ms) in run(window, assets, renderer_class, args.frames, args.seed).items():
+            print(f"{name:>9} {screen:>10} {pixels:>12,.0f} {ms:>9.3f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# Load generator for the match server: ramps up bot clients, each in its own room, and reports the server's
+# time per tick, rooms per core, input-to-tick latency and frame interval jitter at every step.
+# Starts a server on a free local port unless --connect is given. Run from the project root:
+# python -m benchmarks.server_load
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+from src.net.protocol import (Frame, Reset, Stats, RESTART, encode_hello, encode_input, encode_stats_request,
+                              decode_server_message, split_messages)
+from src.net.server import rooms_per_core
+from src.sim.simulation import JUMP, START
+from src.utils.constants import WINDOW_HEIGHT, TICK_SECONDS, DEATH_DELAY_TICKS, SERVER_PORT
+from src.utils.profiler import percentile
+
+RESTART_TICKS = DEATH_DELAY_TICKS + 10  # Bots restart a little after the game over screen appears
+FLAP_BELOW = WINDOW_HEIGHT // 2  # Bots flap when falling past this height; pipes still get them eventually
+
+class Bot:
+    # One client playing in its own room, recording latencies into shared lists
+    def __init__(self, latencies, intervals):
+        self.latencies = latencies  # Seconds from sending a jump to receiving the frame that applied it
+        self.intervals = intervals  # Seconds between consecutive frames
+        self.jump_sent = None
+        self.y = 0.0
+        self.velocity = 0.0
+        self.over_tick = None
+        self.last_frame = None
+        self.frames = 0
+
+    async def play(self, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        self.writer = writer
+        writer.write(encode_hello() + encode_input(START))
+        buffer = bytearray()
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    return
+                buffer += data
+                now = time.perf_counter()
+                for message_type, body in split_messages(buffer):
+                    self.handle(decode_server_message(message_type, body), now)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    def handle(self, message, now):
+        if isinstance(message, Reset):
+            self.over_tick = None
+            return
+        if not isinstance(message, Frame):
+            return
+        self.frames += 1
+        if self.last_frame is not None:
+            self.intervals.append(now - self.last_frame)
+        self.last_frame = now
+        if message.action == JUMP and self.jump_sent is not None:
+            self.latencies.append(now - self.jump_sent)
+            self.jump_sent = None
+        if message.bird is not None:
+            self.y, self.velocity, _ = message.bird
+
+        if message.over:
+            if self.over_tick is None:
+                self.over_tick = message.tick
+            elif message.tick - self.over_tick == RESTART_TICKS:
+                self.writer.write(encode_input(RESTART))
+        elif message.started and self.jump_sent is None and self.y > FLAP_BELOW and self.velocity > 0:
+            self.jump_sent = now
+            self.writer.write(encode_input(JUMP))
+
+async def request_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode_stats_request())
+    buffer = bytearray()
+    try:
+        while True:
+            buffer += await reader.read(256)
+            for message_type, body in split_messages(buffer):
+                message = decode_server_message(message_type, body)
+                if isinstance(message, Stats):
+                    return message
+    finally:
+        writer.close()
+
+def start_server():
+    # A server process on a free local port; returns (process, port)
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    process = subprocess.Popen([sys.executable, "server.py", "--port", str(port), "--report-seconds", "3600"],
+                               stdout=subprocess.DEVNULL)
+    deadline = time.time() + 10
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.5).close()
+            return process, port
+        except OSError:
+            if time.time() > deadline or process.poll() is not None:
+                process.kill()
+                raise SystemExit("the server did not start")
+            time.sleep(0.1)
+
+async def run(host, port, steps, seconds):
+    latencies = []
+    intervals = []
+    bots = []
+    tasks = []
+    print(f"{'rooms':>6} {'busy ms':>8} {'p99 ms':>7} {'late':>5} {'rooms/core':>11} "
+          f"{'input p50':>10} {'input p99':>10} {'jitter p99':>11} {'frames/s':>9}")
+    for rooms in steps:
+        while len(bots) < rooms:
+            bot = Bot(latencies, intervals)
+            bots.append(bot)
+            tasks.append(asyncio.create_task(bot.play(host, port)))
+            if len(bots) % 100 == 0:
+                await asyncio.sleep(0)  # Let the connections open in batches
+        await asyncio.sleep(1.0)  # Settle before measuring
+
+        await request_stats(host, port)  # Restarts the server's window
+        latencies.clear()
+        intervals.clear()
+        frames = sum(bot.frames for bot in bots)
+        await asyncio.sleep(seconds)
+        stats = await request_stats(host, port)
+        frames = sum(bot.frames for bot in bots) - frames
+
+        latency_ms = sorted(seconds * 1000 for seconds in latencies) or [0.0]
+        jitter_ms = sorted(abs(interval - TICK_SECONDS) * 1000 for interval in intervals) or [0.0]
+        print(f"{stats.rooms:>6} {stats.mean_busy * 1000:>8.2f} {stats.p99_busy * 1000:>7.2f} {stats.late_ticks:>5} "
+              f"{rooms_per_core(stats):>11,.0f} {percentile(latency_ms, 50):>8.1f}ms {percentile(latency_ms, 99):>8.1f}ms "
+              f"{percentile(jitter_ms, 99):>9.1f}ms {frames / seconds:>9,.0f}", flush=True)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the match server with bot clients")
+    parser.add_argument("--connect", metavar="HOST[:PORT]", help="server to test; by default one is started locally")
+    parser.add_argument("--rooms", type=int, nargs="+", default=[100, 250, 500, 1000, 2000], help="room counts to step through")
+    parser.add_argument("--seconds", type=float, default=5.0, help="measuring time per step")
+    args = parser.parse_args()
+
+    process = None
+    if args.connect:
+        host, _, port = args.connect.partition(":")
+        port = int(port) if port else SERVER_PORT
+    else:
+        process, port = start_server()
+        host = "127.0.0.1"
+    try:
+        asyncio.run(run(host, port, sorted(args.rooms), args.seconds))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    print("rooms/core: rooms one core could tick at the measured cost per room; bots share this machine's CPU")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Game snapshots: size in bytes (in memory and pickled) and save/restore throughput of GameController and
+# Simulation snapshots during play and during a death with its particle bursts, plus what the practice-mode
+# rewind history costs per tick and in total, on the SDL dummy driver.
+# Run from the project root: python -m benchmarks.snapshots
+import argparse
+import os
+import pickle
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from src.game.controller import GameController
+from src.sim.policies import make_gap_follower_policy
+from src.sim.rewind import SnapshotRing
+from src.utils.assets import load_assets
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, REWIND_HISTORY_TICKS
+
+def deep_size(value, seen=None):
+    # Bytes held by a snapshot, counting objects shared with other snapshots once
+    seen = seen if seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.ndarray):
+        return sys.getsizeof(value)  # Includes the data of arrays that own it
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(deep_size(item, seen) for item in value)
+    elif isinstance(value, dict):
+        size += sum(deep_size(key, seen) + deep_size(item, seen) for key, item in value.items())
+    return size
+
+def time_calls(count, call):
+    start = time.perf_counter()
+    for _ in range(count):
+        call()
+    return (time.perf_counter() - start) / count
+
+def play_until(game, policy, done):
+    # Fresh runs until done(game) holds after a tick
+    game.reset_game()
+    while not done(game):
+        if game.sim.game_state.is_game_over and game.particle_manager.live_count() == 0:
+            game.reset_game()
+        game.pending_action = policy(game.sim.get_state())
+        game.update()
+
+def report(name, save, restore, count):
+    snapshot = save()
+    save_s = time_calls(count, save)
+    restore_s = time_calls(count, lambda: restore(snapshot))
+    print(f"{name:<24} {deep_size(snapshot):>9,} {len(pickle.dumps(snapshot)):>9,} {save_s * 1e6:>8.2f} "
+          f"{1 / save_s:>11,.0f} {restore_s * 1e6:>8.2f} {1 / restore_s:>11,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark game snapshots and rewind history")
+    parser.add_argument("--count", type=int, default=20000, help="saves and restores timed per case")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    game = GameController(window, load_assets(), seed=1, max_fps=0, practice=True)
+    policy = make_gap_follower_policy()
+    sim = game.sim
+
+    print(f"{'state':<24} {'bytes':>9} {'pickled':>9} {'save us':>8} {'saves/s':>11} {'load us':>8} {'restores/s':>11}")
+    cases = {
+        "playing, score 5": lambda game: game.sim.score >= 5,
+        "falling, particles": lambda game: game.particle_manager.live_count() > 0,
+    }
+    for name, done in cases.items():
+        play_until(game, policy, done)
+        report(f"game: {name}", game.snapshot, game.restore, args.count)
+        report(f"sim: {name}", sim.snapshot, sim.restore, args.count)
+
+    # One snapshot per live tick goes into the history; restore sizes are shared state counted once
+    play_until(game, policy, lambda game: len(game.history) == REWIND_HISTORY_TICKS)
+    history = game.history
+    ring = SnapshotRing(REWIND_HISTORY_TICKS)
+    push_s = time_calls(args.count, lambda: ring.push(game.snapshot()))
+    seen = set()
+    total = sum(deep_size(history.slots[i], seen) for i in range(len(history)))
+    print(f"history: {len(history)} ticks in {total / 1024:,.0f} KiB ({total / len(history):,.0f} bytes/tick), "
+          f"snapshot + push {push_s * 1e6:.2f} us/tick ({push_s * 30 * 100:.3f}% of a tick's time at 30 ticks/s)")
+
+    start = time.perf_counter()
+    for _ in range(5):
+        game.rewind()
+    print(f"rewind: 5 presses to tick {game.sim.tick} in {(time.perf_counter() - start) * 1e6:.1f} us")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
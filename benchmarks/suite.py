@@ -0,0 +1,278 @@
+# Hot path benchmark suite on the SDL dummy driver, with a saved baseline to catch regressions.
+# Run from the project root:
+#   python -m benchmarks.suite                  # table, compared against benchmarks/baseline.json if present
+#   python -m benchmarks.suite --save-baseline  # record this machine's numbers as the baseline
+#   python -m benchmarks.suite --json out.json  # also write the results as JSON ("-" for stdout)
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keeps stdout to the JSON report with --json -
+
+import pygame
+from benchmarks.particles import fill
+from src.components.bird import Bird
+from src.components.particle import ParticleManager
+from src.components.pipe import Pipe, draw_pipes
+from src.game.controller import GameController
+from src.sim.policies import make_gap_follower_policy
+from src.sim.simulation import Simulation
+from src.utils.assets import AssetManager, load_assets
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, BIRD_MIN_TILT, BIRD_MAX_TILT
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TOLERANCE = 0.3  # Slowdown allowed before a result counts as a regression
+PARTICLE_COUNTS = (100, 1000, 10000)
+
+def best_of(repeats, run):
+    # Smallest time of several runs; run() returns seconds per operation
+    return min(run() for _ in range(repeats))
+
+def bench_bird_update(scale):
+    bird = Bird(pygame.Surface((1, 1)))
+    steps = 100000 * scale
+
+    def run():
+        bird.reset_position()
+        start = time.perf_counter()
+        for i in range(steps):
+            if i % 18 == 0:
+                bird.jump()
+            bird.update()
+        return (time.perf_counter() - start) / steps
+    return run
+
+def bench_pipes_collision(scale):
+    # Simulation.step with pipes on screen: scrolling, scoring, broad and narrow phase
+    sim = Simulation(seed=1)
+    steps = 20000 * scale
+
+    def run():
+        sim.reset(1)
+        sim.start()
+        policy = make_gap_follower_policy(1)
+        state = sim.get_state()
+        start = time.perf_counter()
+        for _ in range(steps):
+            state = sim.step(policy(state))
+            if state.is_game_over:
+                sim.reset(sim.seed + 1)
+                sim.start()
+        return (time.perf_counter() - start) / steps
+    return run
+
+def bench_controller_update(game, scale):
+    # GameController.update during play, including particles and event handling
+    frames = 2000 * scale
+
+    def run():
+        game.reset_game()
+        policy = make_gap_follower_policy(1)
+        elapsed = 0.0
+        for _ in range(frames):
+            if game.sim.game_state.is_game_over:
+                game.reset_game()
+            game.pending_action = policy(game.sim.get_state())
+            start = time.perf_counter()
+            game.update()
+            elapsed += time.perf_counter() - start
+        return elapsed / frames
+    return run
+
+def bench_particles(window, count, scale, phase):
+    manager = ParticleManager(capacity=count)
+    frames = 100 * scale
+
+    def run():
+        elapsed = 0.0
+        for _ in range(frames):
+            fill(manager, count)
+            start = time.perf_counter()
+            if phase == "update":
+                manager.update()
+            else:
+                manager.draw(window)
+            elapsed += time.perf_counter() - start
+        return elapsed / frames
+    return run
+
+def bench_bird_draw(window, assets, scale):
+    bird = Bird(assets["bird"], assets["bird_atlas"])
+    draws = 20000 * scale
+    tilts = [BIRD_MIN_TILT + (BIRD_MAX_TILT - BIRD_MIN_TILT) * i / 99 for i in range(100)]
+
+    def run():
+        start = time.perf_counter()
+        for i in range(draws):
+            bird.tilt = tilts[i % 100]
+            bird.draw(window)
+        return (time.perf_counter() - start) / draws
+    return run
+
+def bench_pipes_draw(window, assets, scale):
+    # Three pipes on screen, as in play
+    pipes = [Pipe(x, gap) for x, gap in ((100, 120), (340, 300), (580, 60))]
+    sprites = assets["pipe_sprites"]
+    draws = 20000 * scale
+
+    def run():
+        start = time.perf_counter()
+        for i in range(draws):
+            draw_pipes(window, pipes, sprites, i % 8)
+        return (time.perf_counter() - start) / draws
+    return run
+
+def bench_render(game, scale):
+    # A full GameController frame without the frame cap: draw_scene plus display.update
+    frames = 300 * scale
+
+    def run():
+        game.reset_game()
+        policy = make_gap_follower_policy(1)
+        elapsed = 0.0
+        for _ in range(frames):
+            if game.sim.game_state.is_game_over:
+                game.reset_game()
+            game.pending_action = policy(game.sim.get_state())
+            game.update()
+            start = time.perf_counter()
+            game.renderer.present(game)
+            elapsed += time.perf_counter() - start
+        return elapsed / frames
+    return run
+
+def bench_load_assets(warm, scale):
+    # Startup asset loading into an empty disk cache (cold) or a filled one (warm)
+    loads = 5 * scale
+
+    def run():
+        elapsed = 0.0
+        for _ in range(loads):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                if warm:
+                    AssetManager(cache_dir=cache_dir).preload()
+                start = time.perf_counter()
+                AssetManager(cache_dir=cache_dir).preload()
+                elapsed += time.perf_counter() - start
+        return elapsed / loads
+    return run
+
+def build_benchmarks(window, scale):
+    # name -> (unit, seconds per unit, run)
+    assets = load_assets()
+    game = GameController(window, assets, seed=1)
+    benchmarks = {
+        "bird_update": ("us", 1e-6, bench_bird_update(scale)),
+        "pipes_collision": ("us", 1e-6, bench_pipes_collision(scale)),
+        "controller_update": ("us", 1e-6, bench_controller_update(game, scale)),
+    }
+    for count in PARTICLE_COUNTS:
+        benchmarks[f"particles_update_{count}"] = ("ms", 1e-3, bench_particles(window, count, scale, "update"))
+        benchmarks[f"particles_draw_{count}"] = ("ms", 1e-3, bench_particles(window, count, scale, "draw"))
+    benchmarks["bird_draw"] = ("us", 1e-6, bench_bird_draw(window, assets, scale))
+    benchmarks["pipes_draw"] = ("us", 1e-6, bench_pipes_draw(window, assets, scale))
+    benchmarks["render_frame"] = ("ms", 1e-3, bench_render(game, scale))
+    benchmarks["load_assets_cold"] = ("ms", 1e-3, bench_load_assets(False, scale))
+    benchmarks["load_assets_warm"] = ("ms", 1e-3, bench_load_assets(True, scale))
+    return benchmarks
+
+def compare(results, baseline, tolerance):
+    # name -> message for each result slower than the baseline by more than tolerance
+    regressions = {}
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None or previous["unit"] != result["unit"]:
+            continue
+        if result["value"] > previous["value"] * (1 + tolerance):
+            regressions[name] = (
+                f"{name}: {result['value']:.3f} {result['unit']} vs baseline {previous['value']:.3f} "
+                f"{result['unit']} ({result['value'] / previous['value'] - 1:+.0%}, allowed {tolerance:+.0%})"
+            )
+    return regressions
+
+def measure(name, benchmark, repeats, results):
+    unit, seconds_per_unit, run = benchmark
+    value = best_of(repeats, run) / seconds_per_unit
+    previous = results.get(name)
+    if previous is None or value < previous["value"]:
+        results[name] = {"value": round(value, 4), "unit": unit}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths")
+    parser.add_argument("--only", nargs="+", metavar="PREFIX", help="run benchmarks whose names start with these")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per benchmark; the fastest counts")
+    parser.add_argument("--scale", type=int, default=1, help="multiply the work per run")
+    parser.add_argument("--json", metavar="PATH", help='write results as JSON to PATH ("-" for stdout)')
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to --baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown against the baseline (0.3 = 30%%)")
+    parser.add_argument("--confirm", type=int, default=2,
+                        help="re-measure apparent regressions this many times before failing")
+    args = parser.parse_args()
+
+    baseline = {}
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f).get("results", {})
+
+    pygame.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    benchmarks = build_benchmarks(window, max(1, args.scale))
+    if args.only:
+        benchmarks = {name: bench for name, bench in benchmarks.items() if name.startswith(tuple(args.only))}
+
+    results = {}
+    for name, benchmark in benchmarks.items():
+        measure(name, benchmark, args.repeats, results)
+
+    # A busy machine can make one pass look slow; only regressions that reproduce count
+    regressions = compare(results, baseline, args.tolerance)
+    for _ in range(args.confirm):
+        if not regressions:
+            break
+        for name in regressions:
+            measure(name, benchmarks[name], args.repeats, results)
+        regressions = compare(results, baseline, args.tolerance)
+    pygame.quit()
+
+    # With --json -, stdout holds only the JSON report and everything else goes to stderr
+    out = sys.stderr if args.json == "-" else sys.stdout
+    print(f"{'benchmark':<24} {'time':>12} {'baseline':>12} {'change':>8}", file=out)
+    for name, result in results.items():
+        previous = baseline.get(name)
+        line = f"{name:<24} {result['value']:>9.3f} {result['unit']}"
+        if previous is not None:
+            line += f" {previous['value']:>9.3f} {previous['unit']} {result['value'] / previous['value'] - 1:>+8.0%}"
+        print(line, file=out)
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}", file=out)
+    elif not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one", file=out)
+    elif regressions:
+        sys.exit("Performance regression against " + args.baseline + ":\n  " + "\n  ".join(regressions.values()))
+    else:
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})", file=out)
+
+if __name__ == "__main__":
+    main()
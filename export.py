@@ -0,0 +1,71 @@
+import argparse
+import functools
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No display needed; frames are read back from the window surface
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"  # Its banner would end up in raw frames piped to stdout
+
+import pygame
+from src.game.controller import GameController
+from src.game.export import FRAME_SINKS, export_run
+from src.sim.replay import load_replay
+from src.sim.simulation import START
+from src.sim.autopilot import Autopilot
+from src.sim.neuro import NeuralPilot, load_genome
+from src.utils.assets import load_assets
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, FPS
+
+# Headless export of a replay or an autopilot run to PNG frames, raw video, an animated GIF or a thumbnail strip
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a run without a display as fast as possible and save its frames")
+    parser.add_argument("output", help="directory for png, file for raw/gif/strip, - for raw to stdout")
+    parser.add_argument("--format", choices=sorted(FRAME_SINKS), default="png")
+    parser.add_argument("--replay", help="replay file to render; without it the autopilot plays a run")
+    parser.add_argument("--seed", type=int, default=None, help="pipe seed of the autopilot run")
+    parser.add_argument("--genome", metavar="CHECKPOINT", help="play the autopilot run with a train.py network")
+    parser.add_argument("--fps", type=int, default=FPS, help=f"frames per second of play (the game ticks {FPS} times a second)")
+    parser.add_argument("--every", type=int, default=1, help="write every Nth frame only")
+    parser.add_argument("--max-frames", type=int, default=9000, help="frames rendered at most")
+    args = parser.parse_args()
+    if args.fps < 1 or args.every < 1 or args.max_frames < 1:
+        parser.error("--fps, --every and --max-frames must be at least 1")
+    if args.seed is not None and args.seed < 0:
+        parser.error("--seed must not be negative")
+
+    pygame.display.init()
+    pygame.font.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    assets = load_assets()
+
+    replay = load_replay(args.replay) if args.replay else None
+    autopilot_factory = Autopilot
+    if args.genome:
+        genome, hidden = load_genome(args.genome)
+        autopilot_factory = functools.partial(NeuralPilot, genome=genome, hidden=hidden)
+    # max_fps=0 leaves the frame clock unthrottled
+    game = GameController(window, assets, seed=args.seed, replay=replay, max_fps=0, autopilot_factory=autopilot_factory)
+    if replay is None:
+        game.pending_action = START
+        game.autopilot_enabled = True
+
+    # Reports go to stderr so raw frames can be piped from stdout
+    try:
+        sink = FRAME_SINKS[args.format](args.output, window.get_size(), args.fps / args.every)
+    except RuntimeError as e:
+        parser.error(str(e))
+    try:
+        rendered, written, render_seconds, grab_seconds, write_seconds = export_run(
+            game, sink, args.max_frames, args.fps, args.every)
+    finally:
+        print(sink.close(), file=sys.stderr)
+    elapsed = render_seconds + grab_seconds + write_seconds
+    print(f"{rendered} frames rendered, {written} written in {elapsed:.2f}s: {rendered / max(elapsed, 1e-9):.0f} fps "
+          f"(render {render_seconds / rendered * 1000:.2f} ms, grab {grab_seconds / max(written, 1) * 1000:.2f} ms, "
+          f"write {write_seconds / max(written, 1) * 1000:.2f} ms per frame), score {game.sim.score}", file=sys.stderr)
+    game.score_manager.close()
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,153 @@
+import time
+START_TIME = time.perf_counter()  # Taken before the heavier imports so startup timings include them
+
+import argparse
+import functools
 import pygame
-from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT
-from src.utils.assets import load_assets
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, FPS, MAX_RENDER_FPS, SERVER_PORT, MAX_GHOSTS
+from src.utils.assets import AssetManager, AssetLoader
 from src.game.controller import GameController
+from src.game.renderer import RENDERERS
+from src.game.loading import LoadingScreen
+from src.game.ghosts import GhostLayer
+from src.game.leaderboard import Leaderboard, LEADERBOARD_FILE, DEFAULT_PLAYER
+from src.sim.replay import load_replay, find_replays, ReplayError
+from src.sim.autopilot import Autopilot
+from src.sim.neuro import NeuralPilot, load_genome
+from src.net.client import NetClient
+from src.net.protocol import SEED_LIMIT
+from src.utils.profiler import FrameProfiler
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Flappy Bird")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the first run's pipes and particles")
+    parser.add_argument("--replay", help="play back a recorded run in real time")
+    parser.add_argument("--record-dir", default="replays", help="directory that receives a replay file per run")
+    parser.add_argument("--no-record", action="store_true", help="do not record runs")
+    parser.add_argument("--renderer", choices=sorted(RENDERERS), default="full",
+                        help="full redraws every frame; dirty redraws only changed areas")
+    parser.add_argument("--collision", choices=["rect", "mask"], default="rect",
+                        help="rect uses the bird's hitbox; mask tests its visible pixels (runs are not recorded)")
+    parser.add_argument("--max-fps", type=int, default=MAX_RENDER_FPS,
+                        help=f"frame cap; 0 draws as fast as possible (the game itself always runs at {FPS} ticks/s)")
+    parser.add_argument("--player", default=DEFAULT_PLAYER, help="name finished runs are saved under")
+    parser.add_argument("--leaderboard", default=LEADERBOARD_FILE, help="SQLite file that keeps every finished run")
+    parser.add_argument("--genome", metavar="CHECKPOINT",
+                        help="let the Autopilot button play with the best network of a train.py checkpoint")
+    parser.add_argument("--ghosts", nargs="+", metavar="REPLAY",
+                        help="race translucent ghosts of recorded runs (replay files or directories)")
+    parser.add_argument("--max-ghosts", type=int, default=MAX_GHOSTS, help="ghosts shown at most, best runs first")
+    parser.add_argument("--connect", metavar="HOST[:PORT]",
+                        help=f"play on a match server (python server.py), port {SERVER_PORT} by default")
+    parser.add_argument("--practice", action="store_true",
+                        help="Backspace rewinds the run a couple of seconds, even after a death; runs are not scored")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write per-frame phase timings to PATH (.csv, or .json for JSON); F3 shows them live")
+    args = parser.parse_args()
+    if args.seed is not None and not 0 <= args.seed < SEED_LIMIT:
+        parser.error(f"--seed must be from 0 to {SEED_LIMIT - 1}")
+    if args.max_fps < 0:
+        parser.error("--max-fps must not be negative")
+    if args.replay and args.collision != "rect":
+        parser.error("replays are recorded with rect collisions")
+    if args.connect and (args.replay or args.collision != "rect"):
+        parser.error("--connect plays the server's game, which has rect collisions and no replay")
+    if args.practice and (args.replay or args.connect):
+        parser.error("--practice rewinds local games only")
+    return args
 
 def main():
-    # Initialize Pygame
-    pygame.init()
+    args = parse_args()
+    replay = None
+    if args.replay:
+        try:
+            replay = load_replay(args.replay)
+        except (OSError, ReplayError) as e:
+            raise SystemExit(f"Cannot load replay {args.replay}: {e}")
+    ghost_replays = []
+    for path in find_replays(args.ghosts or []):
+        try:
+            ghost_replays.append(load_replay(path))
+        except (OSError, ReplayError) as e:
+            print(f"Skipping ghost {path}: {e}")
+    ghost_replays = sorted(ghost_replays, key=lambda ghost: ghost.score, reverse=True)[:args.max_ghosts]
+    autopilot_factory = Autopilot
+    if args.genome:
+        genome, hidden = load_genome(args.genome)
+        autopilot_factory = functools.partial(NeuralPilot, genome=genome, hidden=hidden)
+    
+    client = None
+    if args.connect:
+        host, _, port = args.connect.partition(":")
+        try:
+            client = NetClient(host, int(port) if port else SERVER_PORT, seed=args.seed)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"Cannot connect to {args.connect}: {e}")
     
-    # Create the game window
+    # Initialize only what the game uses; pygame.init() would also start the mixer, which it never needs
+    pygame.display.init()
+    pygame.font.init()
+    profiler = FrameProfiler(record=args.profile is not None, origin=START_TIME)
+    
+    # Create the game window and show the loading screen right away
     window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Flappy Bird")
+    loading_screen = LoadingScreen(window)
+    loading_screen.draw(0)
+    profiler.mark("first_frame")
+    
+    # Load fonts and images on a worker thread while the loading screen stays responsive
+    loader = AssetLoader(AssetManager())
+    loader.start()
+    leaderboard = Leaderboard(args.leaderboard)
+    clock = pygame.time.Clock()
+    while loader.is_alive():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                leaderboard.close()
+                if client:
+                    client.close()
+                pygame.quit()
+                return
+        loading_screen.draw(loader.progress())
+        clock.tick(FPS)
+    assets = loader.result()
+    profiler.mark("assets_ready")
+    print(assets.report())
     
-    # Load game assets
-    assets = load_assets()
+    # Ghost trajectories are simulated once, up front
+    ghosts = GhostLayer(assets["bird_atlas"], ghost_replays) if ghost_replays else None
     
     # Create and run game controller
-    game = GameController(window, assets)
+    game = GameController(
+        window,
+        assets,
+        seed=client.seed if client else args.seed,
+        replay=replay,
+        # Replays only reproduce rect collisions, so mask runs are not recorded
+        record_dir=None if args.no_record or args.collision != "rect" else args.record_dir,
+        renderer_class=RENDERERS[args.renderer],
+        collision=args.collision,
+        profiler=profiler,
+        max_fps=args.max_fps,
+        leaderboard=leaderboard,
+        player=args.player,
+        autopilot_factory=autopilot_factory,
+        client=client,
+        ghosts=ghosts,
+        practice=args.practice
+    )
     game.run()
+    print(game.renderer.summary())
+    print(game.pacing.summary())
+    if game.autopilot.decisions:
+        print(game.autopilot.summary())
+    if client:
+        print(client.summary())
+        client.close()
+    print(profiler.startup_summary())
+    if args.profile:
+        print(f"Wrote {profiler.save(args.profile)} profiled frames to {args.profile}")
     
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
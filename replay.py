@@ -0,0 +1,42 @@
+import argparse
+import os
+import time
+from src.sim.replay import load_replay, find_replays, verify, verify_batch, ReplayError
+
+# Headless replay verification; use `python main.py --replay FILE` to watch a run instead
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-simulate replay files headless and check their recorded scores")
+    parser.add_argument("paths", nargs="+", help="replay files or directories of them")
+    parser.add_argument("--scalar", action="store_true", help="verify one replay at a time instead of in vectorized batches")
+    parser.add_argument("--batch-size", type=int, default=4096, help="replays verified per vectorized batch")
+    args = parser.parse_args()
+
+    replays = []
+    names = []
+    for path in find_replays(args.paths):
+        try:
+            replays.append(load_replay(path))
+            names.append(path)
+        except (OSError, ReplayError) as e:
+            print(f"{path}: unreadable ({e})")
+
+    start = time.perf_counter()
+    if args.scalar:
+        results = [verify(replay) for replay in replays]
+    else:
+        results = []
+        for i in range(0, len(replays), args.batch_size):
+            results.extend(verify_batch(replays[i:i + args.batch_size]))
+    elapsed = time.perf_counter() - start
+
+    failures = [name for name, ok in zip(names, results) if not ok]
+    for name in failures:
+        print(f"{name}: MISMATCH")
+    size = sum(os.path.getsize(name) for name in names)
+    print(f"{len(replays)} replays ({size:,} bytes) verified in {elapsed:.3f}s "
+          f"({len(replays) / max(elapsed, 1e-9):,.0f} replays/s), {len(failures)} mismatched")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
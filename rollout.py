@@ -0,0 +1,67 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from src.sim.rollout import RolloutJob, run_chunk
+from src.sim.policies import POLICIES
+
+def load_script(path):
+    # An input script is a whitespace-separated list of tick indices to jump on
+    with open(path, "r") as f:
+        return tuple(int(tick) for tick in f.read().split())
+
+def build_jobs(args):
+    jobs = []
+    if args.scripts:
+        for seed in range(args.seed, args.seed + args.runs):
+            for path in args.scripts:
+                jobs.append(RolloutJob(len(jobs), seed, os.path.basename(path), load_script(path), args.max_frames))
+    else:
+        for seed in range(args.seed, args.seed + args.runs):
+            for policy in args.policies:
+                jobs.append(RolloutJob(len(jobs), seed, policy, None, args.max_frames))
+    return jobs
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many headless games across worker processes")
+    parser.add_argument("--runs", type=int, default=1000, help="seeds to evaluate per policy or script")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--policies", nargs="+", default=["gap_follower"], choices=sorted(POLICIES))
+    parser.add_argument("--scripts", nargs="+", help="input script files to replay instead of policies")
+    parser.add_argument("--max-frames", type=int, default=10000, help="stop a run after this many frames")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=16, help="runs sent to a worker at a time")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args()
+
+    jobs = build_jobs(args)
+    chunks = [jobs[i:i + args.chunk_size] for i in range(0, len(jobs), args.chunk_size)]
+
+    total_frames = 0
+    total_score = 0
+    best_score = 0
+    causes = {}
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(run_chunk, chunk) for chunk in chunks]
+        # Results stream back as soon as each chunk finishes
+        for future in as_completed(futures):
+            for result in future.result():
+                total_frames += result.frames
+                total_score += result.score
+                best_score = max(best_score, result.score)
+                cause = result.death_cause or "survived"
+                causes[cause] = causes.get(cause, 0) + 1
+                if not args.quiet:
+                    print(f"run {result.run_id} seed {result.seed} {result.policy}: "
+                          f"score {result.score}, frames {result.frames}, death {cause}", flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(f"{len(jobs)} runs on {args.workers} workers in {elapsed:.2f}s: "
+          f"{len(jobs) / elapsed:,.0f} runs/s, {total_frames / elapsed:,.0f} frames/s")
+    print(f"mean score {total_score / max(1, len(jobs)):.2f}, best score {best_score}, deaths "
+          + ", ".join(f"{cause} {count}" for cause, count in sorted(causes.items())))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+import asyncio
+from src.net.server import MatchServer
+from src.utils.constants import SERVER_PORT
+
+# Local match server; play on it with `python main.py --connect HOST:PORT`, load test it with benchmarks.server_load
+
+async def serve(host, port, report_seconds):
+    server = MatchServer()
+    listener = await server.start(host, port)
+    addresses = ", ".join(f"{name[0]}:{name[1]}" for name in (sock.getsockname() for sock in listener.sockets))
+    print(f"Serving on {addresses}", flush=True)
+    async with listener:
+        while True:
+            await asyncio.sleep(report_seconds)
+            print(server.summary(), flush=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Host games for networked clients on one shared tick")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (0.0.0.0 for every interface)")
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--report-seconds", type=float, default=10.0, help="how often to print the server's load")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.report_seconds))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
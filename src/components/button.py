@@ -1,8 +1,9 @@
 import pygame
 from ..utils.constants import SCORE_COLOR
+from ..utils.text_cache import text_cache as default_text_cache
 
 class Button:
-    def __init__(self, text, x, y, width, height, color, hover_color, font):
+    def __init__(self, text, x, y, width, height, color, hover_color, font, text_cache=None):
         self.text = text
         self.x = x
         self.y = y
@@ -12,21 +13,25 @@ class Button:
         self.hover_color = hover_color
         self.font = font
         self.text_color = (255, 255, 255)  # White text for better visibility on dark backgrounds
+        self.text_cache = text_cache if text_cache is not None else default_text_cache
+
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def is_hovered(self):
+        return bool(self.get_rect().collidepoint(pygame.mouse.get_pos()))
 
     def draw(self, window):
-        mouse_pos = pygame.mouse.get_pos()
-        button_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        button_rect = self.get_rect()
 
-        if button_rect.collidepoint(mouse_pos):
+        if self.is_hovered():
             pygame.draw.rect(window, self.hover_color, button_rect)
         else:
             pygame.draw.rect(window, self.color, button_rect)
 
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = self.text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=button_rect.center)
         window.blit(text_surface, text_rect)
 
     def is_clicked(self):
-        mouse_pos = pygame.mouse.get_pos()
-        button_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        return button_rect.collidepoint(mouse_pos) and pygame.mouse.get_pressed()[0] 
\ No newline at end of file
+        return self.is_hovered() and pygame.mouse.get_pressed()[0] 
\ No newline at end of file
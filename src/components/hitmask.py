@@ -0,0 +1,45 @@
+import pygame
+from .sprite_atlas import pixel_round
+from ..sim.collision import RectCollider
+from ..utils.constants import BIRD_WIDTH
+
+class MaskCollider(RectCollider):
+    """Pixel-accurate narrow phase built from the bird's rotation atlas.
+
+    Each pre-rotated frame gets its mask once, so a hit test only picks the
+    mask for the current tilt and checks it against a filled mask the size of
+    the overlap. Filled masks are cached by size.
+    """
+    name = "mask"
+
+    def __init__(self, atlas):
+        self.atlas = atlas
+        self.frames = [(pygame.mask.from_surface(surface), offset) for surface, offset in atlas.frames]
+        self.filled = {}
+
+        # Rotated frames are wider than the hitbox, so the broad phase has to look further out
+        self.reach = max(max(-dx, mask.get_size()[0] + dx - BIRD_WIDTH) for mask, (dx, _) in self.frames)
+
+    def hit(self, bird, rect, upper):
+        # Collision point with rect (the first opaque pixel found), or None when only transparent pixels touch it
+        mask, (offset_x, offset_y) = self.frames[self.atlas.index(bird.tilt)]
+        left = pixel_round(bird.x) + offset_x
+        top = pixel_round(bird.y) + offset_y
+        width, height = mask.get_size()
+
+        x, y, rect_width, rect_height = rect
+        overlap_left = max(x, left)
+        overlap_top = max(y, top)
+        overlap_width = min(x + rect_width, left + width) - overlap_left
+        overlap_height = min(y + rect_height, top + height) - overlap_top
+        if overlap_width <= 0 or overlap_height <= 0:
+            return None
+
+        size = (overlap_width, overlap_height)
+        filled = self.filled.get(size)
+        if filled is None:
+            filled = self.filled[size] = pygame.Mask(size, fill=True)
+        point = mask.overlap(filled, (overlap_left - left, overlap_top - top))
+        if point is None:
+            return None
+        return left + point[0], top + point[1]
@@ -1,132 +1,212 @@
 import pygame
-import random
-import math
-
-class Particle:
-    def __init__(self, x, y, color, size=3, velocity_range=(-3, 3), gravity=0.2, fade_speed=3, life_span=60):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.original_color = color
-        self.size = size
-        self.original_size = size
-        
-        # Random velocity
-        self.vel_x = random.uniform(velocity_range[0], velocity_range[1])
-        self.vel_y = random.uniform(velocity_range[0], velocity_range[1])
-        
-        # Physics
-        self.gravity = gravity
-        
-        # Lifetime
-        self.life = 255  # Alpha value for fading
-        self.fade_speed = fade_speed
-        self.life_span = life_span
-        self.frame_count = 0
-        
-    def update(self):
-        # Update position
-        self.x += self.vel_x
-        self.y += self.vel_y
-        
-        # Apply gravity
-        self.vel_y += self.gravity
-        
-        # Decrease life (fade)
-        self.life = max(0, self.life - self.fade_speed)
-        
-        # Shrink particle over time
-        if self.frame_count < self.life_span:
-            self.size = self.original_size * (1 - (self.frame_count / self.life_span))
-        else:
-            self.size = 0
-            
-        self.frame_count += 1
-        
-    def draw(self, window):
-        # Create a fading effect using alpha
-        if self.life > 0 and self.size > 0:
-            particle_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            particle_alpha = min(255, self.life)
-            
-            # Get the RGB values from the original color
-            r, g, b = self.original_color
-            
-            # Use a circle for the particle
-            pygame.draw.circle(
-                particle_surface, 
-                (r, g, b, particle_alpha), 
-                (self.size, self.size), 
-                self.size
-            )
-            
-            window.blit(particle_surface, (int(self.x - self.size), int(self.y - self.size)))
-            
-    def is_alive(self):
-        return self.life > 0 and self.frame_count < self.life_span
+import numpy as np
+from ..utils.constants import MAX_PARTICLES
+
+# Sprites are cached per colour, diameter in pixels and one of ALPHA_LEVELS alpha steps
+ALPHA_LEVELS = 16
+ALPHA_STEP = 256 // ALPHA_LEVELS
 
 class ParticleManager:
-    def __init__(self):
-        self.particles = []
-        
+    # Particles live in parallel NumPy arrays; dead slots are reused by later bursts
+    def __init__(self, rng=None, capacity=MAX_PARTICLES):
+        # rng is the run's random.Random; particles draw from a NumPy generator seeded by it
+        self.rng = np.random.default_rng(rng.getrandbits(64) if rng is not None else None)
+        self.rng_state = None  # bit_generator.state cached until the next burst draws from it
+        self.capacity = capacity
+        self.end = 0  # One past the highest live slot, so updates skip the unused tail
+
+        # Fields are rows of two blocks, so a snapshot copies each block's live columns in one go.
+        # life is the alpha value for fading; size is the size at spawn, as particles shrink over their life span
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.floats = np.zeros((8, capacity))
+        self.x, self.y, self.vel_x, self.vel_y, self.gravity, self.life, self.fade_speed, self.size = self.floats
+        self.ints = np.zeros((3, capacity), dtype=np.int64)
+        self.life_span, self.frame_count, self.color_index = self.ints
+        self.life_span[:] = 1
+
+        self.palette = []
+        self.palette_index = {}
+        self.sprites = {}
+
+    def color_id(self, color):
+        if color not in self.palette_index:
+            self.palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return self.palette_index[color]
+
+    def emit(self, count, x, y, vel_x, vel_y, color_index, size, gravity, fade_speed, life_span):
+        # Fill free slots; bursts beyond the particle cap are dropped
+        self.rng_state = None
+        slots = np.flatnonzero(~self.alive)[:count]
+        count = slots.size
+        if count == 0:
+            return
+        self.alive[slots] = True
+        self.x[slots] = x[:count] if np.ndim(x) else x
+        self.y[slots] = y[:count] if np.ndim(y) else y
+        self.vel_x[slots] = vel_x[:count]
+        self.vel_y[slots] = vel_y[:count]
+        self.color_index[slots] = color_index[:count] if np.ndim(color_index) else color_index
+        self.size[slots] = size[:count]
+        self.gravity[slots] = gravity
+        self.life[slots] = 255
+        self.fade_speed[slots] = fade_speed[:count]
+        self.life_span[slots] = life_span[:count]
+        self.frame_count[slots] = 0
+        self.end = max(self.end, int(slots[-1]) + 1)
+
     def add_impact_particles(self, x, y, color=(255, 255, 255), count=20):
-        for _ in range(count):
-            self.particles.append(
-                Particle(
-                    x, 
-                    y, 
-                    color, 
-                    size=random.uniform(1, 4),
-                    velocity_range=(-4, 4),
-                    gravity=0.2,
-                    fade_speed=random.uniform(2, 5),
-                    life_span=random.randint(30, 60)
-                )
-            )
-    
+        rng = self.rng
+        self.emit(
+            count, x, y,
+            vel_x=rng.uniform(-4, 4, count),
+            vel_y=rng.uniform(-4, 4, count),
+            color_index=self.color_id(color),
+            size=rng.uniform(1, 4, count),
+            gravity=0.2,
+            fade_speed=rng.uniform(2, 5, count),
+            life_span=rng.integers(30, 60, count, endpoint=True)
+        )
+
     def add_feather_particles(self, x, y, count=10):
         feather_colors = [(255, 255, 240), (255, 255, 200), (255, 250, 220)]
-        for _ in range(count):
-            color = random.choice(feather_colors)
-            self.particles.append(
-                Particle(
-                    x, 
-                    y, 
-                    color, 
-                    size=random.uniform(1, 3),
-                    velocity_range=(-3, 3),
-                    gravity=0.05,  # Feathers fall slower
-                    fade_speed=random.uniform(1, 3),
-                    life_span=random.randint(60, 120)
-                )
-            )
-    
+        rng = self.rng
+        color_ids = np.array([self.color_id(color) for color in feather_colors])
+        self.emit(
+            count, x, y,
+            vel_x=rng.uniform(-3, 3, count),
+            vel_y=rng.uniform(-3, 3, count),
+            color_index=rng.choice(color_ids, count),
+            size=rng.uniform(1, 3, count),
+            gravity=0.05,  # Feathers fall slower
+            fade_speed=rng.uniform(1, 3, count),
+            life_span=rng.integers(60, 120, count, endpoint=True)
+        )
+
     def add_ground_dust(self, x, y, count=15):
         dust_colors = [(139, 69, 19), (160, 82, 45), (210, 180, 140)]
-        for _ in range(count):
-            # Particles mainly spread horizontally when hitting ground
-            vel_x = random.uniform(-5, 5)
-            vel_y = random.uniform(-2, 0)  # More upward than downward
-            
-            particle = Particle(
-                x + random.uniform(-10, 10),  # Spread along ground
-                y + random.uniform(-2, 2), 
-                random.choice(dust_colors), 
-                size=random.uniform(1, 3),
-                velocity_range=(vel_x, vel_y),
-                gravity=0.1,
-                fade_speed=random.uniform(3, 6),
-                life_span=random.randint(20, 40)
-            )
-            self.particles.append(particle)
-    
+        rng = self.rng
+        color_ids = np.array([self.color_id(color) for color in dust_colors])
+        # Particles mainly spread horizontally when hitting ground; each one's
+        # velocity is drawn between a horizontal and a (mostly upward) vertical speed
+        low = rng.uniform(-5, 5, count)
+        high = rng.uniform(-2, 0, count)
+        self.emit(
+            count,
+            x + rng.uniform(-10, 10, count),  # Spread along ground
+            y + rng.uniform(-2, 2, count),
+            vel_x=low + (high - low) * rng.random(count),
+            vel_y=low + (high - low) * rng.random(count),
+            color_index=rng.choice(color_ids, count),
+            size=rng.uniform(1, 3, count),
+            gravity=0.1,
+            fade_speed=rng.uniform(3, 6, count),
+            life_span=rng.integers(20, 40, count, endpoint=True)
+        )
+
     def update(self):
-        # Update all particles and remove dead ones
-        self.particles = [particle for particle in self.particles if particle.is_alive()]
-        
-        for particle in self.particles:
-            particle.update()
-            
+        end = self.end
+        if end == 0:
+            return
+        alive = self.alive[:end]
+
+        # Retire finished particles first, as their slots can be reused right away
+        alive &= (self.life[:end] > 0) & (self.frame_count[:end] < self.life_span[:end])
+        live = np.flatnonzero(alive)
+        self.end = end = int(live[-1]) + 1 if live.size else 0
+        if end == 0:
+            return
+
+        # Dead slots below the high-water mark are updated too; it is cheaper than masking
+        self.x[:end] += self.vel_x[:end]
+        self.y[:end] += self.vel_y[:end]
+        self.vel_y[:end] += self.gravity[:end]
+        life = self.life[:end]
+        np.maximum(life - self.fade_speed[:end], 0, out=life)
+        self.frame_count[:end] += 1
+
+    def current_sizes(self, end):
+        # Size shrinks linearly with the frames lived before the latest update
+        frames = np.maximum(self.frame_count[:end] - 1, 0)
+        sizes = self.size[:end] * (1 - frames / self.life_span[:end])
+        return np.where(frames < self.life_span[:end], sizes, 0)
+
+    def get_sprite(self, color_index, diameter, alpha_level):
+        key = (color_index, diameter, alpha_level)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            r, g, b = self.palette[color_index]
+            alpha = min(255, alpha_level * ALPHA_STEP + ALPHA_STEP - 1)
+            sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            radius = diameter / 2
+            pygame.draw.circle(sprite, (r, g, b, alpha), (radius, radius), radius)
+            self.sprites[key] = sprite
+        return sprite
+
     def draw(self, window):
-        for particle in self.particles:
-            particle.draw(window) 
\ No newline at end of file
+        end = self.end
+        if end == 0:
+            return
+        sizes = self.current_sizes(end)
+        diameters = (sizes * 2).astype(np.int64)
+        visible = np.flatnonzero(self.alive[:end] & (self.life[:end] > 0) & (diameters > 0))
+        if visible.size == 0:
+            return
+
+        diameters = diameters[visible]
+        left = (self.x[visible] - sizes[visible]).astype(np.int64)
+        top = (self.y[visible] - sizes[visible]).astype(np.int64)
+        alpha_levels = np.minimum(self.life[visible], 255).astype(np.int64) // ALPHA_STEP
+        color_ids = self.color_index[visible]
+
+        get_sprite = self.get_sprite
+        window.blits(
+            [
+                (get_sprite(color_id, diameter, alpha_level), (x, y))
+                for color_id, diameter, alpha_level, x, y in zip(
+                    color_ids.tolist(), diameters.tolist(), alpha_levels.tolist(), left.tolist(), top.tolist()
+                )
+            ],
+            doreturn=False
+        )
+
+    def get_bounds(self):
+        # Rect covering every particle drawn this frame, or None
+        end = self.end
+        if end == 0:
+            return None
+        sizes = self.current_sizes(end)
+        visible = np.flatnonzero(self.alive[:end] & (self.life[:end] > 0) & (sizes * 2 >= 1))
+        if visible.size == 0:
+            return None
+        left = self.x[visible] - sizes[visible]
+        top = self.y[visible] - sizes[visible]
+        diameters = (sizes[visible] * 2).astype(np.int64)
+        x = int(np.floor(left.min()))
+        y = int(np.floor(top.min()))
+        return pygame.Rect(x, y, int((left + diameters).max()) + 2 - x, int((top + diameters).max()) + 2 - y)
+
+    def snapshot(self):
+        # Slots below the high-water mark, plus the generator state
+        end = self.end
+        if self.rng_state is None:
+            self.rng_state = self.rng.bit_generator.state
+        if end == 0:
+            return (0, None, None, None, self.rng_state)
+        return (end, self.alive[:end].copy(), self.floats[:, :end].copy(), self.ints[:, :end].copy(), self.rng_state)
+
+    def restore(self, snapshot):
+        # Colors keep their palette ids for the manager's life, so the palette needs no restoring
+        end, alive, floats, ints, rng_state = snapshot
+        self.alive[:max(end, self.end)] = False  # Slots from the high-water mark up are already dead
+        self.end = end
+        if end:
+            self.alive[:end] = alive
+            self.floats[:, :end] = floats
+            self.ints[:, :end] = ints
+        if rng_state is not self.rng_state:
+            self.rng.bit_generator.state = rng_state
+            self.rng_state = rng_state
+
+    def live_count(self):
+        return int(np.count_nonzero(self.alive[:self.end]))
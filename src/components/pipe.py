@@ -1,18 +1,61 @@
 import pygame
-from ..utils.constants import PIPE_WIDTH, PIPE_COLOR, PIPE_GAP, PIPE_VELOCITY, WINDOW_HEIGHT
+from ..sim.pipe import PipePhysics
+from ..utils.constants import PIPE_WIDTH, PIPE_COLOR, PIPE_GAP, PIPE_CAP_HEIGHT, WINDOW_HEIGHT, GROUND_HEIGHT
 
-class Pipe:
-    def __init__(self, x, gap_height):
-        self.x = x
-        self.gap_height = gap_height
-        self.passed = False
+PLAYFIELD_HEIGHT = WINDOW_HEIGHT - GROUND_HEIGHT  # Pipes are never drawn behind the ground
 
-    def update(self):
-        self.x -= PIPE_VELOCITY
+def shade(color, factor):
+    return tuple(min(255, int(channel * factor)) for channel in color)
 
-    def draw(self, window):
-        pygame.draw.rect(window, PIPE_COLOR, (self.x, 0, PIPE_WIDTH, self.gap_height))
-        pygame.draw.rect(window, PIPE_COLOR, (self.x, self.gap_height + PIPE_GAP, PIPE_WIDTH, WINDOW_HEIGHT))
+def build_column(height, brightness):
+    # A PIPE_WIDTH wide block lit from the left: one shaded row stretched to height, with dark edges
+    row = pygame.Surface((PIPE_WIDTH, 1))
+    for x in range(PIPE_WIDTH):
+        t = x / (PIPE_WIDTH - 1)
+        factor = 0.5 if x in (0, PIPE_WIDTH - 1) else brightness * (0.75 + 0.45 * (1 - abs(t - 0.3) / 0.7))
+        row.set_at((x, 0), shade(PIPE_COLOR, factor))
+    return pygame.transform.scale(row, (PIPE_WIDTH, height))
+
+def build_pipe_sprites():
+    # Upper and lower pipe surfaces, each a full playfield tall with its cap at the open end; every
+    # gap height is an area of these two, so nothing is rendered per pipe or per frame
+    body = build_column(PLAYFIELD_HEIGHT, 1.0)
+    cap = build_column(PIPE_CAP_HEIGHT, 1.15)
+    edge = shade(PIPE_COLOR, 0.5)
+    pygame.draw.line(cap, edge, (0, 0), (PIPE_WIDTH - 1, 0))
+    pygame.draw.line(cap, edge, (0, PIPE_CAP_HEIGHT - 1), (PIPE_WIDTH - 1, PIPE_CAP_HEIGHT - 1))
+    upper = body.copy()
+    upper.blit(cap, (0, PLAYFIELD_HEIGHT - PIPE_CAP_HEIGHT))
+    lower = body
+    lower.blit(cap, (0, 0))
+    if pygame.display.get_surface() is not None:
+        upper = upper.convert()
+        lower = lower.convert()
+    return upper, lower
+
+def draw_pipes(window, pipes, sprites, offset_x=0):
+    # Every pipe in one Surface.blits call
+    blit_list = []
+    for pipe in pipes:
+        blit_list.extend(pipe.get_blits(sprites, offset_x))
+    if blit_list:
+        window.blits(blit_list, doreturn=False)
+
+class Pipe(PipePhysics):
+    __slots__ = ()
+
+    def get_blits(self, sprites, offset_x=0):
+        # (surface, position, area) for both halves; offset_x shifts the pipe to where it was part way
+        # through the last tick. The upper half shows the bottom of its sprite, the lower half the top
+        upper, lower = sprites
+        x = int(self.x + offset_x)
+        gap_height = int(self.gap_height)
+        lower_y = gap_height + PIPE_GAP
+        return (
+            (upper, (x, 0), (0, PLAYFIELD_HEIGHT - gap_height, PIPE_WIDTH, gap_height)),
+            (lower, (x, lower_y), (0, 0, PIPE_WIDTH, PLAYFIELD_HEIGHT - lower_y)),
+        )
 
     def get_rect(self):
-        return pygame.Rect(self.x, 0, PIPE_WIDTH, self.gap_height), pygame.Rect(self.x, self.gap_height + PIPE_GAP, PIPE_WIDTH, WINDOW_HEIGHT) 
\ No newline at end of file
+        upper_bounds, lower_bounds = self.get_bounds()
+        return pygame.Rect(upper_bounds), pygame.Rect(lower_bounds)
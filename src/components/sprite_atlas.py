@@ -0,0 +1,34 @@
+import pygame
+
+def pixel_round(value):
+    # Round half away from zero, as pygame.Rect position setters do
+    return int(value + 0.5) if value >= 0 else -int(0.5 - value)
+
+class RotationAtlas:
+    # Rotated copies of one image, built once for every angle step in [min_angle, max_angle]
+    def __init__(self, image, min_angle, max_angle, step=0.5, smooth=False):
+        self.min_angle = min_angle
+        self.max_angle = max_angle
+        self.step = step
+        self.frames = []
+
+        # Offsets keep each rotated frame centred on the unrotated image, the way
+        # rotated.get_rect(center=image_rect.center) would place it
+        width, height = image.get_size()
+        count = int(round((max_angle - min_angle) / step)) + 1
+        for i in range(count):
+            angle = min_angle + i * step
+            if smooth:
+                rotated = pygame.transform.rotozoom(image, angle, 1)
+            else:
+                rotated = pygame.transform.rotate(image, angle)
+            offset = (width // 2 - rotated.get_width() // 2, height // 2 - rotated.get_height() // 2)
+            self.frames.append((rotated, offset))
+
+    def index(self, angle):
+        angle = min(max(angle, self.min_angle), self.max_angle)
+        return int(round((angle - self.min_angle) / self.step))
+
+    def get(self, angle):
+        # (surface, (dx, dy)) to blit at the unrotated image's top-left plus the offset
+        return self.frames[self.index(angle)]
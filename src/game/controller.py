@@ -1,255 +1,460 @@
 import pygame
-import random
+import os
+import time
 from ..components.bird import Bird
-from ..components.pipe import Pipe
+from ..components.pipe import Pipe, draw_pipes
 from ..components.particle import ParticleManager
-from .state import GameState
+from ..components.hitmask import MaskCollider
+from ..sim.simulation import Simulation, NOOP, JUMP, START, EVENT_SCORE, EVENT_PIPE_HIT, EVENT_GROUND_HIT
+from ..sim.replay import Recorder, save_replay, REPLAY_EXTENSION
+from ..sim.autopilot import Autopilot
+from ..sim.rewind import SnapshotRing
+from ..net.protocol import Frame, Reset, RESTART, MENU
 from .score import ScoreManager
+from .leaderboard import DEFAULT_PLAYER
 from .ui import UI
-from ..utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, PIPE_GAP, GROUND_HEIGHT, FPS, PIPE_SPAWN_TIME, PIPE_WIDTH, PIPE_COLOR, BIRD_WIDTH, BIRD_HEIGHT
+from .renderer import FullRenderer
+from .layers import LayerCompositor
+from .overlay import ProfilerOverlay
+from ..utils.profiler import FrameProfiler
+from ..utils.pacing import FramePacing
+from ..utils.constants import WINDOW_WIDTH, PIPE_COLOR, PIPE_VELOCITY, BIRD_WIDTH, BIRD_HEIGHT, TICK_SECONDS, MAX_CATCH_UP_TICKS, MAX_RENDER_FPS, DEATH_DELAY_TICKS, AUTOPILOT_RESTART_TICKS, NET_MAX_BUFFERED_FRAMES, REWIND_TICKS, REWIND_HISTORY_TICKS
 
 class GameController:
-    def __init__(self, window, assets):
+    def __init__(self, window, assets, seed=None, replay=None, record_dir=None, renderer_class=FullRenderer, collision="rect", profiler=None, max_fps=MAX_RENDER_FPS, leaderboard=None, player=DEFAULT_PLAYER, autopilot_factory=Autopilot, client=None, ghosts=None, practice=False):
         self.window = window
         self.assets = assets
         self.clock = pygame.time.Clock()
+        self.renderer = renderer_class(window)
+        self.profiler = profiler if profiler is not None else FrameProfiler()
         
-        # Create game objects
-        self.bird = Bird(assets["bird"])
-        self.pipes = []
+        # Frames are drawn independently of simulation ticks, up to max_fps (0 for no cap)
+        self.max_fps = max_fps
+        self.pacing = FramePacing(1 / max_fps if max_fps else TICK_SECONDS)
+        self.alpha = 1.0  # How far the current frame is between the previous tick's state and the latest
+        
+        # Create game objects; the simulation owns all gameplay state
+        self.bird = Bird(assets["bird"], assets["bird_atlas"])
+        collider = MaskCollider(assets["bird_atlas"]) if collision == MaskCollider.name else None
+        self.sim = Simulation(self.bird, Pipe, seed=replay.seed if replay else seed, collider=collider, profiler=self.profiler)
+        self.pending_action = NOOP
+        
+        # The autopilot plays instead of the player once chosen from the main menu; the factory
+        # takes the simulation and returns an object with decide() and summary()
+        self.autopilot = autopilot_factory(self.sim)
+        self.autopilot_enabled = False
+        
+        # Online, a MatchServer runs the game: inputs go to it and every tick replays one of its frames
+        self.client = client
+        
+        # Ghosts of recorded runs fly alongside, matched by ticks since the run left the menu
+        self.ghosts = ghosts
+        self.run_start_tick = None  # Tick after the first step of the current run
+        
+        # Practice runs keep a snapshot of every tick they are alive for, to rewind to
+        self.history = SnapshotRing(REWIND_HISTORY_TICKS) if practice else None
+        
+        # Replays drive the simulation from a file; otherwise every run can be recorded. Restarting or
+        # leaving for the menu after a replayed run hands the game to the player, who is recorded from then on
+        self.replay_actions = dict(replay.actions) if replay else None
+        self.record_dir = record_dir
+        self.recorder = Recorder(self.sim.seed) if self.record_dir and replay is None else None
+        self.recording_end = None  # (score, ticks) of a practice run's latest death, saved once the run is left
         
         # Create managers
-        self.score_manager = ScoreManager()
-        self.game_state = GameState()
-        self.font = pygame.font.SysFont(None, 36)  # Use a system font
-        self.ui = UI(window, self.font)
-        self.particle_manager = ParticleManager()
+        self.score_manager = ScoreManager(leaderboard, player)
+        self.font = assets["font"]  # Fonts are loaded with the other assets
+        self.layers = LayerCompositor(window, assets["background"])
+        self.ui = UI(window, self.font, layers=self.layers,
+                     large_font=assets["large_font"], medium_font=assets["medium_font"])
+        self.particle_manager = ParticleManager(self.sim.make_rng("particles"))
+        self.overlay = ProfilerOverlay(self.profiler, self.pacing)
+        self.show_overlay = False
         
         # Set up background scrolling
         self.background_x = 0
-        
-        # Set up pipe spawning timer
-        self.add_pipe_event = pygame.USEREVENT + 1
-        pygame.time.set_timer(self.add_pipe_event, PIPE_SPAWN_TIME)
-        
-        # Death sequence flags
-        self.death_time = 0
-        self.death_delay = 1000  # milliseconds to wait after bird hits ground
-        self.collision_point = None
-        self.has_added_death_particles = False
-        self.has_added_ground_particles = False
+        self.background_step = 0  # Pixels the background scrolled on the last tick
     
     def handle_events(self):
+        game_state = self.sim.game_state
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
             
+            # F3 shows or hides the profiler overlay
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.show_overlay = not self.show_overlay
+                self.profiler.set_active(self.show_overlay)
+                continue
+            
+            # Player input is ignored while a replay is playing, up to its game over screen
+            if self.replay_actions is not None and not self.ui.show_death_screen:
+                continue
+            
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    if not self.game_state.is_game_started and not self.game_state.is_game_over:
-                        self.game_state.start_game()
-                    self.bird.jump()
+                if event.key == pygame.K_SPACE and not self.autopilot_enabled:
+                    self.queue_action(JUMP)
+                
+                if event.key == pygame.K_BACKSPACE and self.history is not None:
+                    self.rewind()
                 
-                if event.key == pygame.K_r and self.game_state.is_game_over and self.ui.show_death_screen:
-                    self.reset_game()
+                if event.key == pygame.K_r and game_state.is_game_over and self.ui.show_death_screen:
+                    self.request_reset()
                     return True
             
             if event.type == pygame.MOUSEBUTTONDOWN:
                 # Handle main menu button click
-                if not self.game_state.is_game_started and not self.game_state.is_game_over:
-                    if self.ui.start_button.is_clicked():
-                        self.game_state.start_game()
+                if not game_state.is_game_started and not game_state.is_game_over:
+                    if self.ui.start_button.is_clicked() and self.pending_action == NOOP:
+                        self.queue_action(START)
+                        self.autopilot_enabled = False
+                    # The autopilot only plays local games
+                    elif self.ui.autopilot_button.is_clicked() and self.pending_action == NOOP and self.client is None:
+                        self.pending_action = START
+                        self.autopilot_enabled = True
                 
                 # Handle game over screen buttons
-                if self.game_state.is_game_over and self.ui.show_death_screen:
+                if game_state.is_game_over and self.ui.show_death_screen:
                     if self.ui.restart_button.is_clicked():
-                        self.reset_game()
+                        self.request_reset()
                         return True
                     if self.ui.menu_button.is_clicked():
-                        self.reset_game()
-                        self.game_state.reset()  # Make sure we go to main menu
+                        self.autopilot_enabled = False
+                        self.request_reset(start=False)  # Make sure we go to main menu
                         return True
-            
-            if event.type == self.add_pipe_event and self.game_state.is_game_started and not self.game_state.is_game_over:
-                self.spawn_pipe()
         
         return True
     
+    def queue_action(self, action):
+        if self.client is not None:
+            self.client.send(action)  # Comes back in the server's frame for the tick it is applied on
+        else:
+            self.pending_action = action
+    
+    def request_reset(self, start=True):
+        if self.client is not None:
+            self.client.send(RESTART if start else MENU)  # The server picks the seed and sends a RESET
+        else:
+            self.reset_game(start)
+    
+    def receive_frame(self):
+        # Next server tick, after starting any new run the server began before it
+        while True:
+            message = self.client.poll()
+            if message is None or isinstance(message, Frame):
+                return message
+            if isinstance(message, Reset):
+                self.reset_game(message.started, message.seed)
+    
     def update(self):
+        frame = None
+        if self.client is not None:
+            frame = self.receive_frame()
+            if frame is None:
+                return  # The server has not sent this tick yet
+        self.bird.save_previous()
+        
         # Always update particles
         self.particle_manager.update()
+        self.profiler.lap("particles")
         
-        # Update bird position if game started
-        if self.game_state.is_game_started:
-            self.bird.update()
-            
-            # If the bird died from hitting the ground in the update, set game over
-            if self.bird.is_dead and not self.game_state.is_game_over:
-                self.game_state.end_game()
-        
-        # Update pipes and check for passing only if game is not over
-        if not self.game_state.is_game_over:
-            for pipe in self.pipes:
-                pipe.update()
-                
-                # Remove pipes that are off screen
-                if pipe.x + PIPE_WIDTH < 0:
-                    self.pipes.remove(pipe)
-                
-                # Check if bird passed the pipe
-                if pipe.x + PIPE_WIDTH < self.bird.x:
-                    if not pipe.passed:
-                        pipe.passed = True
-                        self.score_manager.increment()
-                
-                # Check collision
-                if self.game_state.is_game_started and not self.game_state.is_game_over:
-                    bird_rect = self.bird.get_rect()
-                    upper_pipe_rect, lower_pipe_rect = pipe.get_rect()
-                    
-                    # Check collision with upper pipe
-                    if bird_rect.colliderect(upper_pipe_rect):
-                        self.game_state.end_game()
-                        self.bird.is_dead = True
-                        
-                        # Find collision point
-                        self.collision_point = (
-                            max(bird_rect.left, upper_pipe_rect.left),
-                            max(bird_rect.top, upper_pipe_rect.top)
-                        )
-                        
-                        # Add impact particles when bird hits
-                        if not self.has_added_death_particles:
-                            self.particle_manager.add_impact_particles(
-                                self.collision_point[0], 
-                                self.collision_point[1],
-                                PIPE_COLOR,
-                                30
-                            )
-                            self.particle_manager.add_feather_particles(
-                                self.bird.x + BIRD_WIDTH//2, 
-                                self.bird.y + BIRD_HEIGHT//2,
-                                15
-                            )
-                            self.has_added_death_particles = True
-                    
-                    # Check collision with lower pipe
-                    elif bird_rect.colliderect(lower_pipe_rect):
-                        self.game_state.end_game()
-                        self.bird.is_dead = True
-                        
-                        # Find collision point
-                        self.collision_point = (
-                            max(bird_rect.left, lower_pipe_rect.left),
-                            min(bird_rect.bottom, lower_pipe_rect.bottom)
-                        )
-                        
-                        # Add impact particles when bird hits
-                        if not self.has_added_death_particles:
-                            self.particle_manager.add_impact_particles(
-                                self.collision_point[0], 
-                                self.collision_point[1],
-                                PIPE_COLOR,
-                                30
-                            )
-                            self.particle_manager.add_feather_particles(
-                                self.bird.x + BIRD_WIDTH//2, 
-                                self.bird.y + BIRD_HEIGHT//2,
-                                15
-                            )
-                            self.has_added_death_particles = True
-        
-        # Check if bird hits the ground or is already on ground
-        if self.bird.is_on_ground():
-            if not self.has_added_ground_particles:
-                # Add dust particles when the bird hits the ground
-                self.particle_manager.add_ground_dust(
-                    self.bird.x + BIRD_WIDTH//2,
-                    WINDOW_HEIGHT - GROUND_HEIGHT,
-                    25
+        # Advance the simulation by one frame with the input gathered this frame
+        if frame is not None:
+            action = frame.action
+        elif self.replay_actions is not None:
+            action = self.replay_actions.get(self.sim.tick, NOOP)
+        elif self.autopilot_enabled and self.pending_action == NOOP:
+            action = self.autopilot.decide()
+        else:
+            action = self.pending_action
+        self.pending_action = NOOP
+        self.profiler.lap("autopilot")
+        was_game_over = self.sim.game_state.is_game_over
+        was_started = self.sim.game_state.is_game_started
+        if self.recorder:
+            self.recorder.record(self.sim.tick, action)
+        self.profiler.lap("update")
+        state = self.sim.step(action)
+        if state.is_game_started and not was_started:
+            self.run_start_tick = self.sim.tick
+        
+        # Save the run's inputs the moment it ends; a practice run can still be rewound, so it waits
+        if state.is_game_over and not was_game_over and self.recorder:
+            if self.history is None:
+                self.save_recording(self.sim.score, self.sim.tick)
+            else:
+                self.recording_end = (self.sim.score, self.sim.tick)
+        
+        # Follow the server if the local copy of the game drifted from it; a corrected death adds its events
+        corrected = frame is not None and self.client.correct(self.sim, frame)
+        
+        for event in self.sim.events:
+            if event[0] == EVENT_SCORE:
+                self.score_manager.increment()
+            elif event[0] == EVENT_PIPE_HIT:
+                # Add impact particles when bird hits
+                self.particle_manager.add_impact_particles(event[1], event[2], PIPE_COLOR, 30)
+                self.particle_manager.add_feather_particles(
+                    self.bird.x + BIRD_WIDTH//2, 
+                    self.bird.y + BIRD_HEIGHT//2,
+                    15
                 )
-                self.has_added_ground_particles = True
-            
-            if self.game_state.is_bird_falling:
-                self.game_state.bird_hit_ground()
-                self.death_time = pygame.time.get_ticks()
-            
-            # If bird has been on the ground for enough time, update the UI
-            if pygame.time.get_ticks() - self.death_time > self.death_delay:
-                self.ui.update_death_animation(True)
+            elif event[0] == EVENT_GROUND_HIT:
+                # Add dust particles when the bird hits the ground
+                self.particle_manager.add_ground_dust(event[1], event[2], 25)
         
-        # Update death animation if bird is dead
-        if self.game_state.is_game_over:
-            self.score_manager.save_high_score()
+        if corrected:
+            self.score_manager.score = self.sim.score
+        
+        # Queue the finished run for the leaderboard; played back, autopilot and practice runs are not scored.
+        # The game state is read after any correction, so a game over the server forced counts too
+        scored = self.replay_actions is None and not self.autopilot_enabled and self.history is None
+        if scored and self.sim.game_state.is_game_over and not was_game_over:
+            self.score_manager.finish_run(self.sim.seed, self.sim.tick)
+        
+        # If bird has been on the ground for enough time, update the UI
+        if self.sim.is_death_screen_due():
+            self.ui.update_death_animation(True)
         
         # Update background position only if the game is not over
-        if not self.game_state.is_game_over:
+        self.background_step = 0
+        if not state.is_game_over:
             self.background_x -= 1  # Move the background by 1 pixel to the left
+            self.background_step = 1
             if self.background_x <= -WINDOW_WIDTH:
                 self.background_x = 0
+        
+        # The autopilot plays again on its own after showing the game over screen for a while
+        if self.autopilot_enabled and self.ui.show_death_screen:
+            if self.sim.tick - self.sim.death_tick > DEATH_DELAY_TICKS + AUTOPILOT_RESTART_TICKS:
+                self.reset_game()
+        
+        # Only live ticks are kept, so after a death the history ends just before it
+        if self.history is not None and state.is_game_started and not state.is_game_over:
+            self.history.push(self.snapshot())
+        self.profiler.lap("update")
+    
+    def snapshot(self):
+        # The whole game between ticks as plain values and arrays, for restore()
+        return (
+            self.sim.snapshot(),
+            self.score_manager.snapshot(),
+            self.ui.snapshot(),
+            self.particle_manager.snapshot(),
+            self.background_x,
+            self.background_step,
+            self.run_start_tick,
+        )
+    
+    def restore(self, snapshot):
+        sim, score, ui, particles, self.background_x, self.background_step, self.run_start_tick = snapshot
+        self.sim.restore(sim)
+        self.score_manager.restore(score)
+        self.ui.restore(ui)
+        self.particle_manager.restore(particles)
+        self.bird.save_previous()  # Nothing to interpolate from across the jump
+        self.pending_action = NOOP
+        if self.recorder:
+            self.recorder.truncate(self.sim.tick)  # The recording follows the rewound run
+            self.recording_end = None
+    
+    def rewind(self):
+        # Back REWIND_TICKS from the latest live tick, which after a death is the one before it
+        snapshot = self.history.rewind(REWIND_TICKS)
+        if snapshot is not None:
+            self.restore(snapshot)
     
     def render(self):
+        if self.show_overlay:
+            self.overlay.refresh(time.perf_counter())
+            self.profiler.lap("overlay")
+        self.renderer.present(self)
+        self.profiler.lap("display")
+        self.clock.tick(self.max_fps)
+        self.profiler.lap("wait")
+        self.pacing.frame(time.perf_counter())
+    
+    def get_background_x(self):
+        # Background scroll offset drawn this frame, between the last two ticks
+        x = self.background_x + self.background_step * (1 - self.alpha)
+        if x > 0:
+            x -= WINDOW_WIDTH  # The last tick wrapped around
+        return round(x)
+    
+    def get_ghost_tick(self):
+        # Row of the ghost trajectories matching the live run's latest tick
+        return self.sim.tick - self.run_start_tick if self.run_start_tick is not None else -1
+    
+    def get_pipe_offset(self):
+        # Pipes are drawn this far right of their simulated position, between the last two ticks
+        return PIPE_VELOCITY * (1 - self.alpha) if self.sim.pipes_moved else 0
+    
+    def draw_scene(self):
+        game_state = self.sim.game_state
+        
+        # The main menu covers the whole window, so nothing underneath needs drawing
+        if not game_state.is_game_started and not game_state.is_game_over:
+            self.ui.draw_main_menu(self.assets["background"])
+            self.profiler.lap("ui")
+            self.draw_overlay()
+            return
+        
         # Draw background with scrolling effect
-        self.window.blit(self.assets["background"], (self.background_x, 0))
-        self.window.blit(self.assets["background"], (self.background_x + WINDOW_WIDTH, 0))
+        self.layers.draw_background(self.get_background_x())
+        self.profiler.lap("background")
         
         # Draw pipes
-        for pipe in self.pipes:
-            pipe.draw(self.window)
+        draw_pipes(self.window, self.sim.pipes, self.assets["pipe_sprites"], self.get_pipe_offset())
+        self.profiler.lap("draw_pipes")
         
         # Draw particles
         self.particle_manager.draw(self.window)
+        self.profiler.lap("draw_particles")
+        
+        # Draw ghosts behind the live bird
+        if self.ghosts is not None and game_state.is_game_started:
+            self.ghosts.draw(self.window, self.get_ghost_tick(), self.alpha)
+        self.profiler.lap("draw_ghosts")
         
         # Draw bird only when the game has started
-        if self.game_state.is_game_started:
-            self.bird.draw(self.window)
+        if game_state.is_game_started:
+            self.bird.draw(self.window, self.alpha)
+        self.profiler.lap("draw_bird")
         
         # Draw ground
         self.ui.draw_ground()
         
         # Draw score if game is started
-        if self.game_state.is_game_started and not self.ui.show_death_screen:
+        if game_state.is_game_started and not self.ui.show_death_screen:
             self.ui.draw_score(self.score_manager.score, self.score_manager.high_score)
         
-        # Show main menu screen
-        if not self.game_state.is_game_started and not self.game_state.is_game_over:
-            self.ui.draw_main_menu(self.assets["background"])
-        
         # Show game over screen only after bird has fallen to the ground
-        if self.game_state.is_game_over:
+        if game_state.is_game_over:
             self.ui.draw_game_over(
                 self.score_manager.score, 
                 self.score_manager.is_new_high_score(),
                 self.score_manager.high_score
             )
-        
-        # Update the display
-        pygame.display.update()
-        self.clock.tick(FPS)
+        self.profiler.lap("ui")
+        self.draw_overlay()
+    
+    def draw_overlay(self):
+        if self.show_overlay:
+            self.overlay.draw(self.window)
+            self.profiler.lap("overlay")
+    
+    def get_scene_key(self):
+        # Everything that changes the whole window; the dirty-rect renderer redraws it all when this changes
+        game_state = self.sim.game_state
+        if not game_state.is_game_started and not game_state.is_game_over:
+            return ("menu", self.ui.start_button.is_hovered(), self.ui.autopilot_button.is_hovered())
+        buttons_hovered = None
+        if game_state.is_game_over and self.ui.show_death_screen:
+            buttons_hovered = (self.ui.restart_button.is_hovered(), self.ui.menu_button.is_hovered())
+        return (
+            self.get_background_x(),
+            self.get_pipe_offset(),
+            game_state.is_game_started,
+            game_state.is_game_over,
+            self.ui.show_death_screen,
+            min(self.ui.fade_alpha, 180),
+            self.score_manager.score,
+            self.score_manager.high_score,
+            buttons_hovered,
+        )
     
-    def spawn_pipe(self):
-        gap_height = random.randint(50, WINDOW_HEIGHT - PIPE_GAP - GROUND_HEIGHT - 50)
-        new_pipe = Pipe(WINDOW_WIDTH, gap_height)
-        self.pipes.append(new_pipe)
+    def get_dynamic_items(self):
+        # Moving items as name -> (screen rect, token that changes when they are redrawn differently)
+        items = {}
+        if self.sim.game_state.is_game_started:
+            sprite = self.bird.get_sprite(self.alpha)
+            items["bird"] = (sprite[0].get_rect(topleft=sprite[1]), sprite)
+        if self.ghosts is not None and self.sim.game_state.is_game_started:
+            tick = self.get_ghost_tick()
+            ghost_rect = self.ghosts.get_rect(tick, self.alpha)
+            if ghost_rect is not None:
+                items["ghosts"] = (ghost_rect, (tick, self.alpha))
+        particle_rect = self.particle_manager.get_bounds()
+        if particle_rect is not None:
+            items["particles"] = (particle_rect, self.sim.tick)
+        if self.show_overlay and self.overlay.surface is not None:
+            items["profiler"] = (self.overlay.rect, self.overlay.version)
+        return items
     
-    def reset_game(self):
-        self.game_state.reset()
-        self.game_state.start_game()  # Automatically start a new game
+    def save_recording(self, score, ticks):
+        replay = self.recorder.finish(score, ticks)
+        name = f"run-{time.strftime('%Y%m%d-%H%M%S')}-{replay.seed}{REPLAY_EXTENSION}"
+        try:
+            os.makedirs(self.record_dir, exist_ok=True)
+            save_replay(os.path.join(self.record_dir, name), replay)
+            return True
+        except OSError:
+            return False
+    
+    def save_practice_recording(self):
+        # A practice run that died is saved once it is restarted, left for the menu or the game quits
+        if self.recording_end is not None:
+            self.save_recording(*self.recording_end)
+            self.recording_end = None
+    
+    def reset_game(self, start=True, seed=None):
+        self.save_practice_recording()
+        self.replay_actions = None
+        self.sim.reset(seed)
+        if self.record_dir:
+            self.recorder = Recorder(self.sim.seed)
+        self.run_start_tick = None
+        if self.history is not None:
+            self.history.clear()
+        if start:
+            self.sim.start()  # Automatically start a new game
+            self.run_start_tick = 1  # Already started, so the first step is the run's first
+            if self.recorder:
+                self.recorder.record(0, START)
         self.score_manager.reset()
-        self.bird.reset_position()
-        self.pipes.clear()
+        self.pending_action = NOOP
         self.ui.reset_death_animation()
-        self.death_time = 0
-        self.collision_point = None
-        self.has_added_death_particles = False
-        self.has_added_ground_particles = False
-        self.particle_manager = ParticleManager()  # Reset particles
+        self.particle_manager = ParticleManager(self.sim.make_rng("particles"))  # Reset particles
+        self.bird.save_previous()  # Nothing to interpolate from yet
+        self.background_step = 0
     
     def run(self):
         running = True
+        lag = 0.0
+        previous_time = time.perf_counter()
         while running:
+            now = time.perf_counter()
+            lag += now - previous_time
+            previous_time = now
+            self.profiler.begin_frame()
+            
             running = self.handle_events()
-            self.update()
+            self.profiler.lap("events")
+            
+            # Advance the game in fixed ticks so slow frames catch up instead of slowing gameplay
+            ticks = 0
+            while lag >= TICK_SECONDS and ticks < MAX_CATCH_UP_TICKS:
+                self.update()
+                lag -= TICK_SECONDS
+                ticks += 1
+            if lag >= TICK_SECONDS:
+                # Too far behind: drop the whole ticks left rather than spiral, but keep the part of a tick
+                # the frame is into, so interpolation carries on smoothly
+                self.pacing.dropped_ticks += int(lag // TICK_SECONDS)
+                lag %= TICK_SECONDS
+            
+            # Online, server ticks that piled up are played at once to stay close to the server
+            if self.client is not None:
+                while self.client.backlog() > NET_MAX_BUFFERED_FRAMES:
+                    self.update()
+            
+            # Draw the state part way from the previous tick to the latest by the leftover time
+            self.alpha = lag / TICK_SECONDS
             self.render()
+            self.profiler.mark("first_game_frame")
+            if self.profiler.enabled:
+                self.profiler.end_frame(self.particle_manager.live_count())
         
+        self.save_practice_recording()
+        self.score_manager.close()  # Wait for queued scores to be committed
         pygame.quit() 
\ No newline at end of file
@@ -0,0 +1,153 @@
+import os
+import sys
+import time
+import numpy as np
+import pygame
+from ..utils.constants import FPS, DEATH_DELAY_TICKS
+
+EXPORT_TAIL_TICKS = FPS  # Game over screen kept in the clip after it appears
+STRIP_THUMBNAIL_WIDTH = 120
+STRIP_COLUMNS = 10
+
+class FrameGrabber:
+    # One RGB buffer reused for every frame; `surface` draws into the same memory
+    def __init__(self, size):
+        width, height = size
+        self.pixels = np.empty((height, width, 3), dtype=np.uint8)  # Row-major, as image files and video tools expect
+        self.surface = pygame.image.frombuffer(self.pixels, size, "RGB")
+
+    def grab(self, window):
+        # SDL converts the window's pixel format straight into the buffer; a copy through
+        # surfarray.pixels3d's column-major view is about 8x slower
+        self.surface.blit(window, (0, 0))
+
+class PngSequenceSink:
+    # One numbered PNG per frame in a directory
+    name = "png"
+
+    def __init__(self, path, size, fps):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.frames = 0
+
+    def write(self, grabber):
+        self.frames += 1
+        pygame.image.save(grabber.surface, os.path.join(self.path, f"frame-{self.frames:06d}.png"))
+
+    def close(self):
+        return f"{self.frames} PNG files in {self.path}"
+
+class RawSink:
+    # Packed RGB24 frames back to back, to a file or stdout ("-") for ffmpeg -f rawvideo
+    name = "raw"
+
+    def __init__(self, path, size, fps):
+        self.path = path
+        self.size = size
+        self.fps = fps
+        self.file = sys.stdout.buffer if path == "-" else open(path, "wb")
+        self.frames = 0
+
+    def write(self, grabber):
+        self.file.write(grabber.pixels.data)  # The buffer itself, no bytes copy
+        self.frames += 1
+
+    def close(self):
+        if self.file is sys.stdout.buffer:
+            self.file.flush()
+        else:
+            self.file.close()
+        width, height = self.size
+        return (f"{self.frames} raw frames to {'stdout' if self.path == '-' else self.path} "
+                f"(ffmpeg -f rawvideo -pix_fmt rgb24 -s {width}x{height} -r {self.fps:g} -i ...)")
+
+class GifSink:
+    # Animated GIF through Pillow, which is only needed for this format
+    name = "gif"
+
+    def __init__(self, path, size, fps):
+        try:
+            from PIL import Image
+        except ImportError:
+            raise RuntimeError("GIF export needs Pillow (pip install pillow)") from None
+        self.image = Image
+        self.path = path
+        self.size = size
+        self.duration = round(1000 / fps)
+        self.frames = []  # Palette images, one byte per pixel
+
+    def write(self, grabber):
+        # Quantizing makes the image's own copy, so the shared buffer can be reused
+        self.frames.append(self.image.frombuffer("RGB", self.size, grabber.pixels, "raw", "RGB", 0, 1).quantize())
+
+    def close(self):
+        if self.frames:
+            self.frames[0].save(self.path, save_all=True, append_images=self.frames[1:],
+                                duration=self.duration, loop=0, optimize=False)
+        return f"{len(self.frames)} frames in {self.path}"
+
+class StripSink:
+    # Thumbnails of the frames tiled into one PNG, STRIP_COLUMNS to a row
+    name = "strip"
+
+    def __init__(self, path, size, fps):
+        width, height = size
+        self.path = path
+        self.thumbnail_size = (STRIP_THUMBNAIL_WIDTH, round(height * STRIP_THUMBNAIL_WIDTH / width))
+        self.thumbnails = []
+
+    def write(self, grabber):
+        self.thumbnails.append(pygame.transform.smoothscale(grabber.surface, self.thumbnail_size))
+
+    def close(self):
+        if not self.thumbnails:
+            return f"no frames for {self.path}"
+        width, height = self.thumbnail_size
+        columns = min(STRIP_COLUMNS, len(self.thumbnails))
+        rows = (len(self.thumbnails) + columns - 1) // columns
+        strip = pygame.Surface((columns * width, rows * height))
+        for i, thumbnail in enumerate(self.thumbnails):
+            strip.blit(thumbnail, ((i % columns) * width, (i // columns) * height))
+        pygame.image.save(strip, self.path)
+        return f"{len(self.thumbnails)} thumbnails in {self.path}"
+
+FRAME_SINKS = {sink.name: sink for sink in (PngSequenceSink, RawSink, GifSink, StripSink)}
+
+def export_run(game, sink, max_frames, fps=FPS, every=1):
+    """Render a run through `game` as fast as possible and write its frames to `sink`.
+
+    The game advances on simulated time, fps frames per second of play with
+    the usual interpolation between ticks, so the output matches a real-time
+    window. Every `every`-th frame goes to the sink. Export stops at
+    max_frames or once the game over screen has been shown for a second.
+
+    Returns (frames rendered, frames written, seconds spent rendering,
+    grabbing and writing).
+    """
+    grabber = FrameGrabber(game.window.get_size())
+    rendered = written = 0
+    render_seconds = grab_seconds = write_seconds = 0.0
+    sim = game.sim
+    while rendered < max_frames:
+        if game.ui.show_death_screen and sim.tick - sim.death_tick > DEATH_DELAY_TICKS + EXPORT_TAIL_TICKS:
+            break
+        # Frame n shows time n / fps, counted in whole numbers so long exports never drift
+        start = time.perf_counter()
+        for _ in range((rendered + 1) * FPS // fps - rendered * FPS // fps):
+            game.update()
+        game.alpha = (rendered + 1) * FPS % fps / fps
+        game.render()
+        pygame.event.pump()  # Keeps SDL's queue from filling up on long exports
+        rendered += 1
+        grabbed = time.perf_counter()
+        render_seconds += grabbed - start
+        if (rendered - 1) % every:
+            continue
+
+        grabber.grab(game.window)
+        written_at = time.perf_counter()
+        grab_seconds += written_at - grabbed
+        sink.write(grabber)
+        written += 1
+        write_seconds += time.perf_counter() - written_at
+    return rendered, written, render_seconds, grab_seconds, write_seconds
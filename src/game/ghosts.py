@@ -0,0 +1,83 @@
+import numpy as np
+import pygame
+from ..sim.batch import BIRD_X, BIRD_START_Y
+from ..sim.replay import trajectories
+from ..utils.constants import GHOST_ALPHA
+
+class GhostLayer:
+    """Translucent birds of recorded runs, raced alongside the live bird.
+
+    Every ghost's height and tilt per tick since its run left the menu are
+    precomputed in one batch simulation. A frame looks up the row for the live
+    run's tick for all ghosts at once with NumPy, interpolates towards it like
+    the live bird, maps tilts to one shared set of translucent, run-length
+    encoded rotation frames and draws every ghost with a single Surface.blits
+    call. Ghosts vanish on the tick their run ended.
+    """
+
+    def __init__(self, atlas, replays, alpha=GHOST_ALPHA):
+        self.atlas = atlas
+        self.frames = [frame.copy() for frame, _ in atlas.frames]
+        for frame in self.frames:
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)  # Fade the frame's own alpha
+            # Run-length encoded frames skip their transparent pixels when blitted: about 3x faster
+            frame.set_alpha(255, pygame.RLEACCEL)
+        offsets = np.array([offset for _, offset in atlas.frames], dtype=np.int64).reshape(-1, 2)
+        self.offset_x = offsets[:, 0] + BIRD_X
+        self.offset_y = offsets[:, 1]
+        sizes = np.array([frame.get_size() for frame in self.frames], dtype=np.int64).reshape(-1, 2)
+        self.width = sizes[:, 0]
+        self.height = sizes[:, 1]
+
+        self.y, self.tilt, self.lengths = trajectories(replays)
+        self.count = len(replays)
+        self.key = None  # (tick, alpha) the draw list was built for
+        self.blit_list = []
+        self.rect = None  # Screen area the ghosts of the current draw list cover
+
+    def prepare(self, tick, alpha=1.0):
+        # Build the (frame, position) list for `tick` ticks into the run, part way from the tick before by alpha
+        key = (tick, alpha)
+        if key == self.key:
+            return
+        self.key = key
+        self.blit_list = []
+        self.rect = None
+        if tick < 0 or tick >= len(self.y):
+            return
+        alive = np.flatnonzero(self.lengths > tick)
+        if alive.size == 0:
+            return
+
+        y = self.y[tick, alive]
+        tilt = self.tilt[tick, alive]
+        if alpha < 1:
+            if tick > 0:
+                previous_y = self.y[tick - 1, alive]
+                previous_tilt = self.tilt[tick - 1, alive]
+            else:
+                previous_y = BIRD_START_Y
+                previous_tilt = 0.0
+            y = previous_y + (y - previous_y) * alpha
+            tilt = previous_tilt + (tilt - previous_tilt) * alpha
+
+        # RotationAtlas.index and pixel_round for every ghost at once; heights never go below zero
+        atlas = self.atlas
+        index = np.rint((np.clip(tilt, atlas.min_angle, atlas.max_angle) - atlas.min_angle) / atlas.step).astype(np.int64)
+        left = self.offset_x[index]
+        top = np.floor(y + 0.5).astype(np.int64) + self.offset_y[index]
+        frames = self.frames
+        self.blit_list = [(frames[i], (x, y)) for i, x, y in zip(index.tolist(), left.tolist(), top.tolist())]
+        right = left + self.width[index]
+        bottom = top + self.height[index]
+        self.rect = pygame.Rect(int(left.min()), int(top.min()),
+                                int(right.max() - left.min()), int(bottom.max() - top.min()))
+
+    def draw(self, window, tick, alpha=1.0):
+        self.prepare(tick, alpha)
+        if self.blit_list:
+            window.blits(self.blit_list, doreturn=False)
+
+    def get_rect(self, tick, alpha=1.0):
+        self.prepare(tick, alpha)
+        return self.rect
@@ -0,0 +1,81 @@
+import pygame
+from collections import OrderedDict
+from ..utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, GROUND_COLOR, GROUND_HEIGHT
+
+PRERENDERED_LAYERS = 8  # Static screens kept prerendered (menu plus recent game over panels)
+
+class LayerCompositor:
+    """Builds the static layers of the scene once and draws each with a single blit.
+
+    The scrolling background is one strip holding the image twice, the ground is
+    a prerendered bar, the fade overlay is one black surface whose alpha changes,
+    and static screen content (menu, game over panel) is prerendered on demand.
+    """
+
+    def __init__(self, window, background):
+        self.window = window
+
+        # Background twice side by side, so any scroll offset is one blit of a window-sized area
+        self.background_strip = pygame.Surface((WINDOW_WIDTH * 2, WINDOW_HEIGHT))
+        self.background_strip.blit(background, (0, 0))
+        self.background_strip.blit(background, (WINDOW_WIDTH, 0))
+        self.background_area = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+
+        self.ground = pygame.Surface((WINDOW_WIDTH, GROUND_HEIGHT))
+        self.ground.fill(GROUND_COLOR)
+        self.ground_position = (0, WINDOW_HEIGHT - GROUND_HEIGHT)
+
+        self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.overlay.fill((0, 0, 0))
+        self.overlay_alpha = None
+
+        if pygame.display.get_surface() is not None:
+            self.background_strip = self.background_strip.convert()
+            self.ground = self.ground.convert()
+            self.overlay = self.overlay.convert()
+
+        self.layers = OrderedDict()
+
+    def draw_background(self, background_x):
+        # background_x scrolls from 0 to -WINDOW_WIDTH
+        self.background_area.x = -background_x
+        self.window.blit(self.background_strip, (0, 0), self.background_area)
+
+    def draw_ground(self):
+        self.window.blit(self.ground, self.ground_position)
+
+    def draw_fade(self, alpha):
+        # Darken the whole window; nothing to do while fully transparent
+        if alpha <= 0:
+            return
+        if alpha != self.overlay_alpha:
+            self.overlay.set_alpha(alpha)
+            self.overlay_alpha = alpha
+        self.window.blit(self.overlay, (0, 0))
+
+    def draw_layer(self, key, build, opaque=False):
+        # Blit the static layer for key, building it with build(surface) the first time
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = self.prerender(build, opaque)
+            self.layers[key] = layer
+            if len(self.layers) > PRERENDERED_LAYERS:
+                self.layers.popitem(last=False)
+        else:
+            self.layers.move_to_end(key)
+        surface, position = layer
+        self.window.blit(surface, position)
+
+    def prerender(self, build, opaque):
+        if opaque:
+            surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            build(surface)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            return surface, (0, 0)
+
+        # Transparent layers are cropped to their visible pixels so blits stay small
+        surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        build(surface)
+        bounds = surface.get_bounding_rect()
+        return surface.subsurface(bounds).copy(), bounds.topleft
@@ -0,0 +1,138 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+LEADERBOARD_FILE = "leaderboard.db"
+LEGACY_HIGHSCORE_FILE = "highscore.txt"
+DEFAULT_PLAYER = "player"
+BATCH_SECONDS = 0.25  # The writer waits this long for more runs before committing a batch
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    seed INTEGER,
+    score INTEGER NOT NULL,
+    ticks INTEGER,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_player ON runs (player, score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_seed ON runs (seed, score DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+class Leaderboard:
+    """Finished runs in a local SQLite database, written by a background thread.
+
+    submit() only queues the run, so the game loop never waits on the disk. The
+    writer commits queued runs in batches, each in one transaction, so a crash
+    loses at most the runs not yet committed and never leaves a partial write.
+    Queries open their own connection and are meant for startup and tools, not
+    for every frame.
+    """
+
+    def __init__(self, path=LEADERBOARD_FILE, legacy_file=LEGACY_HIGHSCORE_FILE):
+        self.path = path
+        with closing(self.connect()) as connection, connection:
+            connection.executescript(SCHEMA)
+            connection.execute("INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+            self.migrate_legacy(connection, legacy_file)
+
+        self.queue = queue.Queue()
+        self.errors = 0  # Batches that failed to commit
+        self.writer = threading.Thread(target=self.write_loop, name="leaderboard-writer", daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.execute("PRAGMA journal_mode=WAL")  # Readers never block the writer
+        return connection
+
+    def migrate_legacy(self, connection, legacy_file):
+        # Import the old single high score once, as a run with unknown seed
+        if legacy_file is None or connection.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+            return
+        try:
+            with open(legacy_file, "r") as f:
+                score = int(f.read())
+            finished_at = os.path.getmtime(legacy_file)
+        except (OSError, ValueError):
+            score = 0
+        if score > 0:
+            connection.execute(
+                "INSERT INTO runs (player, seed, score, ticks, finished_at) VALUES (?, NULL, ?, NULL, ?)",
+                (DEFAULT_PLAYER, score, finished_at)
+            )
+        connection.execute("INSERT INTO meta VALUES ('legacy_imported', ?)", (legacy_file,))
+
+    def submit(self, player, score, seed=None, ticks=None, finished_at=None):
+        self.queue.put((player, seed, score, ticks, finished_at if finished_at is not None else time.time()))
+
+    def write_loop(self):
+        connection = self.connect()
+        running = True
+        while running:
+            batch = [self.queue.get()]
+
+            # Gather whatever else arrives shortly, then commit it all at once
+            deadline = time.monotonic() + BATCH_SECONDS
+            while batch[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            if batch[-1] is None:  # close() was called
+                batch.pop()
+                running = False
+            if batch:
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO runs (player, seed, score, ticks, finished_at) VALUES (?, ?, ?, ?, ?)",
+                            batch
+                        )
+                except sqlite3.Error:
+                    self.errors += 1
+        connection.close()
+
+    def close(self):
+        # Commit everything queued so far and stop the writer
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+
+    def query(self, sql, parameters=()):
+        with closing(self.connect()) as connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    def best_score(self, player=DEFAULT_PLAYER):
+        return self.query("SELECT COALESCE(MAX(score), 0) FROM runs WHERE player = ?", (player,))[0][0]
+
+    def top_scores(self, player=DEFAULT_PLAYER, limit=10):
+        # (score, seed, ticks, finished_at) of the player's best runs
+        return self.query(
+            "SELECT score, seed, ticks, finished_at FROM runs WHERE player = ? ORDER BY score DESC, finished_at LIMIT ?",
+            (player, limit)
+        )
+
+    def seed_bests(self, limit=10):
+        # (seed, best score, player who set it) for the seeds with the highest bests
+        return self.query(
+            "SELECT seed, MAX(score), player FROM runs WHERE seed IS NOT NULL "
+            "GROUP BY seed ORDER BY MAX(score) DESC LIMIT ?",
+            (limit,)
+        )
+
+    def best_for_seed(self, seed):
+        return self.query("SELECT COALESCE(MAX(score), 0) FROM runs WHERE seed = ?", (seed,))[0][0]
@@ -0,0 +1,24 @@
+import pygame
+from ..utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, SCORE_COLOR, BUTTON_COLOR, PIPE_COLOR
+
+LOADING_BACKGROUND = (0, 153, 204)  # The background image's sky
+BAR_WIDTH = 300
+BAR_HEIGHT = 16
+
+class LoadingScreen:
+    # Shown while assets load; the bundled default font needs no system font scan, so the first frame is immediate
+    def __init__(self, window):
+        self.window = window
+        self.font = pygame.font.Font(None, 48)
+        self.title = self.font.render("Loading...", True, SCORE_COLOR)
+        self.bar = pygame.Rect(0, 0, BAR_WIDTH, BAR_HEIGHT)
+        self.bar.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 40)
+
+    def draw(self, progress):
+        self.window.fill(LOADING_BACKGROUND)
+        self.window.blit(self.title, self.title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20)))
+        pygame.draw.rect(self.window, BUTTON_COLOR, self.bar)
+        filled = self.bar.copy()
+        filled.width = int(self.bar.width * min(max(progress, 0), 1))
+        pygame.draw.rect(self.window, PIPE_COLOR, filled)
+        pygame.display.flip()
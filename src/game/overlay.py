@@ -0,0 +1,64 @@
+import pygame
+from ..utils.constants import WINDOW_WIDTH
+from ..utils.profiler import STARTUP_MILESTONES
+
+OVERLAY_REFRESH_SECONDS = 0.5  # Numbers change slowly enough to read
+OVERLAY_MARGIN = 10
+OVERLAY_COLOR = (255, 255, 255)
+OVERLAY_BACKGROUND = (0, 0, 0, 160)
+
+class ProfilerOverlay:
+    # Top-right panel with the profiler's recent averages, rebuilt a couple of times a second
+    def __init__(self, profiler, pacing=None, font=None):
+        self.profiler = profiler
+        self.pacing = pacing
+        self.font = font if font is not None else pygame.font.Font(None, 20)  # Bundled font, no system font scan
+        self.surface = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.version = 0  # Changes whenever the panel is rebuilt
+        self.built_at = None
+
+    def refresh(self, now):
+        if self.built_at is not None and now - self.built_at < OVERLAY_REFRESH_SECONDS:
+            return
+        stats = self.profiler.stats()
+        if stats is None:
+            return
+        self.built_at = now
+
+        rows = [
+            ("fps", f"{stats['fps']:.1f}"),
+            ("frame", f"{stats['frame_ms']:.2f} ms"),
+            ("p50 / p95 / p99", f"{stats['p50_ms']:.1f} / {stats['p95_ms']:.1f} / {stats['p99_ms']:.1f} ms"),
+            ("particles", str(stats["particles"])),
+        ]
+        rows += [(milestone.replace("_", " "), f"{self.profiler.startup[milestone] * 1000:.0f} ms")
+                 for milestone in STARTUP_MILESTONES if milestone in self.profiler.startup]
+        if self.pacing is not None:
+            rows += [
+                ("jitter", f"{self.pacing.jitter() * 1000:.2f} ms"),
+                ("missed frames", str(self.pacing.missed)),
+                ("dropped ticks", str(self.pacing.dropped_ticks)),
+            ]
+        rows += [(phase, f"{ms:.3f} ms") for phase, ms in stats["phases_ms"].items()]
+
+        # Text changes every rebuild, so it is rendered directly instead of through the text cache
+        rendered = [(self.font.render(label, True, OVERLAY_COLOR), self.font.render(value, True, OVERLAY_COLOR))
+                    for label, value in rows]
+        label_width = max(label.get_width() for label, _ in rendered)
+        value_width = max(value.get_width() for _, value in rendered)
+        line_height = self.font.get_linesize()
+        width = label_width + value_width + 3 * OVERLAY_MARGIN
+        height = line_height * len(rendered) + 2 * OVERLAY_MARGIN
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.surface.fill(OVERLAY_BACKGROUND)
+        for i, (label, value) in enumerate(rendered):
+            y = OVERLAY_MARGIN + i * line_height
+            self.surface.blit(label, (OVERLAY_MARGIN, y))
+            self.surface.blit(value, (width - OVERLAY_MARGIN - value.get_width(), y))  # Right-aligned numbers
+        self.rect = self.surface.get_rect(topright=(WINDOW_WIDTH - OVERLAY_MARGIN, OVERLAY_MARGIN))
+        self.version += 1
+
+    def draw(self, window):
+        if self.surface is not None:
+            window.blit(self.surface, self.rect)
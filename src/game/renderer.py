@@ -0,0 +1,101 @@
+import pygame
+from ..utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+
+SCREEN_AREA = WINDOW_WIDTH * WINDOW_HEIGHT
+FULL_REDRAW_FRACTION = 0.5  # Redraw everything once dirty areas cover this much of the screen
+
+class FullRenderer:
+    # Redraws the whole scene and pushes the whole window every frame
+    name = "full"
+
+    def __init__(self, window):
+        self.window = window
+        self.frames = 0
+        self.pixels = 0  # Pixels redrawn and sent to the display, summed over all frames
+
+    def present(self, scene):
+        scene.draw_scene()
+        pygame.display.update()
+        self.frames += 1
+        self.pixels += SCREEN_AREA
+
+    def pixels_per_frame(self):
+        return self.pixels / max(1, self.frames)
+
+    def summary(self):
+        per_frame = self.pixels_per_frame()
+        return (f"{self.name} renderer: {self.frames} frames, {per_frame:,.0f} px/frame "
+                f"({per_frame / SCREEN_AREA:.1%} of the window)")
+
+class DirtyRectRenderer(FullRenderer):
+    """Redraws only the parts of the window that changed since the last frame.
+
+    The scene reports a key for everything that affects the whole window
+    (scrolling, game state, overlay fade, score, button hover) and a rect plus
+    change token for each moving item (bird, particles). While the key holds,
+    only the old and new rects of changed items are redrawn, by replaying the
+    normal draw calls clipped to each rect, and only those rects are sent to
+    the display.
+    """
+    name = "dirty"
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.scene_key = None
+        self.items = {}
+
+    def present(self, scene):
+        key = scene.get_scene_key()
+        items = scene.get_dynamic_items()
+        dirty = None if key != self.scene_key else self.collect_dirty(items)
+        self.scene_key = key
+        self.items = items
+
+        if dirty is None or sum(rect.width * rect.height for rect in dirty) > SCREEN_AREA * FULL_REDRAW_FRACTION:
+            super().present(scene)
+            return
+
+        for rect in dirty:
+            self.window.set_clip(rect)
+            scene.draw_scene()
+        self.window.set_clip(None)
+        if dirty:
+            pygame.display.update(dirty)
+        self.frames += 1
+        self.pixels += sum(rect.width * rect.height for rect in dirty)
+
+    def collect_dirty(self, items):
+        screen = self.window.get_rect()
+        rects = []
+        for name in items.keys() | self.items.keys():
+            new = items.get(name)
+            old = self.items.get(name)
+            if new == old:
+                continue
+            for item in (old, new):
+                if item is not None:
+                    rect = item[0].clip(screen)
+                    if rect.width and rect.height:
+                        rects.append(rect)
+        return merge_rects(rects)
+
+def merge_rects(rects):
+    # Union overlapping rects so shared pixels are only redrawn once
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        changed = True
+        while changed:
+            changed = False
+            for i, other in enumerate(merged):
+                if rect.colliderect(other):
+                    rect.union_ip(merged.pop(i))
+                    changed = True
+                    break
+        merged.append(rect)
+    return merged
+
+RENDERERS = {
+    FullRenderer.name: FullRenderer,
+    DirtyRectRenderer.name: DirtyRectRenderer,
+}
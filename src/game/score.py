@@ -1,32 +1,46 @@
+from .leaderboard import DEFAULT_PLAYER
+
 class ScoreManager:
-    def __init__(self, highscore_file="highscore.txt"):
+    def __init__(self, leaderboard=None, player=DEFAULT_PLAYER):
         self.score = 0
-        self.highscore_file = highscore_file
+        self.leaderboard = leaderboard  # Where finished runs are saved; None keeps scores in memory only
+        self.player = player
         self.high_score = self.load_high_score()
+        self.beat_high_score = False
     
     def increment(self):
         self.score += 1
         
     def reset(self):
         self.score = 0
+        self.beat_high_score = False
+        
+    def snapshot(self):
+        # The high score is left alone: it only changes when a run is finished for good
+        return (self.score, self.beat_high_score)
+    
+    def restore(self, snapshot):
+        self.score, self.beat_high_score = snapshot
         
     def load_high_score(self):
-        try:
-            with open(self.highscore_file, "r") as f:
-                return int(f.read())
-        except (FileNotFoundError, ValueError):
+        # Read once at startup; the game loop only uses the in-memory value
+        if self.leaderboard is None:
             return 0
+        return self.leaderboard.best_score(self.player)
     
-    def save_high_score(self):
-        if self.score > self.high_score:
+    def finish_run(self, seed=None, ticks=None):
+        # Called once when a run ends; saving happens on the leaderboard's writer thread
+        self.beat_high_score = self.score > self.high_score
+        if self.beat_high_score:
             self.high_score = self.score
-            try:
-                with open(self.highscore_file, "w") as f:
-                    f.write(str(self.score))
-                return True
-            except Exception:
-                return False
-        return False
+        if self.leaderboard is not None:
+            self.leaderboard.submit(self.player, self.score, seed, ticks)
+        return self.beat_high_score
     
     def is_new_high_score(self):
-        return self.score > self.high_score 
\ No newline at end of file
+        # Only runs passed to finish_run count; replays, autopilot and practice runs never are
+        return self.beat_high_score
+    
+    def close(self):
+        if self.leaderboard is not None:
+            self.leaderboard.close()
@@ -17,6 +17,12 @@ class GameState:
     def bird_hit_ground(self):
         self.is_bird_falling = False
     
+    def snapshot(self):
+        return (self.is_game_over, self.is_game_started, self.is_bird_falling)
+    
+    def restore(self, snapshot):
+        self.is_game_over, self.is_game_started, self.is_bird_falling = snapshot
+    
     def reset(self):
         self.is_game_over = False
         self.is_game_started = False
@@ -1,13 +1,16 @@
 import pygame
 from ..components.button import Button
+from ..utils.text_cache import text_cache as default_text_cache
 from ..utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, BUTTON_COLOR, BUTTON_HOVER_COLOR, SCORE_COLOR, GROUND_COLOR, GROUND_HEIGHT
 
 class UI:
-    def __init__(self, window, font):
+    def __init__(self, window, font, text_cache=None, layers=None, large_font=None, medium_font=None):
         self.window = window
         self.font = font
-        self.large_font = pygame.font.SysFont(None, 72)  # Larger font for titles
-        self.medium_font = pygame.font.SysFont(None, 48)  # Medium font for subtitles
+        self.layers = layers  # LayerCompositor for prerendered screens, if any
+        self.text_cache = text_cache if text_cache is not None else default_text_cache
+        self.large_font = large_font if large_font is not None else pygame.font.SysFont(None, 72)  # Larger font for titles
+        self.medium_font = medium_font if medium_font is not None else pygame.font.SysFont(None, 48)  # Medium font for subtitles
         
         # Create buttons
         self.start_button = Button(
@@ -18,7 +21,21 @@ class UI:
             50, 
             BUTTON_COLOR, 
             BUTTON_HOVER_COLOR,
-            font
+            font,
+            self.text_cache
+        )
+        
+        # Hands the bird to the search-based autopilot
+        self.autopilot_button = Button(
+            "Autopilot", 
+            WINDOW_WIDTH // 2 - 70, 
+            WINDOW_HEIGHT // 2 + 45, 
+            140, 
+            50, 
+            BUTTON_COLOR, 
+            BUTTON_HOVER_COLOR,
+            font,
+            self.text_cache
         )
         
         # Game over buttons
@@ -30,7 +47,8 @@ class UI:
             50, 
             BUTTON_COLOR, 
             BUTTON_HOVER_COLOR,
-            font
+            font,
+            self.text_cache
         )
         
         self.menu_button = Button(
@@ -41,7 +59,8 @@ class UI:
             50, 
             BUTTON_COLOR, 
             BUTTON_HOVER_COLOR,
-            font
+            font,
+            self.text_cache
         )
         
         # Death animation properties
@@ -49,40 +68,70 @@ class UI:
         self.show_death_screen = False
     
     def draw_main_menu(self, background_image):
+        # Background and title never change, so they come prerendered when possible
+        if self.layers is not None:
+            self.layers.draw_layer(
+                "main_menu",
+                lambda surface: self.draw_main_menu_background(surface, background_image),
+                opaque=True
+            )
+        else:
+            self.draw_main_menu_background(self.window, background_image)
+        
+        # Draw start and autopilot buttons
+        self.start_button.draw(self.window)
+        self.autopilot_button.draw(self.window)
+    
+    def draw_main_menu_background(self, surface, background_image):
         # Draw background
-        self.window.blit(background_image, (0, 0))
+        surface.blit(background_image, (0, 0))
         
         # Draw title
-        title_text = self.large_font.render("Flappy Bird", True, SCORE_COLOR)
+        title_text = self.text_cache.render(self.large_font, "Flappy Bird", True, SCORE_COLOR)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
-        self.window.blit(title_text, title_rect)
-        
-        # Draw start button
-        self.start_button.draw(self.window)
+        surface.blit(title_text, title_rect)
     
     def draw_game_over(self, score, is_new_high_score=False, high_score=0):
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, min(self.fade_alpha, 180)))  # Semi-transparent black
-        self.window.blit(overlay, (0, 0))
+        # Semi-transparent overlay
+        alpha = min(self.fade_alpha, 180)
+        if self.layers is not None:
+            self.layers.draw_fade(alpha)
+        else:
+            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))  # Semi-transparent black
+            self.window.blit(overlay, (0, 0))
         
         if not self.show_death_screen:
             return
         
+        # Texts only change with the score, so the panel is prerendered per result
+        if self.layers is not None:
+            self.layers.draw_layer(
+                ("game_over", score, is_new_high_score, high_score),
+                lambda surface: self.draw_game_over_text(surface, score, is_new_high_score, high_score)
+            )
+        else:
+            self.draw_game_over_text(self.window, score, is_new_high_score, high_score)
+        
+        # Draw buttons
+        self.restart_button.draw(self.window)
+        self.menu_button.draw(self.window)
+    
+    def draw_game_over_text(self, surface, score, is_new_high_score, high_score):
         # Draw "Game Over" text with shadow effect
-        game_over_text = self.large_font.render("Game Over", True, (200, 0, 0))  # Red text
-        shadow_text = self.large_font.render("Game Over", True, (0, 0, 0))  # Black shadow
+        game_over_text = self.text_cache.render(self.large_font, "Game Over", True, (200, 0, 0))  # Red text
+        shadow_text = self.text_cache.render(self.large_font, "Game Over", True, (0, 0, 0))  # Black shadow
         
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3 - 30))
         shadow_rect = shadow_text.get_rect(center=(WINDOW_WIDTH // 2 + 3, WINDOW_HEIGHT // 3 - 27))  # Offset shadow
         
-        self.window.blit(shadow_text, shadow_rect)  # Draw shadow first
-        self.window.blit(game_over_text, game_over_rect)  # Draw text on top
+        surface.blit(shadow_text, shadow_rect)  # Draw shadow first
+        surface.blit(game_over_text, game_over_rect)  # Draw text on top
         
         # Add a decorative line under "Game Over"
         line_y = game_over_rect.bottom + 10
         pygame.draw.line(
-            self.window,
+            surface,
             (150, 0, 0),  # Darker red
             (WINDOW_WIDTH // 2 - 100, line_y),
             (WINDOW_WIDTH // 2 + 100, line_y),
@@ -90,28 +139,24 @@ class UI:
         )
         
         # Draw score with glow effect
-        score_text = self.medium_font.render(f"Score: {score}", True, SCORE_COLOR)
+        score_text = self.text_cache.render(self.medium_font, f"Score: {score}", True, SCORE_COLOR)
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20))
-        self.window.blit(score_text, score_rect)
+        surface.blit(score_text, score_rect)
         
         # Draw high score
         if is_new_high_score:
-            high_score_text = self.medium_font.render(f"New High Score!", True, (255, 215, 0))  # Gold color
+            high_score_text = self.text_cache.render(self.medium_font, f"New High Score!", True, (255, 215, 0))  # Gold color
             high_score_rect = high_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
-            self.window.blit(high_score_text, high_score_rect)
+            surface.blit(high_score_text, high_score_rect)
         else:
-            high_score_text = self.font.render(f"High Score: {high_score}", True, SCORE_COLOR)
+            high_score_text = self.text_cache.render(self.font, f"High Score: {high_score}", True, SCORE_COLOR)
             high_score_rect = high_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
-            self.window.blit(high_score_text, high_score_rect)
+            surface.blit(high_score_text, high_score_rect)
         
         # Draw restart button with a small label above
-        restart_label = self.font.render("Try Again?", True, SCORE_COLOR)
+        restart_label = self.text_cache.render(self.font, "Try Again?", True, SCORE_COLOR)
         restart_label_rect = restart_label.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 70))
-        self.window.blit(restart_label, restart_label_rect)
-        
-        # Draw buttons
-        self.restart_button.draw(self.window)
-        self.menu_button.draw(self.window)
+        surface.blit(restart_label, restart_label_rect)
     
     def update_death_animation(self, bird_on_ground):
         # If bird hits ground, start fading in the overlay
@@ -127,16 +172,25 @@ class UI:
         self.fade_alpha = 0
         self.show_death_screen = False
     
+    def snapshot(self):
+        return (self.fade_alpha, self.show_death_screen)
+    
+    def restore(self, snapshot):
+        self.fade_alpha, self.show_death_screen = snapshot
+    
     def draw_score(self, score, high_score):
         # Draw current score
-        score_text = self.font.render(f"Score: {score}", True, SCORE_COLOR)
+        score_text = self.text_cache.render(self.font, f"Score: {score}", True, SCORE_COLOR)
         self.window.blit(score_text, (10, 10))
         
         # Draw high score
-        high_score_text = self.font.render(f"High Score: {high_score}", True, SCORE_COLOR)
+        high_score_text = self.text_cache.render(self.font, f"High Score: {high_score}", True, SCORE_COLOR)
         self.window.blit(high_score_text, (10, 50))
     
     def draw_ground(self):
+        if self.layers is not None:
+            self.layers.draw_ground()
+            return
         pygame.draw.rect(
             self.window, 
             GROUND_COLOR, 
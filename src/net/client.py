@@ -0,0 +1,119 @@
+import socket
+import threading
+from collections import deque
+from ..sim.simulation import EVENT_PIPE_HIT
+from ..utils.constants import NET_CORRECTION_TOLERANCE
+from .protocol import Welcome, ProtocolError, encode_hello, encode_input, decode_server_message, split_messages
+
+RECEIVE_BYTES = 65536
+
+class NetClient:
+    """Connection from GameController to a MatchServer room.
+
+    The constructor opens the room and waits for its seed. A reader thread
+    then queues the server's messages, and the game takes one FRAME per tick
+    with poll(), replays its action on its own Simulation and calls correct()
+    to pull that copy back to the server's state if it ever drifts.
+    """
+
+    def __init__(self, host, port, seed=None, timeout=5.0):
+        self.socket = socket.create_connection((host, port), timeout)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Inputs are single small writes
+        self.buffer = bytearray()
+        self.messages = deque()  # Appended by the reader thread, popped by the game loop
+        self.socket.sendall(encode_hello(seed))
+        welcome = None
+        while welcome is None:
+            for message in self.receive():
+                if welcome is None and isinstance(message, Welcome):
+                    welcome = message
+                else:
+                    self.messages.append(message)
+        self.socket.settimeout(None)
+        self.room = welcome.room
+        self.seed = welcome.seed
+        self.connected = True
+        self.frames = 0
+        self.corrections = 0  # Ticks where the local game had drifted from the server's
+        self.reader = threading.Thread(target=self.read_loop, name="net-reader", daemon=True)
+        self.reader.start()
+
+    def receive(self):
+        data = self.socket.recv(RECEIVE_BYTES)
+        if not data:
+            raise ConnectionError("server closed the connection")
+        self.buffer += data
+        return [decode_server_message(message_type, body) for message_type, body in split_messages(self.buffer)]
+
+    def read_loop(self):
+        try:
+            while True:
+                self.messages.extend(self.receive())
+        except (OSError, ProtocolError):
+            pass
+        finally:
+            self.connected = False
+
+    def send(self, action):
+        try:
+            self.socket.sendall(encode_input(action))
+        except OSError:
+            self.connected = False
+
+    def poll(self):
+        # Oldest unread message, or None
+        return self.messages.popleft() if self.messages else None
+
+    def backlog(self):
+        return len(self.messages)
+
+    def correct(self, sim, frame):
+        # Make sim match the server after stepping it through frame; returns how many fields were off
+        self.frames += 1
+        fixed = 0
+        bird = sim.bird
+        if frame.bird is not None:
+            y, velocity, tilt = frame.bird
+            if max(abs(bird.y - y), abs(bird.velocity - velocity), abs(bird.tilt - tilt)) > NET_CORRECTION_TOLERANCE:
+                bird.y, bird.velocity, bird.tilt = y, velocity, tilt
+                fixed += 1
+        if frame.pipe_gap is not None and sim.pipes.count:
+            pipe = sim.pipes.active[-1]
+            if pipe.gap_height != frame.pipe_gap:
+                pipe.reset(pipe.x, frame.pipe_gap)
+                fixed += 1
+        if frame.score is not None and sim.score != frame.score:
+            sim.score = frame.score
+            fixed += 1
+        game_state = sim.game_state
+        if frame.started and not game_state.is_game_started:
+            game_state.start_game()
+            fixed += 1
+        if frame.over and not game_state.is_game_over:
+            game_state.end_game()
+            bird.is_dead = True
+            fixed += 1
+        if frame.death is not None:
+            cause, point = frame.death
+            if sim.death_cause != cause or sim.collision_point != point:
+                sim.death_cause = cause
+                sim.collision_point = point
+                # A pipe hit the local game missed still gets its impact particles
+                if point is not None and not sim.has_added_death_particles:
+                    sim.events.append((EVENT_PIPE_HIT, point[0], point[1]))
+                    sim.has_added_death_particles = True
+                fixed += 1
+        self.corrections += fixed > 0
+        return fixed
+
+    def close(self):
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+        self.reader.join(timeout=1.0)
+
+    def summary(self):
+        state = "connected" if self.connected else "disconnected"
+        return f"net client: room {self.room} ({state}), {self.frames:,} server ticks, {self.corrections} corrected"
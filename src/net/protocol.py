@@ -0,0 +1,158 @@
+import struct
+from collections import namedtuple
+from ..sim.simulation import DEATH_UPPER_PIPE, DEATH_LOWER_PIPE, DEATH_GROUND
+
+# Every message is one length byte, then a type byte and its fields (little endian):
+#   client -> server
+#     HELLO  seed as int64, -1 for a random one, otherwise below SEED_LIMIT; opens a room on this connection
+#     INPUT  action byte: a Simulation action (JUMP, START) or RESTART/MENU, applied on the next tick
+#     STATS  no fields; asks for the server's tick statistics
+#   server -> client
+#     WELCOME  room id uint32, seed uint32
+#     RESET    seed uint32, started byte; the room went back to a new run
+#     FRAME    tick uint32, action byte, field mask byte, then the fields in the mask, in order:
+#              bird y and velocity as float32 and tilt as float16, new pipe gap int16, score uint32,
+#              death cause byte and collision point as two int16 (only on the tick the game ends)
+#     STATS    rooms uint32, ticks uint32, late ticks uint32, mean and p99 busy seconds per tick float32
+MSG_HELLO = 1
+MSG_INPUT = 2
+MSG_STATS = 3
+MSG_WELCOME = 4
+MSG_RESET = 5
+MSG_FRAME = 6
+
+# Inputs besides Simulation's actions
+RESTART = 3  # New run, started right away (R or Restart on the game over screen)
+MENU = 4  # New run, waiting on the main menu
+
+# FRAME field mask; the two state bits carry no fields
+FRAME_STARTED = 1
+FRAME_OVER = 2
+FRAME_BIRD = 4  # Only sent when the bird moved or turned
+FRAME_PIPE = 8  # Only sent on the tick a pipe spawns
+FRAME_SCORE = 16  # Only sent when the score changed
+FRAME_DEATH = 32  # Only sent on the tick the game ends
+
+# Death causes by their code in a FRAME; only pipe deaths have a collision point
+DEATH_CAUSES = (DEATH_UPPER_PIPE, DEATH_LOWER_PIPE, DEATH_GROUND)
+
+SEED_LIMIT = 2 ** 32  # Seeds travel as uint32 in WELCOME and RESET, the range Simulation draws them from
+
+HEADER = struct.Struct("<BB")  # Length, type
+HELLO = struct.Struct("<q")
+INPUT = struct.Struct("<B")
+WELCOME = struct.Struct("<II")
+RESET = struct.Struct("<IB")
+FRAME = struct.Struct("<IBB")
+FRAME_BIRD_FIELDS = struct.Struct("<ffe")
+FRAME_PIPE_FIELDS = struct.Struct("<h")
+FRAME_SCORE_FIELDS = struct.Struct("<I")
+FRAME_DEATH_FIELDS = struct.Struct("<Bhh")
+STATS = struct.Struct("<IIIff")
+
+Welcome = namedtuple("Welcome", ["room", "seed"])
+Reset = namedtuple("Reset", ["seed", "started"])
+# bird: (y, velocity, tilt) or None; death: (cause, collision point or None) or None
+Frame = namedtuple("Frame", ["tick", "action", "started", "over", "bird", "pipe_gap", "score", "death"])
+Stats = namedtuple("Stats", ["rooms", "ticks", "late_ticks", "mean_busy", "p99_busy"])
+
+class ProtocolError(ValueError):
+    pass
+
+def pack(message_type, body=b""):
+    return bytes((len(body) + 1, message_type)) + body
+
+def encode_hello(seed=None):
+    return pack(MSG_HELLO, HELLO.pack(-1 if seed is None else seed))
+
+def decode_hello(body):
+    # Seed the client asked for, or None for a random one
+    seed, = HELLO.unpack(body)
+    if seed == -1:
+        return None
+    if not 0 <= seed < SEED_LIMIT:
+        raise ProtocolError(f"seed {seed} out of range")
+    return seed
+
+def encode_input(action):
+    return pack(MSG_INPUT, INPUT.pack(action))
+
+def encode_stats_request():
+    return pack(MSG_STATS)
+
+def encode_welcome(room, seed):
+    return pack(MSG_WELCOME, WELCOME.pack(room, seed))
+
+def encode_reset(seed, started):
+    return pack(MSG_RESET, RESET.pack(seed, started))
+
+def encode_stats(stats):
+    return pack(MSG_STATS, STATS.pack(*stats))
+
+def encode_frame(tick, action, started, over, bird=None, pipe_gap=None, score=None, death=None):
+    mask = (FRAME_STARTED if started else 0) | (FRAME_OVER if over else 0)
+    fields = []
+    if bird is not None:
+        mask |= FRAME_BIRD
+        fields.append(FRAME_BIRD_FIELDS.pack(*bird))
+    if pipe_gap is not None:
+        mask |= FRAME_PIPE
+        fields.append(FRAME_PIPE_FIELDS.pack(pipe_gap))
+    if score is not None:
+        mask |= FRAME_SCORE
+        fields.append(FRAME_SCORE_FIELDS.pack(score))
+    if death is not None:
+        mask |= FRAME_DEATH
+        cause, point = death
+        fields.append(FRAME_DEATH_FIELDS.pack(DEATH_CAUSES.index(cause), *(point if point is not None else (0, 0))))
+    return pack(MSG_FRAME, FRAME.pack(tick, action, mask) + b"".join(fields))
+
+def decode_frame(body):
+    tick, action, mask = FRAME.unpack_from(body)
+    pos = FRAME.size
+    bird = pipe_gap = score = death = None
+    if mask & FRAME_BIRD:
+        bird = FRAME_BIRD_FIELDS.unpack_from(body, pos)
+        pos += FRAME_BIRD_FIELDS.size
+    if mask & FRAME_PIPE:
+        pipe_gap, = FRAME_PIPE_FIELDS.unpack_from(body, pos)
+        pos += FRAME_PIPE_FIELDS.size
+    if mask & FRAME_SCORE:
+        score, = FRAME_SCORE_FIELDS.unpack_from(body, pos)
+        pos += FRAME_SCORE_FIELDS.size
+    if mask & FRAME_DEATH:
+        code, x, y = FRAME_DEATH_FIELDS.unpack_from(body, pos)
+        if code >= len(DEATH_CAUSES):
+            raise ProtocolError(f"unknown death cause {code}")
+        cause = DEATH_CAUSES[code]
+        death = (cause, (x, y) if cause != DEATH_GROUND else None)
+    return Frame(tick, action, bool(mask & FRAME_STARTED), bool(mask & FRAME_OVER), bird, pipe_gap, score, death)
+
+def decode_server_message(message_type, body):
+    # (type, body) read off the wire -> Welcome, Reset, Frame or Stats
+    try:
+        if message_type == MSG_FRAME:
+            return decode_frame(body)
+        if message_type == MSG_RESET:
+            seed, started = RESET.unpack(body)
+            return Reset(seed, bool(started))
+        if message_type == MSG_WELCOME:
+            return Welcome(*WELCOME.unpack(body))
+        if message_type == MSG_STATS:
+            return Stats(*STATS.unpack(body))
+    except struct.error as e:
+        raise ProtocolError(f"bad message of type {message_type}: {e}") from None
+    raise ProtocolError(f"unknown message type {message_type}")
+
+def split_messages(buffer):
+    # Complete (type, body) messages at the front of a bytearray, which is trimmed to the rest
+    messages = []
+    pos = 0
+    while pos < len(buffer) and pos + 1 + buffer[pos] <= len(buffer):
+        length = buffer[pos]
+        if length == 0:
+            raise ProtocolError("empty message")
+        messages.append((buffer[pos + 1], bytes(buffer[pos + 2:pos + 1 + length])))
+        pos += 1 + length
+    del buffer[:pos]
+    return messages
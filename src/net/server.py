@@ -0,0 +1,188 @@
+import asyncio
+import struct
+import sys
+import time
+from collections import deque
+from ..sim.simulation import Simulation, NOOP, JUMP, START
+from ..utils.profiler import percentile
+from ..utils.constants import FPS, TICK_SECONDS, MAX_CATCH_UP_TICKS, NET_MAX_WRITE_BUFFER
+from .protocol import (MSG_HELLO, MSG_INPUT, MSG_STATS, INPUT, RESTART, MENU, Stats, ProtocolError,
+                       decode_hello, encode_welcome, encode_reset, encode_frame, encode_stats)
+
+CLIENT_ACTIONS = (JUMP, START, RESTART, MENU)
+STATS_WINDOW_TICKS = 60 * FPS  # Tick timings kept for a STATS reply at most
+
+def rooms_per_core(stats, tick_seconds=TICK_SECONDS):
+    # Rooms one core could step within a tick at the cost per room measured in stats
+    return stats.rooms * tick_seconds / stats.mean_busy if stats.mean_busy and stats.rooms else 0.0
+
+class Room:
+    # One client's game on the server and what it has been sent so far
+    __slots__ = ("id", "writer", "sim", "inputs", "sent_bird", "sent_score", "next_pipe_slot", "sent_death")
+
+    def __init__(self, room_id, writer, seed=None):
+        self.id = room_id
+        self.writer = writer
+        self.sim = Simulation(seed=seed)
+        self.inputs = deque()  # One input is applied per tick, so quick double flaps are kept
+        self.forget_sent()
+
+    def forget_sent(self):
+        self.sent_bird = None
+        self.sent_score = 0
+        self.next_pipe_slot = 0
+        self.sent_death = False
+
+    def step(self):
+        # Advance one tick and return the bytes to send for it
+        sim = self.sim
+        action = self.inputs.popleft() if self.inputs else NOOP
+        message = b""
+        if action == RESTART or action == MENU:
+            sim.reset()
+            if action == RESTART:
+                sim.start()
+            self.forget_sent()
+            message = encode_reset(sim.seed, action == RESTART)
+            action = NOOP
+        sim.step(action)
+
+        # Only what changed goes out; the client derives the rest by stepping its own copy
+        bird = sim.bird
+        bird_state = (bird.y, bird.velocity, bird.tilt)
+        if bird_state == self.sent_bird:
+            bird_state = None
+        else:
+            self.sent_bird = bird_state
+
+        # The slot after the newest pipe only moves on a spawn (recycling moves head and count together)
+        pipes = sim.pipes
+        pipe_gap = None
+        next_pipe_slot = (pipes.head + pipes.count) % pipes.capacity
+        if next_pipe_slot != self.next_pipe_slot:
+            self.next_pipe_slot = next_pipe_slot
+            pipe_gap = pipes.active[-1].gap_height
+
+        score = None
+        if sim.score != self.sent_score:
+            score = self.sent_score = sim.score
+
+        game_state = sim.game_state
+        death = None
+        if game_state.is_game_over and not self.sent_death:
+            death = (sim.death_cause, sim.collision_point)
+            self.sent_death = True
+        return message + encode_frame(sim.tick, action, game_state.is_game_started, game_state.is_game_over,
+                                      bird_state, pipe_gap, score, death)
+
+class MatchServer:
+    """Authoritative server hosting one game per connected client.
+
+    Every room is stepped on one shared fixed tick, applying at most one
+    queued input per room, and each client is sent a small FRAME of what
+    changed. Clients that cannot keep up with their frames are dropped rather
+    than slowing everyone else down. Everything runs on one asyncio loop,
+    so a server process uses one core.
+    """
+
+    def __init__(self, tick_seconds=TICK_SECONDS):
+        self.tick_seconds = tick_seconds
+        self.rooms = {}
+        self.next_room = 0
+        self.dropped = 0  # Clients closed for falling behind
+        self.failed = 0  # Rooms closed because stepping them raised
+        self.total_ticks = 0
+        self.total_busy = 0.0
+
+        # Window read and restarted by take_stats()
+        self.busy = deque(maxlen=STATS_WINDOW_TICKS)  # Seconds spent stepping rooms, per tick
+        self.late_ticks = 0
+        self.ticker = None
+
+    async def start(self, host, port):
+        listener = await asyncio.start_server(self.handle_client, host, port)
+        self.ticker = asyncio.create_task(self.run_ticks())
+        return listener
+
+    async def handle_client(self, reader, writer):
+        room = None
+        try:
+            while True:
+                length = (await reader.readexactly(1))[0]
+                if not length:
+                    raise ProtocolError("empty message")
+                body = await reader.readexactly(length)
+                message_type = body[0]
+                if message_type == MSG_INPUT and room is not None:
+                    action, = INPUT.unpack_from(body, 1)
+                    if action not in CLIENT_ACTIONS:
+                        raise ProtocolError(f"unknown input {action}")
+                    room.inputs.append(action)
+                elif message_type == MSG_HELLO and room is None:
+                    room = Room(self.next_room, writer, decode_hello(body[1:]))
+                    self.rooms[room.id] = room
+                    self.next_room += 1
+                    writer.write(encode_welcome(room.id, room.sim.seed))
+                elif message_type == MSG_STATS:
+                    writer.write(encode_stats(self.take_stats()))
+                else:
+                    raise ProtocolError(f"unexpected message type {message_type}")
+        except (asyncio.IncompleteReadError, ConnectionError, ProtocolError, ValueError, struct.error):
+            pass  # Disconnected, or sent something that is not the protocol
+        finally:
+            if room is not None:
+                self.rooms.pop(room.id, None)
+            writer.close()
+
+    async def run_ticks(self):
+        # Fixed ticks like GameController.run: late ticks run back to back, a long stall is dropped
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            start = time.perf_counter()
+            self.step_rooms()
+            busy = time.perf_counter() - start
+            self.busy.append(busy)
+            self.total_busy += busy
+            self.total_ticks += 1
+
+            next_tick += self.tick_seconds
+            delay = next_tick - loop.time()
+            if delay < 0:
+                self.late_ticks += 1
+                if delay < -MAX_CATCH_UP_TICKS * self.tick_seconds:
+                    next_tick = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    def step_rooms(self):
+        for room in list(self.rooms.values()):
+            writer = room.writer
+            if writer.transport.get_write_buffer_size() > NET_MAX_WRITE_BUFFER:
+                self.rooms.pop(room.id)
+                self.dropped += 1
+                writer.close()
+                continue
+            try:
+                message = room.step()
+            except Exception as e:
+                # One broken room is closed on its own; the shared tick must keep running for the rest
+                self.rooms.pop(room.id)
+                self.failed += 1
+                writer.close()
+                print(f"Closed room {room.id} after an error: {e!r}", file=sys.stderr)
+                continue
+            writer.write(message)
+
+    def take_stats(self):
+        busy = sorted(self.busy)
+        stats = Stats(len(self.rooms), len(busy), self.late_ticks,
+                      sum(busy) / len(busy) if busy else 0.0, percentile(busy, 99) if busy else 0.0)
+        self.busy.clear()
+        self.late_ticks = 0
+        return stats
+
+    def summary(self):
+        mean_ms = self.total_busy / self.total_ticks * 1000 if self.total_ticks else 0.0
+        return (f"{len(self.rooms)} rooms, {self.total_ticks:,} ticks, {mean_ms:.2f} ms busy per tick "
+                f"({mean_ms / (self.tick_seconds * 1000):.0%} of the tick), {self.dropped} slow clients dropped, "
+                f"{self.failed} rooms closed after an error")
@@ -0,0 +1,198 @@
+import time
+from collections import deque
+from .bird import BirdPhysics
+from .simulation import Simulation, NOOP, JUMP
+from .policies import make_gap_follower_policy, gap_follower_jumps
+from ..utils.constants import WINDOW_HEIGHT, PIPE_WIDTH, AUTOPILOT_HORIZON_TICKS, AUTOPILOT_BUDGET_SECONDS, AUTOPILOT_Y_QUANTUM
+
+class ParkedBird(BirdPhysics):
+    # Stand-in bird for the autopilot's copy of the world: it stays above the screen and never dies, so
+    # the pipes scroll and spawn exactly as they will for a bird that survives
+    def __init__(self):
+        super().__init__()
+        self.y = -WINDOW_HEIGHT
+
+    def update(self):
+        pass
+
+    def jump(self):
+        pass
+
+    def restore(self, snapshot):
+        pass
+
+class SearchNode:
+    # One bird state on the search path and the actions still to try from it
+    __slots__ = ("bird", "tick", "key", "actions", "action")
+
+    def __init__(self, bird, tick, key, actions):
+        self.bird = bird  # BirdPhysics.snapshot()
+        self.tick = tick
+        self.key = key
+        self.actions = actions  # Untried actions, the next one last
+        self.action = None  # Action leading to the next node on the path
+
+class Autopilot:
+    """Plays by searching ahead on a clone of the simulation.
+
+    While the bird lives, the pipes do not depend on what it does, so a clone
+    of the world (pipes and pipe RNG, with a parked bird) is stepped once per
+    tick into a timeline of pipe hitboxes that also covers pipes not spawned
+    yet. A depth-first search then clones only the bird, trying flapping and
+    not flapping on every tick until a path survives the horizon.
+
+    The search stack is the plan: its bottom is the live game, each tick plays
+    the bottom node's action, and the time budget goes to extending or
+    backtracking the rest, so hard stretches are worked out over many frames
+    before the bird gets there. Quantized bird states from which every action
+    dies are remembered per tick and never searched again.
+    """
+
+    def __init__(self, sim, budget=AUTOPILOT_BUDGET_SECONDS, horizon=AUTOPILOT_HORIZON_TICKS):
+        self.sim = sim
+        self.world = Simulation(ParkedBird(), seed=sim.seed)
+        self.timeline = {}  # tick -> (left, upper, lower, x, gap height) of each pipe after that tick
+        self.bird = BirdPhysics()  # Scratch bird the search steps
+        self.bird_node = None  # Node whose state the scratch bird holds
+        self.budget = budget
+        self.horizon = horizon
+        self.fallback = make_gap_follower_policy()
+        self.path = deque()  # Search stack, live state first
+        self.dead = {}  # tick -> quantized bird states that die whatever they do
+
+        # Totals for summary()
+        self.decisions = 0
+        self.fallbacks = 0
+        self.states = 0
+        self.memo_hits = 0
+        self.over_budget = 0
+        self.search_seconds = 0.0
+        self.longest_search = 0.0
+
+    def reset(self):
+        # Paths, timeline and memo only hold for the run they were made in
+        self.path.clear()
+        self.timeline.clear()
+        self.dead.clear()
+        self.bird_node = None
+
+    def decide(self):
+        sim = self.sim
+        game_state = sim.game_state
+        if not game_state.is_game_started or game_state.is_game_over:
+            if self.path or self.timeline or self.dead:
+                self.reset()
+            return NOOP
+
+        self.decisions += 1
+        for ticks in (self.dead, self.timeline):
+            for tick in [tick for tick in ticks if tick < sim.tick]:
+                del ticks[tick]
+
+        # The pipes only depend on the run, so the world is copied once per run
+        if sim.tick not in self.timeline:
+            self.timeline.clear()
+            self.world.restore(sim.snapshot())
+            self.record_pipes()
+
+        # The path must start at the live game; search again from it if the game went elsewhere
+        path = self.path
+        bird = sim.bird.snapshot()
+        if not path or path[0].tick != sim.tick or path[0].bird != bird:
+            path.clear()
+            self.bird.restore(bird)
+            self.push(self.get_key(self.bird), sim.tick)
+        self.search()
+
+        if len(path) > 1:
+            return path.popleft().action
+        path.clear()  # Nothing found yet, or every path dies
+        self.fallbacks += 1
+        return self.fallback(sim.get_state())
+
+    def record_pipes(self):
+        # Copies, since the pipes reuse their hitbox lists
+        self.timeline[self.world.tick] = [
+            (pipe.upper[0], tuple(pipe.upper), tuple(pipe.lower), pipe.x, pipe.gap_height) for pipe in self.world.pipes
+        ]
+
+    def search(self):
+        # Extend the path towards the horizon, backing up from dead ends, until the budget is spent
+        start = time.perf_counter()
+        deadline = start + self.budget
+        end = self.sim.tick + self.horizon
+        world = self.world
+        while world.tick < end:
+            world.step(NOOP)
+            self.record_pipes()
+
+        path = self.path
+        bird = self.bird
+        while path and path[-1].tick < end:
+            if time.perf_counter() > deadline:
+                self.over_budget += 1
+                break
+            node = path[-1]
+            if not node.actions:
+                # Every action from here dies; remember the state and back up
+                self.dead.setdefault(node.tick, set()).add(node.key)
+                path.pop()
+                continue
+
+            node.action = node.actions.pop()
+            if self.bird_node is not node:
+                bird.restore(node.bird)
+            self.bird_node = None
+            tick = node.tick + 1
+            if not self.step_bird(node.action, tick):
+                continue
+            key = self.get_key(bird)
+            if key in self.dead.get(tick, ()):
+                self.memo_hits += 1
+                continue
+            self.push(key, tick)
+
+        elapsed = time.perf_counter() - start
+        self.search_seconds += elapsed
+        self.longest_search = max(self.longest_search, elapsed)
+
+    def step_bird(self, action, tick):
+        # Simulation.step for the scratch bird alone, against the timeline's pipes; False when it dies
+        bird = self.bird
+        if action == JUMP:
+            bird.jump()
+        bird.update()
+        if bird.is_dead:
+            return False
+        collider = self.sim.collider
+        reach_left, reach_right = collider.x_range(bird)
+        for left, upper, lower, _, _ in self.timeline[tick]:
+            if left < reach_right and reach_left < left + PIPE_WIDTH:
+                if collider.hit(bird, upper, True) is not None or collider.hit(bird, lower, False) is not None:
+                    return False
+        return True
+
+    def push(self, key, tick):
+        # Add the scratch bird's state to the path; what the gap follower would do is tried first
+        bird = self.bird
+        next_gap = None
+        for _, _, _, x, gap_height in self.timeline[tick]:
+            if x + PIPE_WIDTH >= bird.x:  # Not passed yet
+                next_gap = gap_height
+                break
+        actions = [NOOP, JUMP] if gap_follower_jumps(bird.y, bird.velocity, next_gap) else [JUMP, NOOP]
+        node = SearchNode(bird.snapshot(), tick, key, actions)
+        self.path.append(node)
+        self.bird_node = node
+        self.states += 1
+
+    @staticmethod
+    def get_key(bird):
+        # Pipes follow from the tick, so the bird alone tells states of one run apart
+        return (int(bird.y) // AUTOPILOT_Y_QUANTUM, round(bird.velocity, 1), bird.tilt)
+
+    def summary(self):
+        mean_ms = self.search_seconds / self.decisions * 1000 if self.decisions else 0.0
+        return (f"autopilot: {self.decisions:,} decisions ({self.fallbacks} without a plan), "
+                f"{mean_ms:.2f} ms mean search, {self.longest_search * 1000:.2f} ms longest, "
+                f"{self.over_budget} over budget, {self.states:,} states searched, {self.memo_hits:,} memo hits")
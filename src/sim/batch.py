@@ -0,0 +1,176 @@
+import numpy as np
+from .simulation import DEATH_UPPER_PIPE, DEATH_LOWER_PIPE, DEATH_GROUND
+from ..utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, BIRD_WIDTH, BIRD_HEIGHT, PIPE_WIDTH, PIPE_GAP, PIPE_VELOCITY, GROUND_HEIGHT, GRAVITY, PIPE_SPAWN_TICKS, PIPE_POOL_SIZE
+
+# Pipes alive at once never exceed three (a pipe lives ~100 ticks, one spawns every 45)
+MAX_PIPES = PIPE_POOL_SIZE
+
+BIRD_X = 50
+BIRD_START_Y = WINDOW_HEIGHT // 2
+JUMP_VELOCITY = -12
+MAX_TILT = 25
+TILT_VELOCITY = 0.5
+GROUND_Y = WINDOW_HEIGHT - GROUND_HEIGHT - BIRD_HEIGHT
+GAP_MIN = 50
+GAP_MAX = WINDOW_HEIGHT - PIPE_GAP - GROUND_HEIGHT - 50
+
+# Death cause codes stored in BatchSimulation.death_cause
+CAUSE_NONE = 0
+CAUSE_UPPER_PIPE = 1
+CAUSE_LOWER_PIPE = 2
+CAUSE_GROUND = 3
+CAUSE_NAMES = {
+    CAUSE_NONE: None,
+    CAUSE_UPPER_PIPE: DEATH_UPPER_PIPE,
+    CAUSE_LOWER_PIPE: DEATH_LOWER_PIPE,
+    CAUSE_GROUND: DEATH_GROUND,
+}
+
+class BatchSimulation:
+    """N independent games advanced together with NumPy.
+
+    Follows Simulation.step for a started game tick for tick (jump, pipe
+    spawning, gravity, tilt, ceiling clamp, ground death, pipe scrolling,
+    scoring and rect collision). A game freezes once its bird dies; the death
+    animation is not simulated.
+    """
+
+    def __init__(self, n, seed=None, gap_table=None):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        # Optional (n, spawns) array of pipe gaps to use in order instead of drawing from rng
+        self.gap_table = gap_table
+        self.slots = np.arange(MAX_PIPES)
+
+        self.y = np.empty(n, dtype=np.float64)
+        self.velocity = np.empty(n, dtype=np.float64)
+        self.tilt = np.empty(n, dtype=np.float64)
+        self.alive = np.empty(n, dtype=bool)
+        self.score = np.empty(n, dtype=np.int64)
+        self.frames = np.empty(n, dtype=np.int64)
+        self.death_cause = np.empty(n, dtype=np.int8)
+        self.spawn_ticks = np.empty(n, dtype=np.int64)
+        self.spawn_index = np.empty(n, dtype=np.int64)
+
+        # Pipes per game, oldest first in slot 0
+        self.pipe_count = np.empty(n, dtype=np.int64)
+        self.pipe_x = np.empty((n, MAX_PIPES), dtype=np.int64)
+        self.pipe_gap = np.empty((n, MAX_PIPES), dtype=np.int64)
+        self.pipe_passed = np.empty((n, MAX_PIPES), dtype=bool)
+
+        self.reset()
+
+    def reset(self, mask=None):
+        # Restart every game, or only those selected by a boolean mask
+        if mask is None:
+            mask = slice(None)
+        self.y[mask] = BIRD_START_Y
+        self.velocity[mask] = 0
+        self.tilt[mask] = 0
+        self.alive[mask] = True
+        self.score[mask] = 0
+        self.frames[mask] = 0
+        self.death_cause[mask] = CAUSE_NONE
+        self.spawn_ticks[mask] = 0
+        self.spawn_index[mask] = 0
+        self.pipe_count[mask] = 0
+        self.pipe_x[mask] = 0
+        self.pipe_gap[mask] = 0
+        self.pipe_passed[mask] = False
+
+    def step(self, jump):
+        # jump is a bool array (or scalar) of length n; returns the alive mask
+        alive = self.alive
+        self.frames += alive
+
+        # Jump only affects living birds
+        jumping = alive & np.asarray(jump, dtype=bool)
+        self.velocity[jumping] = JUMP_VELOCITY
+        self.tilt[jumping] = -MAX_TILT
+
+        self.spawn_pipes(alive)
+        self.update_birds(alive)
+        self.update_pipes(self.alive)
+        return self.alive
+
+    def spawn_pipes(self, alive):
+        self.spawn_ticks += alive
+        due = np.flatnonzero(self.spawn_ticks >= PIPE_SPAWN_TICKS)
+        if due.size == 0:
+            return
+        self.spawn_ticks[due] = 0
+        slot = self.pipe_count[due]
+        self.pipe_x[due, slot] = WINDOW_WIDTH
+        if self.gap_table is None:
+            self.pipe_gap[due, slot] = self.rng.integers(GAP_MIN, GAP_MAX, size=due.size, endpoint=True)
+        else:
+            self.pipe_gap[due, slot] = self.gap_table[due, self.spawn_index[due]]
+        self.spawn_index[due] += 1
+        self.pipe_passed[due, slot] = False
+        self.pipe_count[due] += 1
+
+    def update_birds(self, alive):
+        velocity = self.velocity
+        velocity += GRAVITY * alive
+        self.y += velocity * alive
+
+        # Tilt follows the sign of the velocity, clamped to +-MAX_TILT
+        rising = velocity < 0
+        tilted = np.where(
+            rising,
+            np.maximum(self.tilt - TILT_VELOCITY, -MAX_TILT),
+            np.minimum(self.tilt + TILT_VELOCITY, MAX_TILT)
+        )
+        np.copyto(self.tilt, tilted, where=alive)
+
+        # Ceiling clamp
+        ceiling = alive & (self.y < 0)
+        self.y[ceiling] = 0
+        velocity[ceiling] = 0
+
+        # Ground death
+        grounded = alive & (self.y >= GROUND_Y)
+        self.y[grounded] = GROUND_Y
+        velocity[grounded] = 0
+        self.alive[grounded] = False
+        self.death_cause[grounded] = CAUSE_GROUND
+
+    def update_pipes(self, alive):
+        pipe_x = self.pipe_x
+        processed = alive[:, None] & (self.slots < self.pipe_count[:, None])
+        pipe_x -= PIPE_VELOCITY * processed
+
+        # Only the oldest pipe can scroll off screen
+        removed = processed[:, 0] & (pipe_x[:, 0] + PIPE_WIDTH < 0)
+
+        # Score pipes the bird has flown past
+        newly_passed = processed & ~self.pipe_passed & (pipe_x + PIPE_WIDTH < BIRD_X)
+        self.pipe_passed |= newly_passed
+        self.score += newly_passed.sum(axis=1)
+
+        # AABB against the truncated bird rect, as pygame.Rect would build it
+        bird_top = self.y.astype(np.int64)[:, None]
+        gap = self.pipe_gap
+        in_column = processed & (BIRD_X < pipe_x + PIPE_WIDTH) & (pipe_x < BIRD_X + BIRD_WIDTH)
+        upper_hit = (in_column & (bird_top < gap)).any(axis=1)
+        lower_hit = (in_column & (gap + PIPE_GAP < bird_top + BIRD_HEIGHT)).any(axis=1)
+        self.death_cause[lower_hit] = CAUSE_LOWER_PIPE
+        self.death_cause[upper_hit] = CAUSE_UPPER_PIPE
+        self.alive[upper_hit | lower_hit] = False
+
+        # Drop removed pipes by shifting the remaining slots left
+        if removed.any():
+            self.pipe_x[removed, :-1] = self.pipe_x[removed, 1:]
+            self.pipe_gap[removed, :-1] = self.pipe_gap[removed, 1:]
+            self.pipe_passed[removed, :-1] = self.pipe_passed[removed, 1:]
+            self.pipe_count[removed] -= 1
+
+    def next_pipe(self):
+        # x and gap of the first pipe not yet passed; x is WINDOW_WIDTH and gap -1 when there is none
+        pending = (self.slots < self.pipe_count[:, None]) & ~self.pipe_passed
+        has_pipe = pending.any(axis=1)
+        first = pending.argmax(axis=1)
+        rows = np.arange(self.n)
+        pipe_x = np.where(has_pipe, self.pipe_x[rows, first], WINDOW_WIDTH)
+        pipe_gap = np.where(has_pipe, self.pipe_gap[rows, first], -1)
+        return pipe_x, pipe_gap
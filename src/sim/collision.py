@@ -0,0 +1,30 @@
+from ..utils.constants import BIRD_WIDTH
+
+def rects_overlap(a, b):
+    # Same rule as pygame.Rect.colliderect for (x, y, width, height) tuples:
+    # touching edges do not collide and empty rects never collide
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    if aw <= 0 or ah <= 0 or bw <= 0 or bh <= 0:
+        return False
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+class RectCollider:
+    # Narrow phase that tests the bird's unrotated 50x40 hitbox
+    name = "rect"
+    reach = 0  # Pixels the hit shape can extend past the hitbox sideways, for the broad phase
+
+    def hit(self, bird, rect, upper):
+        # Collision point with an upper or lower pipe rect, or None when the bird misses it
+        bird_left, bird_top, _, bird_height = bird_rect = bird.get_bounds()
+        if not rects_overlap(bird_rect, rect):
+            return None
+        x, y, _, height = rect
+        if upper:
+            return max(bird_left, x), max(bird_top, y)
+        return max(bird_left, x), min(bird_top + bird_height, y + height)
+
+    def x_range(self, bird):
+        # Horizontal span a pipe must overlap to be worth testing
+        left = int(bird.x) - self.reach
+        return left, left + BIRD_WIDTH + 2 * self.reach
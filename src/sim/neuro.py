@@ -0,0 +1,195 @@
+import json
+import os
+import numpy as np
+from .batch import BatchSimulation, BIRD_X, JUMP_VELOCITY
+from .replay import gap_sequence
+from .simulation import NOOP, JUMP
+from ..utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, BIRD_HEIGHT, PIPE_GAP, PIPE_SPAWN_TICKS
+
+# Network: 4 inputs (bird y, velocity, next pipe x and gap) -> tanh hidden layer -> flap when the output is positive
+INPUTS = 4
+DEFAULT_HIDDEN = 6
+NO_PIPE_GAP = (WINDOW_HEIGHT - PIPE_GAP) // 2  # Gap assumed before the first pipe spawns: mid-screen
+
+def genome_size(hidden):
+    # Weights and biases of both layers, flattened
+    return INPUTS * hidden + hidden + hidden + 1
+
+def unpack(genomes, hidden):
+    # (n, genome_size) genomes -> per-genome (w1, b1, w2, b2) arrays
+    w1_end = INPUTS * hidden
+    w1 = genomes[:, :w1_end].reshape(-1, INPUTS, hidden)
+    b1 = genomes[:, w1_end:w1_end + hidden]
+    w2 = genomes[:, w1_end + hidden:w1_end + 2 * hidden]
+    b2 = genomes[:, -1]
+    return w1, b1, w2, b2
+
+def features(y, velocity, pipe_x, pipe_gap):
+    # Inputs scaled to roughly -1..1; the gap is given relative to the bird, and -1 means no pipe ahead yet
+    pipe_gap = np.where(pipe_gap < 0, NO_PIPE_GAP, pipe_gap)
+    return np.stack([
+        y / WINDOW_HEIGHT,
+        velocity / -JUMP_VELOCITY,
+        (pipe_x - BIRD_X) / WINDOW_WIDTH,
+        (pipe_gap + PIPE_GAP - BIRD_HEIGHT - y) / PIPE_GAP,  # Room below the bird before the lower pipe
+    ], axis=-1)
+
+def forward(params, inputs):
+    # One decision per row of inputs, each with its own network; returns a bool array of flaps
+    w1, b1, w2, b2 = params
+    hidden = np.tanh(np.einsum("ni,nih->nh", inputs, w1) + b1)
+    return np.einsum("nh,nh->n", hidden, w2) + b2 > 0
+
+def evaluate(genomes, hidden, seeds, max_frames):
+    """Play every genome on every seed in one BatchSimulation.
+
+    Returns (frames, scores), each shaped (genomes, seeds). Lane i plays
+    genome i // len(seeds) on the pipes Simulation would draw for its seed,
+    so a genome scores the same here as in the game window.
+    """
+    population = len(genomes)
+    games = len(seeds)
+    spawns = max_frames // PIPE_SPAWN_TICKS + 1
+    gap_table = np.tile(np.array([gap_sequence(seed, spawns) for seed in seeds], dtype=np.int64), (population, 1))
+    batch = BatchSimulation(population * games, gap_table=gap_table)
+    params = tuple(np.repeat(array, games, axis=0) for array in unpack(genomes, hidden))
+
+    # The first tick is the Start press, as in the game
+    alive = batch.step(False)
+    for _ in range(max_frames - 1):
+        if not alive.any():
+            break
+        pipe_x, pipe_gap = batch.next_pipe()
+        alive = batch.step(forward(params, features(batch.y, batch.velocity, pipe_x, pipe_gap)))
+    return batch.frames.reshape(population, games), batch.score.reshape(population, games)
+
+class Trainer:
+    """Evolves a population of network genomes.
+
+    Each generation plays every genome on the same freshly drawn seeds,
+    keeps the fittest few unchanged and breeds the rest from tournament
+    winners by uniform crossover and Gaussian mutation. Fitness is the mean
+    number of frames survived. All state, including the random generator,
+    goes into checkpoints, so a resumed run continues exactly where it left off.
+    """
+
+    def __init__(self, population=200, hidden=DEFAULT_HIDDEN, games=4, max_frames=3000, seed=None,
+                 elite=0.05, tournament=3, mutation_rate=0.2, mutation_scale=0.3):
+        self.population = population
+        self.hidden = hidden
+        self.games = games  # Seeds each genome plays per generation
+        self.max_frames = max_frames
+        self.elite = elite
+        self.tournament = tournament
+        self.mutation_rate = mutation_rate
+        self.mutation_scale = mutation_scale
+        self.rng = np.random.default_rng(seed)
+        self.genomes = self.rng.normal(0.0, 1.0, (population, genome_size(hidden)))
+        self.generation = 0
+        self.best_genome = None
+        self.history = []  # (best fitness, best mean score, best score, mean fitness) per generation
+
+    def step(self):
+        # Evaluate the current generation, record it and breed the next one
+        seeds = self.rng.integers(2 ** 32, size=self.games).tolist()
+        frames, scores = evaluate(self.genomes, self.hidden, seeds, self.max_frames)
+        fitness = frames.mean(axis=1)
+        order = np.argsort(-fitness, kind="stable")
+        best = order[0]
+        self.best_genome = self.genomes[best].copy()
+        self.history.append((float(fitness[best]), float(scores[best].mean()), int(scores.max()), float(fitness.mean())))
+
+        elite = self.genomes[order[:max(1, int(self.population * self.elite))]]
+        children = self.population - len(elite)
+        first = self.select(fitness, children)
+        second = self.select(fitness, children)
+        mix = self.rng.random((children, self.genomes.shape[1])) < 0.5
+        offspring = np.where(mix, self.genomes[first], self.genomes[second])
+        mutate = self.rng.random(offspring.shape) < self.mutation_rate
+        offspring += mutate * self.rng.normal(0.0, self.mutation_scale, offspring.shape)
+        self.genomes = np.concatenate([elite, offspring])
+        self.generation += 1
+        return self.history[-1]
+
+    def select(self, fitness, count):
+        # Index of the fittest of `tournament` random genomes, count times
+        entrants = self.rng.integers(self.population, size=(count, self.tournament))
+        return entrants[np.arange(count), fitness[entrants].argmax(axis=1)]
+
+    def config(self):
+        return {
+            "population": self.population,
+            "hidden": self.hidden,
+            "games": self.games,
+            "max_frames": self.max_frames,
+            "elite": self.elite,
+            "tournament": self.tournament,
+            "mutation_rate": self.mutation_rate,
+            "mutation_scale": self.mutation_scale,
+        }
+
+    def save(self, path):
+        # Write then rename so an interrupted save never leaves a broken checkpoint
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                config=json.dumps(self.config()),
+                rng=json.dumps(self.rng.bit_generator.state),
+                generation=self.generation,
+                genomes=self.genomes,
+                best_genome=self.best_genome if self.best_genome is not None else np.empty(0),
+                history=np.array(self.history, dtype=np.float64).reshape(-1, 4),
+            )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            trainer = cls(**json.loads(str(data["config"])))
+            trainer.rng.bit_generator.state = json.loads(str(data["rng"]))
+            trainer.generation = int(data["generation"])
+            trainer.genomes = data["genomes"]
+            trainer.best_genome = data["best_genome"] if data["best_genome"].size else None
+            trainer.history = [(fitness, mean_score, int(best_score), mean_fitness)
+                               for fitness, mean_score, best_score, mean_fitness in data["history"].tolist()]
+        return trainer
+
+def load_genome(path):
+    # Best genome of a training checkpoint and its hidden layer size
+    with np.load(path) as data:
+        if not data["best_genome"].size:
+            raise ValueError(f"{path} has no trained genome yet")
+        return data["best_genome"], json.loads(str(data["config"]))["hidden"]
+
+def make_neural_policy(genome, hidden):
+    # SimState -> action with the same network and inputs as in training
+    params = unpack(np.asarray(genome, dtype=np.float64)[None, :], hidden)
+
+    def policy(state):
+        pipe_x = state.next_pipe_x if state.next_pipe_x is not None else WINDOW_WIDTH
+        pipe_gap = state.next_pipe_gap if state.next_pipe_gap is not None else -1
+        inputs = features(np.array([state.bird_y], dtype=np.float64), np.array([state.bird_velocity], dtype=np.float64),
+                          np.array([pipe_x]), np.array([pipe_gap]))
+        return JUMP if forward(params, inputs)[0] else NOOP
+    return policy
+
+class NeuralPilot:
+    # Plays the game with a trained genome; used by GameController in place of the search autopilot
+    def __init__(self, sim, genome, hidden):
+        self.sim = sim
+        self.policy = make_neural_policy(genome, hidden)
+        self.decisions = 0
+
+    def decide(self):
+        game_state = self.sim.game_state
+        if not game_state.is_game_started or game_state.is_game_over:
+            return NOOP
+        self.decisions += 1
+        return self.policy(self.sim.get_state())
+
+    def summary(self):
+        return f"neural pilot: {self.decisions:,} decisions"
@@ -0,0 +1,80 @@
+from ..utils.constants import PIPE_WIDTH, PIPE_GAP, PIPE_VELOCITY, WINDOW_HEIGHT, PIPE_POOL_SIZE
+
+class PipePhysics:
+    # Pipes are pooled records; reset() reuses one for a new spawn
+    __slots__ = ("x", "gap_height", "passed", "upper", "lower")
+
+    def __init__(self, x=0, gap_height=0):
+        # Hitboxes as [x, y, width, height]; only x changes after a spawn
+        self.upper = [0, 0, PIPE_WIDTH, 0]
+        self.lower = [0, 0, PIPE_WIDTH, WINDOW_HEIGHT]
+        self.reset(x, gap_height)
+
+    def reset(self, x, gap_height):
+        self.x = x
+        self.gap_height = gap_height
+        self.passed = False
+        self.upper[0] = self.lower[0] = int(x)
+        self.upper[3] = int(gap_height)
+        self.lower[1] = int(gap_height) + PIPE_GAP
+
+    def update(self):
+        self.x -= PIPE_VELOCITY
+        self.upper[0] = self.lower[0] = int(self.x)
+
+    def get_bounds(self):  # Upper and lower hitboxes; the lists are reused, so copy them to keep them
+        return self.upper, self.lower
+
+class PipePool:
+    """Fixed-capacity ring buffer of reusable pipe records, oldest first.
+
+    Spawning takes the slot after the newest pipe and recycling advances past
+    the oldest, so pipes are never allocated or removed during play.
+    """
+
+    def __init__(self, pipe_class=PipePhysics, capacity=PIPE_POOL_SIZE):
+        self.capacity = capacity
+        self.slots = [pipe_class() for _ in range(capacity)]
+        self.head = 0
+        self.count = 0
+        self.active = []  # Live records oldest first, for cheap iteration
+
+    def spawn(self, x, gap_height):
+        if self.count == self.capacity:
+            self.recycle_oldest()  # Spacing keeps at most three pipes alive, but never overflow
+        pipe = self.slots[(self.head + self.count) % self.capacity]
+        pipe.reset(x, gap_height)
+        self.count += 1
+        self.active.append(pipe)
+        return pipe
+
+    def recycle_oldest(self):
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+        del self.active[0]
+
+    def oldest(self):
+        return self.slots[self.head] if self.count else None
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        self.active.clear()
+
+    def snapshot(self):
+        # (x, gap height, passed) of each live pipe, oldest first
+        return tuple((pipe.x, pipe.gap_height, pipe.passed) for pipe in self.active)
+
+    def restore(self, snapshot):
+        self.clear()
+        for x, gap_height, passed in snapshot:
+            self.spawn(x, gap_height).passed = passed
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        return self.active[index]
+
+    def __iter__(self):
+        return iter(self.active)
@@ -0,0 +1,34 @@
+import random
+from .simulation import NOOP, JUMP
+from ..utils.constants import WINDOW_HEIGHT, BIRD_HEIGHT, PIPE_GAP
+
+# Policies map a SimState to an action. Each entry builds a fresh policy for one run.
+
+def make_idle_policy(seed=None):
+    return lambda state: NOOP
+
+def make_random_policy(seed=None, jump_chance=0.08):
+    rng = random.Random(seed)
+    return lambda state: JUMP if rng.random() < jump_chance else NOOP
+
+def gap_follower_jumps(bird_y, bird_velocity, next_pipe_gap, margin=10):
+    # Whether the bird is sinking below the bottom of the next gap (or mid-screen with no pipe)
+    if next_pipe_gap is None:
+        target = WINDOW_HEIGHT // 2
+    else:
+        target = next_pipe_gap + PIPE_GAP - margin
+    return bird_y + BIRD_HEIGHT > target and bird_velocity >= 0
+
+def make_gap_follower_policy(seed=None, margin=10):
+    # Flap whenever gap_follower_jumps says so
+    def policy(state):
+        if gap_follower_jumps(state.bird_y, state.bird_velocity, state.next_pipe_gap, margin):
+            return JUMP
+        return NOOP
+    return policy
+
+POLICIES = {
+    "idle": make_idle_policy,
+    "random": make_random_policy,
+    "gap_follower": make_gap_follower_policy,
+}
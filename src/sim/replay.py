@@ -0,0 +1,192 @@
+import os
+import random
+from collections import namedtuple
+import numpy as np
+from .simulation import Simulation, NOOP, JUMP
+from .batch import BatchSimulation
+from ..utils.constants import PIPE_SPAWN_TICKS
+
+# Replay file layout (all integers are unsigned LEB128 varints):
+#   b"FBR2" | seed | score | ticks | action count | actions...
+# Each action is (ticks since the previous action << 2) | action code, so a
+# jump costs one byte when jumps are less than 32 ticks apart.
+MAGIC = b"FBR2"  # Bumped whenever gameplay changes so old runs no longer re-simulate
+ACTION_BITS = 2
+ACTION_MASK = (1 << ACTION_BITS) - 1
+REPLAY_EXTENSION = ".fbr"
+
+# seed and actions describe the inputs; score and ticks are the recorded outcome
+Replay = namedtuple("Replay", ["seed", "score", "ticks", "actions"])  # actions: ((tick, action), ...)
+
+class ReplayError(ValueError):
+    pass
+
+def write_varint(out, value):
+    if value < 0:
+        raise ReplayError(f"cannot encode negative value {value}")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("truncated replay")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+def encode_replay(replay):
+    out = bytearray(MAGIC)
+    write_varint(out, replay.seed)
+    write_varint(out, replay.score)
+    write_varint(out, replay.ticks)
+    write_varint(out, len(replay.actions))
+    previous_tick = 0
+    for tick, action in replay.actions:
+        write_varint(out, ((tick - previous_tick) << ACTION_BITS) | action)
+        previous_tick = tick
+    return bytes(out)
+
+def decode_replay(data):
+    if data[:len(MAGIC)] != MAGIC:
+        raise ReplayError("not a replay file")
+    pos = len(MAGIC)
+    seed, pos = read_varint(data, pos)
+    score, pos = read_varint(data, pos)
+    ticks, pos = read_varint(data, pos)
+    count, pos = read_varint(data, pos)
+    actions = []
+    tick = 0
+    for _ in range(count):
+        value, pos = read_varint(data, pos)
+        tick += value >> ACTION_BITS
+        actions.append((tick, value & ACTION_MASK))
+    return Replay(seed, score, ticks, tuple(actions))
+
+def load_replay(path):
+    with open(path, "rb") as f:
+        return decode_replay(f.read())
+
+def save_replay(path, replay):
+    with open(path, "wb") as f:
+        f.write(encode_replay(replay))
+
+class Recorder:
+    # Collects the non-idle actions of one run, indexed by the tick they were applied on
+    def __init__(self, seed):
+        self.seed = seed
+        self.actions = []
+
+    def record(self, tick, action):
+        if action != NOOP:
+            self.actions.append((tick, action))
+
+    def truncate(self, tick):
+        # Forget the actions from tick on, after the simulation was restored to that tick
+        while self.actions and self.actions[-1][0] >= tick:
+            self.actions.pop()
+
+    def finish(self, score, ticks):
+        return Replay(self.seed, score, ticks, tuple(self.actions))
+
+def simulate(replay, sim=None):
+    # Re-run a replay headless until its game ends; returns the final Simulation
+    sim = sim if sim is not None else Simulation()
+    sim.reset(replay.seed)
+    actions = dict(replay.actions)
+    game_state = sim.game_state
+    while not game_state.is_game_over and sim.tick < replay.ticks:
+        sim.step(actions.get(sim.tick, NOOP))
+    return sim
+
+def verify(replay, sim=None):
+    sim = simulate(replay, sim)
+    return sim.game_state.is_game_over and sim.score == replay.score and sim.tick == replay.ticks
+
+def gap_sequence(seed, count):
+    # Pipe gaps Simulation draws for a seed, in spawn order
+    rng = random.Random(seed)
+    return [Simulation.draw_gap(rng) for _ in range(count)]
+
+def prepare_batch(replays):
+    # BatchSimulation playing every replay from the tick it left the menu, with its jumps per step;
+    # returns (start ticks, steps, batch, jumps). A replay without actions never starts (start None).
+    n = len(replays)
+    starts = [replay.actions[0][0] if replay.actions else None for replay in replays]
+    lengths = [replay.ticks - start if start is not None else 0 for replay, start in zip(replays, starts)]
+    steps = max(lengths)
+
+    jumps = np.zeros((n, max(steps, 1)), dtype=bool)
+    spawns = steps // PIPE_SPAWN_TICKS + 1
+    gap_table = np.zeros((n, spawns), dtype=np.int64)
+    for i, (replay, start) in enumerate(zip(replays, starts)):
+        if start is None:
+            continue
+        for tick, action in replay.actions:
+            if action == JUMP and tick - start < steps:
+                jumps[i, tick - start] = True
+        gap_table[i] = gap_sequence(replay.seed, spawns)
+
+    batch = BatchSimulation(n, gap_table=gap_table)
+    batch.alive &= np.array([start is not None for start in starts])
+    return starts, steps, batch, jumps
+
+def verify_batch(replays):
+    # Vectorized check of many replays at once; returns a list of booleans
+    if not replays:
+        return []
+    starts, steps, batch, jumps = prepare_batch(replays)
+    for t in range(steps):
+        if not batch.step(jumps[:, t]).any():
+            break
+
+    results = []
+    for i, (replay, start) in enumerate(zip(replays, starts)):
+        if start is None:
+            results.append(False)  # Runs are recorded at game over, so they always start
+        else:
+            results.append(
+                not batch.alive[i]
+                and int(batch.score[i]) == replay.score
+                and start + int(batch.frames[i]) == replay.ticks
+            )
+    return results
+
+def trajectories(replays):
+    """Bird height and tilt of every replay on every tick after it left the menu.
+
+    Returns (y, tilt, frames): y (float64, so it rounds to the same pixels as
+    the live bird) and tilt (float32, in half degree steps) are shaped
+    (ticks, replays), one row per tick so a tick's birds are contiguous, and
+    frames[i] is how many rows replay i was alive for.
+    """
+    if not replays:
+        return np.zeros((0, 0)), np.zeros((0, 0), dtype=np.float32), np.zeros(0, dtype=np.int64)
+    _, steps, batch, jumps = prepare_batch(replays)
+    y = np.empty((steps, len(replays)))
+    tilt = np.empty((steps, len(replays)), dtype=np.float32)
+    for t in range(steps):
+        alive = batch.step(jumps[:, t])
+        y[t] = batch.y
+        tilt[t] = batch.tilt
+        if not alive.any():
+            y, tilt = y[:t + 1], tilt[:t + 1]
+            break
+    return y, tilt, batch.frames.copy()
+
+def find_replays(paths):
+    # Replay files among paths, expanding directories
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(REPLAY_EXTENSION):
+                    yield os.path.join(path, name)
+        else:
+            yield path
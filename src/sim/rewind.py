@@ -0,0 +1,41 @@
+class SnapshotRing:
+    """Fixed-capacity ring buffer of the latest game snapshots, oldest first.
+
+    Pushing past capacity overwrites the oldest slot, so keeping a snapshot
+    every tick costs one list store and no allocation of its own. rewind()
+    drops the newest snapshots and hands back the one it stops at.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.slots = [None] * capacity
+        self.head = 0
+        self.count = 0
+
+    def push(self, snapshot):
+        if self.count == self.capacity:
+            self.slots[self.head] = snapshot
+            self.head = (self.head + 1) % self.capacity
+        else:
+            self.slots[(self.head + self.count) % self.capacity] = snapshot
+            self.count += 1
+
+    def latest(self):
+        return self.slots[(self.head + self.count - 1) % self.capacity] if self.count else None
+
+    def rewind(self, steps):
+        # Forget the newest `steps` snapshots, keeping at least the oldest, and return the newest left
+        if self.count == 0:
+            return None
+        for _ in range(min(steps, self.count - 1)):
+            self.count -= 1
+            self.slots[(self.head + self.count) % self.capacity] = None
+        return self.latest()
+
+    def clear(self):
+        self.slots = [None] * self.capacity
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
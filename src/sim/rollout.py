@@ -0,0 +1,32 @@
+from collections import namedtuple
+from .simulation import Simulation, NOOP, JUMP
+from .policies import POLICIES
+
+# Only simulation modules are imported here so pool workers start without pygame
+
+# One run to evaluate: either a named policy or a script of jump tick indices
+RolloutJob = namedtuple("RolloutJob", ["run_id", "seed", "policy", "script", "max_frames"])
+RolloutResult = namedtuple("RolloutResult", ["run_id", "seed", "policy", "score", "frames", "death_cause"])
+
+def run_job(job):
+    sim = Simulation(seed=job.seed)
+    sim.start()
+
+    if job.script is not None:
+        jump_ticks = set(job.script)
+        policy = None
+    else:
+        policy = POLICIES[job.policy](job.seed)
+
+    state = sim.get_state()
+    while not state.is_game_over and sim.tick < job.max_frames:
+        if policy is not None:
+            action = policy(state)
+        else:
+            action = JUMP if sim.tick in jump_ticks else NOOP
+        state = sim.step(action)
+
+    return RolloutResult(job.run_id, job.seed, job.policy, state.score, sim.tick, state.death_cause)
+
+def run_chunk(jobs):
+    return [run_job(job) for job in jobs]
@@ -0,0 +1,264 @@
+import random
+from collections import namedtuple
+from .bird import BirdPhysics
+from .pipe import PipePhysics, PipePool
+from .collision import RectCollider
+from ..game.state import GameState
+from ..utils.profiler import NULL_PROFILER
+from ..utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, PIPE_GAP, GROUND_HEIGHT, PIPE_WIDTH, BIRD_WIDTH, PIPE_SPAWN_TICKS, DEATH_DELAY_TICKS
+
+# Actions accepted by Simulation.step
+NOOP = 0
+JUMP = 1
+START = 2  # Start from the menu without flapping (the Start button)
+
+# Events reported by the last step, as tuples led by one of these tags
+EVENT_SCORE = "score"            # ("score",)
+EVENT_PIPE_HIT = "pipe_hit"      # ("pipe_hit", x, y) at the collision point
+EVENT_GROUND_HIT = "ground_hit"  # ("ground_hit", x, y) where the bird landed
+
+# Death causes
+DEATH_UPPER_PIPE = "upper_pipe"
+DEATH_LOWER_PIPE = "lower_pipe"
+DEATH_GROUND = "ground"
+
+SimState = namedtuple("SimState", [
+    "tick",
+    "bird_y",
+    "bird_velocity",
+    "bird_tilt",
+    "next_pipe_x",    # None when no pipe is ahead of the bird
+    "next_pipe_gap",
+    "score",
+    "is_game_started",
+    "is_game_over",
+    "death_cause",
+    "events",
+])
+
+class Simulation:
+    """Display-free game core stepped one frame at a time.
+
+    Holds the bird, pipes, score and game state and advances them without
+    pygame or the wall clock, so it can run headless as fast as Python allows.
+    The bird and pipe classes can be swapped for drawable subclasses, and the
+    collider for a pixel-accurate one.
+    """
+
+    def __init__(self, bird=None, pipe_class=PipePhysics, seed=None, collider=None, profiler=None):
+        self.bird = bird if bird is not None else BirdPhysics()
+        self.pipes = PipePool(pipe_class)
+        self.collider = collider if collider is not None else RectCollider()
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        self.game_state = GameState()
+        self.score = 0
+        self.tick = 0
+        self.spawn_ticks = 0
+        self.events = []
+        self.pipes_moved = False  # Whether the last step scrolled the pipes
+
+        # Death sequence
+        self.death_tick = 0
+        self.death_cause = None
+        self.collision_point = None
+        self.has_added_death_particles = False
+        self.has_added_ground_particles = False
+        self.seed_rng(seed)
+
+    def seed_rng(self, seed=None):
+        # Every run draws its pipes from its own generator so it can be reproduced from the seed
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.rng_state = None  # rng.getstate() cached until the next draw; copying it is the slow part of a snapshot
+
+    def make_rng(self, stream):
+        # Independent generator for another consumer (e.g. particles) derived from the run seed
+        return random.Random(f"{self.seed}/{stream}")
+
+    def reset(self, seed=None):
+        # Back to the main menu with a fresh bird, no pipes and a new seed
+        self.seed_rng(seed)
+        self.game_state.reset()
+        self.bird.reset_position()
+        self.pipes.clear()
+        self.score = 0
+        self.tick = 0
+        self.spawn_ticks = 0
+        self.events = []
+        self.pipes_moved = False
+        self.death_tick = 0
+        self.death_cause = None
+        self.collision_point = None
+        self.has_added_death_particles = False
+        self.has_added_ground_particles = False
+
+    def snapshot(self):
+        # Everything step() depends on as plain values, for restore() into this or another simulation
+        return (
+            self.seed,
+            self.get_rng_state(),
+            self.tick,
+            self.spawn_ticks,
+            self.score,
+            self.pipes_moved,
+            self.death_tick,
+            self.death_cause,
+            self.collision_point,
+            self.has_added_death_particles,
+            self.has_added_ground_particles,
+            self.game_state.snapshot(),
+            self.bird.snapshot(),
+            self.pipes.snapshot(),
+        )
+
+    def restore(self, snapshot):
+        (self.seed, rng_state, self.tick, self.spawn_ticks, self.score, self.pipes_moved,
+         self.death_tick, self.death_cause, self.collision_point, self.has_added_death_particles,
+         self.has_added_ground_particles, game_state, bird, pipes) = snapshot
+        if rng_state is not self.rng_state:
+            self.rng.setstate(rng_state)
+            self.rng_state = rng_state
+        self.game_state.restore(game_state)
+        self.bird.restore(bird)
+        self.pipes.restore(pipes)
+        self.events = []
+
+    def get_rng_state(self):
+        if self.rng_state is None:
+            self.rng_state = self.rng.getstate()
+        return self.rng_state
+
+    def start(self):
+        self.game_state.start_game()
+
+    def step(self, action=NOOP):
+        self.tick += 1
+        self.events = []
+        game_state = self.game_state
+
+        if action == JUMP:
+            if not game_state.is_game_started and not game_state.is_game_over:
+                game_state.start_game()
+            self.bird.jump()
+        elif action == START:
+            if not game_state.is_game_started and not game_state.is_game_over:
+                game_state.start_game()
+
+        # Pipes spawn on a fixed tick count while the game is running
+        if game_state.is_game_started and not game_state.is_game_over:
+            self.spawn_ticks += 1
+            if self.spawn_ticks >= PIPE_SPAWN_TICKS:
+                self.spawn_ticks = 0
+                self.spawn_pipe()
+
+        self.update()
+        return self.get_state()
+
+    def update(self):
+        bird = self.bird
+        game_state = self.game_state
+        profiler = self.profiler
+
+        # Update bird position if game started
+        if game_state.is_game_started:
+            bird.update()
+
+            # If the bird died from hitting the ground in the update, set game over
+            if bird.is_dead and not game_state.is_game_over:
+                game_state.end_game()
+                self.death_cause = DEATH_GROUND
+        profiler.lap("bird")
+
+        # Update pipes and check for passing only if game is not over
+        self.pipes_moved = not game_state.is_game_over
+        if self.pipes_moved:
+            pipes = self.pipes
+            for pipe in pipes.active:
+                pipe.update()
+
+                # Check if bird passed the pipe
+                if pipe.x + PIPE_WIDTH < bird.x:
+                    if not pipe.passed:
+                        pipe.passed = True
+                        self.score += 1
+                        self.events.append((EVENT_SCORE,))
+            profiler.lap("pipes")
+
+            # Check collision, skipping pipes outside the bird's horizontal reach
+            if game_state.is_game_started:
+                reach_left, reach_right = self.collider.x_range(bird)
+                for pipe in pipes.active:
+                    pipe_left = pipe.upper[0]
+                    if pipe_left < reach_right and reach_left < pipe_left + PIPE_WIDTH:
+                        self.check_collision(pipe)
+                        if game_state.is_game_over:
+                            break
+            profiler.lap("collision")
+
+            # Recycle pipes that are off screen once every pipe has moved
+            while pipes.count and pipes.oldest().x + PIPE_WIDTH < 0:
+                pipes.recycle_oldest()
+
+        # Check if bird hits the ground or is already on ground
+        if bird.is_on_ground():
+            if not self.has_added_ground_particles:
+                self.events.append((EVENT_GROUND_HIT, bird.x + BIRD_WIDTH // 2, WINDOW_HEIGHT - GROUND_HEIGHT))
+                self.has_added_ground_particles = True
+
+            if game_state.is_bird_falling:
+                game_state.bird_hit_ground()
+                self.death_tick = self.tick
+
+    def check_collision(self, pipe):
+        upper_pipe_rect, lower_pipe_rect = pipe.get_bounds()
+
+        # Check collision with upper pipe, then the lower one
+        point = self.collider.hit(self.bird, upper_pipe_rect, True)
+        if point is not None:
+            self.death_cause = DEATH_UPPER_PIPE
+        else:
+            point = self.collider.hit(self.bird, lower_pipe_rect, False)
+            if point is None:
+                return
+            self.death_cause = DEATH_LOWER_PIPE
+        self.collision_point = point
+
+        self.game_state.end_game()
+        self.bird.is_dead = True
+        if not self.has_added_death_particles:
+            self.events.append((EVENT_PIPE_HIT, self.collision_point[0], self.collision_point[1]))
+            self.has_added_death_particles = True
+
+    def spawn_pipe(self):
+        self.pipes.spawn(WINDOW_WIDTH, self.draw_gap(self.rng))
+        self.rng_state = None
+
+    @staticmethod
+    def draw_gap(rng):
+        return rng.randint(50, WINDOW_HEIGHT - PIPE_GAP - GROUND_HEIGHT - 50)
+
+    def is_death_screen_due(self):
+        # The game over screen fades in once the bird has rested on the ground long enough
+        return self.bird.is_on_ground() and self.tick - self.death_tick > DEATH_DELAY_TICKS
+
+    def get_next_pipe(self):
+        for pipe in self.pipes:
+            if not pipe.passed:
+                return pipe
+        return None
+
+    def get_state(self):
+        next_pipe = self.get_next_pipe()
+        return SimState(
+            self.tick,
+            self.bird.y,
+            self.bird.velocity,
+            self.bird.tilt,
+            next_pipe.x if next_pipe else None,
+            next_pipe.gap_height if next_pipe else None,
+            self.score,
+            self.game_state.is_game_started,
+            self.game_state.is_game_over,
+            self.death_cause,
+            self.events,
+        )
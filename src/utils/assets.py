@@ -1,25 +1,158 @@
 import pygame
+import hashlib
 import os
+import threading
+import time
+from ..components.bird import build_bird_atlas
+from ..components.pipe import build_pipe_sprites
 from .constants import BIRD_WIDTH, BIRD_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT
 
-def load_assets():
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+CACHE_DIR = os.path.join(os.path.dirname(BASE_DIR), ".asset_cache")
+
+# Image assets: name -> (file in src/assets, size to scale to, has per-pixel alpha)
+IMAGE_ASSETS = {
+    "bird": ("bird.png", (BIRD_WIDTH, BIRD_HEIGHT), True),
+    "background": ("background.png", (WINDOW_WIDTH, WINDOW_HEIGHT), False),
+}
+
+# Fonts: name -> (system font name or None for the default, size)
+FONT_ASSETS = {
+    "font": (None, 36),
+    "medium_font": (None, 48),  # Subtitles
+    "large_font": (None, 72),  # Titles
+}
+
+# Assets built from other assets: name -> builder(assets)
+DERIVED_ASSETS = {
+    "bird_atlas": lambda assets: build_bird_atlas(assets["bird"]),  # Every rotation frame, built once
+    "pipe_sprites": lambda assets: build_pipe_sprites(),  # Shaded upper and lower pipes with caps
+}
+
+class AssetManager:
+    """Loads assets by name on first use.
+
+    Scaled images are cached on disk as raw pixels, keyed by the source file's
+    hash and the target size, so later starts skip PNG decoding and scaling.
+    Images are converted to the display's pixel format when a display exists.
+    """
+
+    def __init__(self, assets_dir=ASSETS_DIR, cache_dir=CACHE_DIR):
+        self.assets_dir = assets_dir
+        self.cache_dir = cache_dir
+        self.assets = {}
+        self.load_times = {}  # name -> seconds spent loading
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __getitem__(self, name):
+        asset = self.assets.get(name)
+        if asset is None:
+            start = time.perf_counter()
+            if name in IMAGE_ASSETS:
+                asset = self.load_image(*IMAGE_ASSETS[name])
+            elif name in FONT_ASSETS:
+                asset = pygame.font.SysFont(*FONT_ASSETS[name])
+            elif name in DERIVED_ASSETS:
+                asset = DERIVED_ASSETS[name](self)
+            else:
+                raise KeyError(name)
+            self.assets[name] = asset
+            self.load_times[name] = time.perf_counter() - start
+        return asset
+
+    def __contains__(self, name):
+        return name in IMAGE_ASSETS or name in FONT_ASSETS or name in DERIVED_ASSETS
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def preload(self, names=None):
+        for name in names if names is not None else all_asset_names():
+            self[name]
+        return self
+
+    def load_image(self, filename, size, alpha):
+        path = os.path.join(self.assets_dir, filename)
+        with open(path, "rb") as f:
+            data = f.read()
+        pixel_format = "RGBA" if alpha else "RGB"
+        digest = hashlib.sha1(data).hexdigest()[:16]
+        cache_path = os.path.join(
+            self.cache_dir,
+            f"{os.path.splitext(filename)[0]}-{digest}-{size[0]}x{size[1]}.{pixel_format.lower()}"
+        )
+
+        image = self.read_cache(cache_path, size, pixel_format)
+        if image is None:
+            self.cache_misses += 1
+            image = pygame.image.load(path)
+            image = pygame.transform.scale(image, size)
+            self.write_cache(cache_path, image, pixel_format)
+        else:
+            self.cache_hits += 1
+        return self.convert(image, alpha)
+
+    def read_cache(self, cache_path, size, pixel_format):
+        try:
+            with open(cache_path, "rb") as f:
+                return pygame.image.frombytes(f.read(), size, pixel_format)
+        except (OSError, ValueError):
+            return None
+
+    def write_cache(self, cache_path, image, pixel_format):
+        # Write then rename so a crash never leaves a truncated cache file behind
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(pygame.image.tobytes(image, pixel_format))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+
+    def convert(self, image, alpha):
+        # Match the display's pixel format so blits skip per-pixel conversion
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha() if alpha else image.convert()
+
+    def total_load_time(self):
+        return sum(self.load_times.values())
+
+    def report(self):
+        details = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.load_times.items())
+        return (f"Loaded assets in {self.total_load_time() * 1000:.1f} ms "
+                f"({details}; disk cache {self.cache_hits} hits, {self.cache_misses} misses)")
+
+def all_asset_names():
+    return list(IMAGE_ASSETS) + list(FONT_ASSETS) + list(DERIVED_ASSETS)
+
+def load_assets(names=None):
     """Load and prepare all game assets"""
-    assets = {}
-    
-    # Get the absolute path to the assets directory
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    assets_dir = os.path.join(base_dir, "assets")
-    
-    # Load bird image
-    bird_path = os.path.join(assets_dir, "bird.png")
-    bird_image = pygame.image.load(bird_path)
-    bird_image = pygame.transform.scale(bird_image, (BIRD_WIDTH, BIRD_HEIGHT))
-    assets["bird"] = bird_image
-    
-    # Load background image
-    bg_path = os.path.join(assets_dir, "background.png")
-    bg_image = pygame.image.load(bg_path)
-    bg_image = pygame.transform.scale(bg_image, (WINDOW_WIDTH, WINDOW_HEIGHT))
-    assets["background"] = bg_image
-    
-    return assets 
\ No newline at end of file
+    return AssetManager().preload(names)
+
+class AssetLoader(threading.Thread):
+    # Preloads assets on a worker thread so the main thread can keep drawing a loading screen
+    def __init__(self, manager, names=None):
+        super().__init__(name="asset-loader", daemon=True)
+        self.manager = manager
+        self.names = names if names is not None else all_asset_names()
+        self.error = None
+
+    def run(self):
+        try:
+            self.manager.preload(self.names)
+        except Exception as error:  # Re-raised on the main thread by result()
+            self.error = error
+
+    def progress(self):
+        # Fraction of the assets loaded so far
+        return sum(name in self.manager.assets for name in self.names) / max(1, len(self.names))
+
+    def result(self):
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.manager
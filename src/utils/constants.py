@@ -6,10 +6,18 @@ WINDOW_HEIGHT = 740
 BIRD_WIDTH = 50
 BIRD_HEIGHT = 40
 
+# Bird rotation frames (tilt moves in 0.5 degree steps from -25 up to the 90 degree death dive)
+BIRD_MIN_TILT = -25
+BIRD_MAX_TILT = 90
+BIRD_TILT_STEP = 0.5
+BIRD_SMOOTH_ROTATION = False  # Use rotozoom for smoother (slower to build) frames
+
 # Pipe dimensions
 PIPE_WIDTH = 80
 PIPE_GAP = 150  # Gap between pipes
 PIPE_VELOCITY = 8
+PIPE_POOL_SIZE = 4  # Reusable pipe records; no more than three pipes are on screen at once
+PIPE_CAP_HEIGHT = 28  # Lighter band at the open end of each pipe, inside the hitbox
 
 # Ground dimensions
 GROUND_HEIGHT = 100
@@ -26,4 +34,40 @@ GRAVITY = 0.9
 
 # Gameplay
 FPS = 30
-PIPE_SPAWN_TIME = 1500  # milliseconds 
\ No newline at end of file
+PIPE_SPAWN_TIME = 1500  # milliseconds
+
+# Text
+TEXT_CACHE_SIZE = 128  # Rendered text surfaces kept in the LRU cache
+
+# Effects
+MAX_PARTICLES = 2000  # Hard cap on live particles; extra particles in a burst are dropped
+
+# Simulation (fixed ticks of 1/FPS seconds)
+TICK_SECONDS = 1 / FPS
+MAX_CATCH_UP_TICKS = 5  # Ticks simulated per frame at most after a hitch
+PIPE_SPAWN_TICKS = PIPE_SPAWN_TIME * FPS // 1000  # 45 ticks between pipes
+DEATH_DELAY = 1000  # milliseconds to wait after bird hits ground
+DEATH_DELAY_TICKS = DEATH_DELAY * FPS // 1000
+
+# Rendering, independent of the simulation tick; frames interpolate between ticks
+MAX_RENDER_FPS = 0  # Frame cap; 0 draws as often as the machine allows
+
+# Autopilot (search ahead on a cloned simulation)
+AUTOPILOT_HORIZON_TICKS = 3 * PIPE_SPAWN_TICKS  # Plans must survive this far ahead, three pipes' worth
+AUTOPILOT_BUDGET_SECONDS = 0.004  # Search time per tick at most, well inside one frame
+AUTOPILOT_Y_QUANTUM = 2  # Pixels of bird height treated as the same state by the memo
+AUTOPILOT_RESTART_TICKS = 2 * FPS  # Game over screen shown this long before the autopilot plays again
+
+# Ghosts (recorded runs raced alongside the live bird)
+GHOST_ALPHA = 90  # Opacity of ghost birds, 0-255
+MAX_GHOSTS = 500  # Ghosts loaded at most, best runs first
+
+# Networking (authoritative match server; clients replay its ticks)
+SERVER_PORT = 7777
+NET_MAX_BUFFERED_FRAMES = 3  # Server ticks a client holds before it catches up by stepping several at once
+NET_MAX_WRITE_BUFFER = 256 * 1024  # Bytes queued for a client before the server drops it as too slow
+NET_CORRECTION_TOLERANCE = 0.05  # Bird y/velocity/tilt difference the client leaves alone (float32/float16 rounding)
+
+# Practice mode (snapshots of recent ticks to rewind through)
+REWIND_TICKS = 2 * FPS  # How far back one press of the rewind key goes
+REWIND_HISTORY_TICKS = 10 * FPS  # Snapshots kept, one per tick; enough for five presses in a row
@@ -0,0 +1,50 @@
+import math
+
+MISSED_FRAME_FACTOR = 1.5  # A frame interval this many times the target counts as missed
+
+class FramePacing:
+    """Frame interval statistics for the render loop.
+
+    The target interval is the frame cap's, or one simulation tick when
+    uncapped, since a longer frame means a tick was never shown. Jitter is the
+    standard deviation of the intervals.
+    """
+
+    def __init__(self, target_interval):
+        self.target_interval = target_interval
+        self.last = None
+        self.intervals = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.longest = 0.0
+        self.missed = 0
+        self.dropped_ticks = 0  # Simulation ticks skipped after a hitch longer than the catch-up limit
+
+    def frame(self, now):
+        if self.last is not None:
+            interval = now - self.last
+            self.intervals += 1
+            self.total += interval
+            self.total_squares += interval * interval
+            self.longest = max(self.longest, interval)
+            if interval > self.target_interval * MISSED_FRAME_FACTOR:
+                self.missed += 1
+        self.last = now
+
+    def mean_interval(self):
+        return self.total / self.intervals if self.intervals else 0.0
+
+    def jitter(self):
+        if not self.intervals:
+            return 0.0
+        mean = self.mean_interval()
+        return math.sqrt(max(0.0, self.total_squares / self.intervals - mean * mean))
+
+    def fps(self):
+        mean = self.mean_interval()
+        return 1 / mean if mean > 0 else 0.0
+
+    def summary(self):
+        return (f"frame pacing: {self.fps():.1f} fps, {self.mean_interval() * 1000:.2f} ms "
+                f"± {self.jitter() * 1000:.2f} ms jitter, longest {self.longest * 1000:.1f} ms, "
+                f"{self.missed} missed frames, {self.dropped_ticks} dropped ticks")
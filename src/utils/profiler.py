@@ -0,0 +1,141 @@
+import csv
+import json
+import time
+from collections import deque
+
+# Frame phases in the order they run; each lap() charges the time since the previous lap to one of them
+PHASES = (
+    "events",          # handle_events
+    "particles",       # particle update
+    "autopilot",       # autopilot search
+    "bird",            # bird physics (and pipe spawning)
+    "pipes",           # pipe scrolling and scoring
+    "collision",       # broad and narrow phase
+    "update",          # the rest of update: input, recording, effects, UI state
+    "background",      # draw: background
+    "draw_pipes",      # draw: pipes
+    "draw_particles",  # draw: particles
+    "draw_ghosts",     # draw: ghost birds of recorded runs
+    "draw_bird",       # draw: bird
+    "ui",              # draw: ground, score, menus, game over
+    "overlay",         # draw: this profiler's overlay
+    "display",         # renderer bookkeeping and display.update
+    "wait",            # clock.tick frame cap
+)
+HISTORY_FRAMES = 300  # Recent frames kept for the overlay's averages and percentiles
+
+# Startup milestones, in the order they are reached
+STARTUP_MILESTONES = (
+    "first_frame",       # loading screen on screen
+    "assets_ready",      # fonts, images and the bird atlas loaded
+    "first_game_frame",  # first frame drawn by the game loop
+)
+
+class FrameProfiler:
+    """Per-frame phase timings gathered with lap() calls at phase boundaries.
+
+    While disabled every call returns at once, so the instrumentation can stay
+    in the game loop. Recent frames feed the overlay; when record is set, every
+    frame is also kept for save(). Startup milestones are always kept, timed
+    from origin (by default, when the profiler was created).
+    """
+
+    def __init__(self, enabled=False, record=False, origin=None):
+        self.enabled = enabled or record
+        self.record = record
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.startup = {}  # milestone -> seconds since origin
+        self.history = deque(maxlen=HISTORY_FRAMES)  # (frame start, frame seconds, {phase: seconds}, particles)
+        self.frames = []  # Every profiled frame when recording
+        self.current = {}
+        self.frame_start = 0.0
+        self.last = 0.0
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.current = {}
+        self.frame_start = self.last = time.perf_counter()
+
+    def lap(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        current = self.current
+        current[phase] = current.get(phase, 0.0) + now - self.last
+        self.last = now
+
+    def end_frame(self, particles=0):
+        if not self.enabled or not self.frame_start:
+            return
+        frame = (self.frame_start, self.last - self.frame_start, self.current, particles)
+        self.history.append(frame)
+        if self.record:
+            self.frames.append(frame)
+
+    def mark(self, milestone):
+        # Only the first time a milestone is reached counts
+        if milestone not in self.startup:
+            self.startup[milestone] = time.perf_counter() - self.origin
+
+    def startup_summary(self):
+        return "startup: " + ", ".join(
+            f"{milestone} {self.startup[milestone] * 1000:.0f} ms" for milestone in STARTUP_MILESTONES if milestone in self.startup
+        )
+
+    def set_active(self, active):
+        # Recording keeps the profiler on; otherwise switching off drops the history
+        self.enabled = active or self.record
+        if not self.enabled:
+            self.history.clear()
+        self.frame_start = 0.0  # The frame in progress was only partly timed
+
+    def stats(self):
+        # Averages over recent frames: fps, frame time percentiles and mean ms per phase
+        if not self.history:
+            return None
+        frame_ms = sorted(frame[1] * 1000 for frame in self.history)
+        count = len(frame_ms)
+        span = self.history[-1][0] - self.history[0][0]
+        phases = {phase: 0.0 for phase in PHASES}
+        for _, _, current, _ in self.history:
+            for phase, seconds in current.items():
+                phases[phase] = phases.get(phase, 0.0) + seconds * 1000 / count
+        return {
+            "fps": (count - 1) / span if span > 0 else 0.0,
+            "frame_ms": sum(frame_ms) / count,
+            "p50_ms": percentile(frame_ms, 50),
+            "p95_ms": percentile(frame_ms, 95),
+            "p99_ms": percentile(frame_ms, 99),
+            "phases_ms": phases,
+            "particles": self.history[-1][3],
+        }
+
+    def save(self, path):
+        # Every recorded frame as CSV, or as JSON when path ends in .json
+        origin = self.frames[0][0] if self.frames else 0.0
+        rows = []
+        for index, (start, seconds, current, particles) in enumerate(self.frames):
+            row = {"frame": index, "time_s": round(start - origin, 6), "frame_ms": round(seconds * 1000, 4)}
+            for phase in PHASES:
+                row[f"{phase}_ms"] = round(current.get(phase, 0.0) * 1000, 4)
+            row["live_particles"] = particles
+            rows.append(row)
+
+        with open(path, "w", newline="") as f:
+            if path.lower().endswith(".json"):
+                startup = {milestone: round(seconds * 1000, 3) for milestone, seconds in self.startup.items()}
+                json.dump({"phases": list(PHASES), "startup_ms": startup, "frames": rows}, f)
+            else:
+                writer = csv.DictWriter(f, fieldnames=["frame", "time_s", "frame_ms"] + [f"{phase}_ms" for phase in PHASES] + ["live_particles"])
+                writer.writeheader()
+                writer.writerows(rows)
+        return len(rows)
+
+def percentile(sorted_values, percent):
+    # Nearest-rank percentile of an already sorted list
+    index = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+# Shared by code that may run without a profiler, such as headless simulations
+NULL_PROFILER = FrameProfiler()
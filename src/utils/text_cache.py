@@ -0,0 +1,35 @@
+from collections import OrderedDict
+from .constants import TEXT_CACHE_SIZE
+
+class TextCache:
+    # Bounded LRU of rendered text surfaces keyed by font, text, antialias and color
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        # Same argument order as font.render
+        key = (font, text, antialias, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Evict the least recently used
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.surfaces)}
+
+# Shared by the UI and its buttons
+text_cache = TextCache()
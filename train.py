@@ -0,0 +1,52 @@
+import argparse
+import os
+import time
+from src.sim.neuro import Trainer, DEFAULT_HIDDEN
+
+# Neuroevolution of a small flap/no-flap network; watch the result with `python main.py --genome CHECKPOINT`
+
+DEFAULT_CHECKPOINT = os.path.join("checkpoints", "neuro.npz")
+
+def main():
+    parser = argparse.ArgumentParser(description="Evolve a neural network policy with headless batch games")
+    parser.add_argument("--generations", type=int, default=100, help="train until this many generations in total")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="file saved after every generation and resumed from")
+    parser.add_argument("--restart", action="store_true", help="start a new population even if the checkpoint exists")
+    parser.add_argument("--population", type=int, default=200)
+    parser.add_argument("--hidden", type=int, default=DEFAULT_HIDDEN, help="hidden layer size")
+    parser.add_argument("--games", type=int, default=4, help="seeds each genome plays per generation")
+    parser.add_argument("--max-frames", type=int, default=3000, help="frames a game lasts at most (100 s of play)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the population, mutations and game seeds")
+    args = parser.parse_args()
+    if args.population < 2 or args.hidden < 1 or args.games < 1 or args.max_frames < 2:
+        parser.error("--population must be at least 2, --hidden and --games at least 1, --max-frames at least 2")
+
+    if os.path.exists(args.checkpoint) and not args.restart:
+        # The checkpoint's settings win, so a resumed run is the same run
+        trainer = Trainer.load(args.checkpoint)
+        print(f"Resuming {args.checkpoint} at generation {trainer.generation} ({trainer.config()})")
+    else:
+        trainer = Trainer(args.population, args.hidden, args.games, args.max_frames, args.seed)
+
+    start = time.perf_counter()
+    trained = 0
+    try:
+        while trainer.generation < args.generations:
+            generation_start = time.perf_counter()
+            best_fitness, best_mean_score, best_score, mean_fitness = trainer.step()
+            trainer.save(args.checkpoint)
+            trained += 1
+            print(f"generation {trainer.generation}: best score {best_score}, best genome {best_mean_score:.1f} mean score "
+                  f"({best_fitness:.0f} frames), population mean {mean_fitness:.0f} frames, "
+                  f"{1 / (time.perf_counter() - generation_start):.2f} generations/s", flush=True)
+    except KeyboardInterrupt:
+        print("Interrupted; the last finished generation is saved")
+
+    elapsed = time.perf_counter() - start
+    if trained:
+        games = trained * trainer.population * trainer.games
+        print(f"{trained} generations in {elapsed:.1f}s: {trained / elapsed:.2f} generations/s, {games / elapsed:,.0f} games/s")
+    print(f"Checkpoint: {args.checkpoint} (generation {trainer.generation})")
+
+if __name__ == "__main__":
+    main()